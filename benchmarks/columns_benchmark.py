@@ -0,0 +1,42 @@
+import argparse
+import time
+
+from benchmarks.record_benchmark import records
+from getman import Struct
+from getman.models import ColumnBatch
+from getman.models.columns import numpy
+
+
+def timed(label: str, check):
+    """
+    Time one batch check and print its result.
+    """
+    start = time.perf_counter()
+    result = check()
+    print(f"{label:<24} {(time.perf_counter() - start) * 1000:8.1f} ms   {result}")
+
+
+def main():
+    """
+    Run from the repository root with `python -m benchmarks.columns_benchmark --records 100000`.
+    """
+    parser = argparse.ArgumentParser(description="Compare Struct loops and columnar checks.")
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = records(args.records)
+    structs = [Struct(**record) for record in data]
+    timed("struct all prices > 0", lambda: all(item.price.amount > 0 for item in structs[1:]))
+    timed("struct sum of ids", lambda: sum(item.id for item in structs))
+
+    for backend in ("array", "numpy") if numpy is not None else ("array",):
+        start = time.perf_counter()
+        batch = ColumnBatch.from_records(data, backend=backend)
+        print(f"{backend + ' build':<24} {(time.perf_counter() - start) * 1000:8.1f} ms")
+        amount = batch.filter(batch["id"].gt(0))["price.amount"]
+        timed(f"{backend} all prices > 0", lambda column=amount: column.gt(0).all())
+        timed(f"{backend} sum of ids", lambda column=batch["id"]: column.sum())
+
+
+if __name__ == '__main__':
+    main()
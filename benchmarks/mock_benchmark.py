@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from getman.mock import MockMan
+
+REQUEST = b"GET /items HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+BODY = [{"id": index, "name": f"item {index}"} for index in range(3)]
+
+
+async def client(port: int, requests: int, depth: int) -> None:
+    """
+    Send requests over one keep-alive connection, `depth` of them pipelined at a time.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for _ in range(0, requests, depth):
+        writer.write(REQUEST * depth)
+        for _ in range(depth):
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.split(b"Content-Length: ", 1)[1].split(b"\r\n", 1)[0])
+            await reader.readexactly(length)
+    writer.close()
+
+
+async def clients(port: int, connections: int, requests: int, depth: int) -> float:
+    """
+    Run every client concurrently and return the requests per second.
+    """
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, depth) for _ in range(connections)))
+    return connections * requests / (time.perf_counter() - start)
+
+
+def load(port: int, connections: int, requests: int, depth: int) -> float:
+    """
+    Generate the load from a separate process, so the client does not share the GIL.
+    """
+    return asyncio.run(clients(port, connections, requests, depth))
+
+
+def main():
+    """
+    Run from the repository root with `python -m benchmarks.mock_benchmark`, add
+    `--workers 4 --clients 4` on a machine with eight cores. The server CPU per request is
+    measured in this process, so it is only reported for a single worker.
+    """
+    parser = argparse.ArgumentParser(description="Measure the throughput of the mock server.")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--clients", type=int, default=1, help="Load generating processes.")
+    args = parser.parse_args()
+
+    mockman = MockMan(host="127.0.0.1", port=0, workers=args.workers)
+    mockman.add_mock("GET /items", BODY)
+    with mockman.start() as server, ProcessPoolExecutor(args.clients) as pool:
+        for depth in (1, 10):
+            answered, cpu = server.requests, time.process_time()
+            rates = [pool.submit(load, server.port, args.connections, args.requests, depth)
+                     for _ in range(args.clients)]
+            rate = sum(future.result() for future in rates)
+            cpu = (time.process_time() - cpu) / max(server.requests - answered, 1)
+            print(f"pipeline depth {depth:>2}: {rate:10.0f} requests/s, "
+                  f"{server.requests} requests answered"
+                  + (f", {cpu * 1e6:5.1f} us of server CPU per request" if args.workers == 1
+                     else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from getman import Struct
+from getman.models import record_type
+
+
+def records(count: int) -> list:
+    """
+    Build the decoded body of a list endpoint.
+    """
+    return [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "price": {"amount": index * 1.5, "currency": "EUR"},
+            "active": index % 2 == 0,
+            "owner": {"id": index % 100, "city": "Berlin"},
+        }
+        for index in range(count)
+    ]
+
+
+def measure(label: str, decode, data):
+    """
+    Measure the time taken to decode the records and to read a nested field of each, then the
+    memory taken by the decoded records in a separate, traced run.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    decoded = decode(data)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = sum(item.price.amount for item in decoded)
+    read = time.perf_counter() - start
+    del decoded
+
+    gc.collect()
+    tracemalloc.start()
+    decoded = decode(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<8} decode {built * 1000:8.1f} ms   read {read * 1000:7.1f} ms"
+          f"   memory {size / 1024 / 1024:7.1f} MiB   sum {total}")
+
+
+def main():
+    """
+    Run from the repository root with `python -m benchmarks.record_benchmark --records 100000`.
+    """
+    parser = argparse.ArgumentParser(description="Compare Struct and schema-compiled records.")
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = records(args.records)
+    item = record_type("items", data)
+    measure("struct", lambda items: [Struct(**record) for record in items], data)
+    measure("record", item.from_list, data)
+
+
+if __name__ == '__main__':
+    main()
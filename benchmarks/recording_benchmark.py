@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import requests
+
+from getman.recording import Recorder, Recording
+from getman.transport.response import build_response
+
+
+def exchange(index: int, items: int) -> requests.Response:
+    """
+    Build the response of a list endpoint, as a transport would.
+    """
+    request = requests.Request("GET", f"http://api/items?page={index}",
+                               headers={"Accept": "application/json"}).prepare()
+    body = json.dumps([{"id": item, "name": f"item {item}", "tags": ["a", "b"]}
+                       for item in range(index, index + items)]).encode()
+    return build_response(request, 200, "OK", [("Content-Type", "application/json")], body,
+                          0.01)
+
+
+def main():
+    """
+    Run from the repository root with `python -m benchmarks.recording_benchmark`.
+    """
+    parser = argparse.ArgumentParser(description="Measure recording and reading exchanges.")
+    parser.add_argument("--exchanges", type=int, default=20_000)
+    parser.add_argument("--items", type=int, default=50, help="Items per response body.")
+    args = parser.parse_args()
+
+    responses = [exchange(index, args.items) for index in range(100)]
+    raw = sum(len(response.content) for response in responses) * args.exchanges // 100
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "traffic.gmr")
+        start = time.perf_counter()
+        with Recorder(path) as recorder:
+            for index in range(args.exchanges):
+                recorder.append(responses[index % 100])
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+        print(f"append  {args.exchanges / elapsed:10,.0f} exchanges/s   "
+              f"{size / 1024 / 1024:7.1f} MiB on disk for {raw / 1024 / 1024:7.1f} MiB of bodies")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = sum(1 for _ in Recording(path))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"read    {count / elapsed:10,.0f} exchanges/s   "
+              f"peak memory {peak / 1024:7.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
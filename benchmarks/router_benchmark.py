@@ -0,0 +1,76 @@
+import argparse
+import re
+import time
+
+from getman.mock import MockMan, MockRequest
+
+
+def patterns(count: int) -> list:
+    """
+    Build the routes of a large API, a few parameterized routes per resource.
+    """
+    routes = []
+    for index in range(count // 4):
+        resource = f"/v1/resource{index}"
+        routes += [f"GET {resource}", f"GET {resource}/{{id}}", f"PUT {resource}/{{id}}",
+                   f"GET {resource}/{{id}}/orders/{{order}}"]
+    return routes
+
+
+def regex_scan(routes: list):
+    """
+    Compile the routes to regular expressions tried one after the other.
+    """
+    compiled = []
+    for route in routes:
+        method, path = route.split(" ")
+        expression = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path)
+        compiled.append((method, re.compile(expression + "$"), route))
+
+    def match(method: str, path: str):
+        for route_method, expression, route in compiled:
+            found = expression.match(path)
+            if found and route_method == method:
+                return route, found.groupdict()
+        return None
+    return match
+
+
+def measure(label: str, match, requests: list):
+    """
+    Measure the matches per second over the requests.
+    """
+    start = time.perf_counter()
+    for method, path in requests:
+        match(method, path)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {len(requests) / elapsed:12,.0f} matches/s")
+
+
+def main():
+    """
+    Run from the repository root with `python -m benchmarks.router_benchmark --routes 4000`.
+    """
+    parser = argparse.ArgumentParser(description="Compare the MockMan router to a regex scan.")
+    parser.add_argument("--routes", type=int, default=4000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    routes = patterns(args.routes)
+    resources = args.routes // 4
+    requests = [("GET", f"/v1/resource{index * 7919 % resources}/{index}/orders/{index + 1}")
+                for index in range(args.requests)]
+    mockman = MockMan(port=0, mock={route: route for route in routes})
+
+    start = time.perf_counter()
+    mockman.add_mock("GET /v1/extra/{id}", "extra")
+    mockman.remove_data("GET /v1/extra/{id}")
+    print(f"{len(routes)} routes, hot add and remove in "
+          f"{(time.perf_counter() - start) * 1e6:.0f} us")
+    measure("trie", mockman._routes.match, requests)  # pylint: disable=protected-access
+    measure("handle", lambda method, path: mockman.handle(MockRequest(method, path)), requests)
+    measure("regex scan", regex_scan(routes), requests[:max(1, args.requests // 20)])
+
+
+if __name__ == "__main__":
+    main()
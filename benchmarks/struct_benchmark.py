@@ -0,0 +1,65 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from getman import Struct
+from getman.utils.codec import get_codec
+
+
+def payload(records: int) -> bytes:
+    """
+    Build an API response with a list of records and an index of the same records by ID.
+    """
+    items = [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "price": {"amount": index * 1.5, "currency": "EUR"},
+            "tags": ["a", "b", "c"],
+            "owner": {"id": index % 100, "address": {"city": "Berlin", "zip": "10115"}},
+        }
+        for index in range(records)
+    ]
+    document = {
+        "meta": {"total": records, "page": 1},
+        "items": items,
+        "index": {str(item["id"]): item for item in items},
+    }
+    return get_codec().dumps(document)
+
+
+def measure(label: str, build, data):
+    """
+    Measure the time and memory taken to wrap the decoded data and read three fields.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    struct = build(data)
+    built = time.perf_counter() - start
+    fields = (struct.meta.total, struct.index["42"].price.amount, struct.meta.page)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<8} build {built * 1000:9.2f} ms   build + 3 reads {elapsed * 1000:9.2f} ms"
+          f"   peak {peak / 1024 / 1024:9.2f} MiB   {fields}")
+
+
+def main():
+    """
+    Run from the repository root with `python -m benchmarks.struct_benchmark --records 50000`.
+    """
+    parser = argparse.ArgumentParser(description="Compare eager and lazy Struct wrapping.")
+    parser.add_argument("--records", type=int, default=50_000)
+    args = parser.parse_args()
+
+    raw = payload(args.records)
+    print(f"payload {len(raw) / 1024 / 1024:.1f} MiB, {args.records} records")
+    codec = get_codec()
+    measure("eager", lambda data: Struct(**data), codec.loads(raw))
+    measure("lazy", Struct.lazy, codec.loads(raw))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,7 @@ from .http import HTTPClient
 from .manager import sessions
 from .manager.browser import Browser
 from .manager.dict import HeaderManager, ParamManager
-from .models.struct import Struct
+from .models.struct import LazyStruct, Struct
 
 __title__ = version.TITLE
 __description__ = version.DESCRIPTION
@@ -20,5 +20,6 @@ __all__ = [
     "ParamManager",
     "HeaderManager",
     "Struct",
+    "LazyStruct",
     "Browser",
 ]
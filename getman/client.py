@@ -1,16 +1,32 @@
 import asyncio
+import functools
 import json
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from typing import (Any, AsyncIterator, Callable, Dict, Iterable, List,
+                    Optional, Tuple, Union)
+from urllib.parse import urlsplit
 
+import requests
 from rich.console import Console
 from rich.theme import Theme
 
-from getman.constant import HttpMethod
-from getman.http import HTTPClient
+from getman.constant import HttpMethod, Transport
+from getman.http import HTTPClient, parse_method
+from getman.load import LoadReport, Workload, run_load
 from getman.manager import DictManager
+from getman.manager.flight import flight_key
 from getman.manager.queue import QueueManager
+from getman.models.columns import ColumnBatch
+from getman.models.histogram import LatencyHistogram
+from getman.models.record import Record
+from getman.models.request import CompiledRequest
+from getman.recording import Recording
+from getman.replay import ReplayReport, run_replay
 from getman.settings import Settings
+from getman.stress import ArrivalSchedule, StressReport, run_stress
+from getman.transport.stream import is_streamed
+from getman.transport.upload import prepare_body
 
 
 @dataclass
@@ -88,6 +104,8 @@ class GetMan(HTTPClient, QueueManager):
             headers: Optional[Union[Dict, DictManager]] = None,
             params: Optional[Union[Dict, DictManager]] = None,
             queue: Optional[bool] = False,
+            priority: Optional[int] = None,
+            stream: Optional[bool] = False,
             **kwargs
     ) -> HTTPClient or None:
         """
@@ -100,6 +118,9 @@ class GetMan(HTTPClient, QueueManager):
         - params: The query parameters to send with the request.
         - data: The body data to send with the request.
         - queue: If True, the request will be queued and if False will execute current request
+        - priority: Queue the request ahead of unprioritized requests, lower values first
+        - stream: If True, return once the headers arrive and leave the body unread, iterate it
+          with `getman.transport.aiter_bytes`, `aiter_ndjson` or `aiter_sse`
 
         Raises:
         - ValueError: If the method is not supported.
@@ -108,28 +129,278 @@ class GetMan(HTTPClient, QueueManager):
         - The response of the request or coroutine if queue is true.
         """
 
+        if stream:
+            kwargs["stream"] = True
+
         if queue:
             self.enqueue(
-                lambda: asyncio.create_task(
-                    self.async_request(method, routes, data, headers, params, **kwargs)
-                )
+                functools.partial(
+                    self.async_request, method, routes, data, headers, params, **kwargs
+                ),
+                priority=priority,
             )
             return
 
         return await self.async_request(method, routes, data, headers, params, **kwargs)
 
-    async def execute_queue(self) -> List[HTTPClient] or None:
+    async def execute_queue(self, max_in_flight: Optional[int] = None) -> List[HTTPClient] or None:
         """
         Execute the queued requests.
 
+        Args:
+            max_in_flight (Optional[int]): If set, run at most this many requests at once
+                instead of starting every queued request together.
+
         Returns:
-            A list of responses if the queue is not empty.
+            A list of responses in the order the requests were enqueued if the queue is not empty.
         """
-        if not self.is_queue_empty():
-            tasks = [task_creator() for task_creator in self.get_queues()]
+        if self.is_queue_empty():
+            return None
+
+        results = {}
+        if max_in_flight is None:
+            entries = self.get_queue_entries()
             self.clear_queue()
-            results = await asyncio.gather(*tasks)
-            return results
+            responses = await asyncio.gather(*(task_creator() for _, task_creator in entries))
+            results = {index: response for (index, _), response in zip(entries, responses)}
+        else:
+            async for index, result in self.stream_queue(max_in_flight):
+                results[index] = result
+        return [results[index] for index in sorted(results)]
+
+    def execute_queue_threaded(self, max_workers: Optional[int] = None) -> List[HTTPClient] or None:
+        """
+        Execute the queued requests on a thread pool, one session per worker thread.
+
+        This runs the blocking request path in parallel, so synchronous callers get concurrent
+        I/O without an event loop.
+
+        Args:
+            max_workers (Optional[int]): The number of worker threads.
+                Defaults to `settings.max_workers`.
+
+        Returns:
+            A list of responses in the order the requests were enqueued if the queue is not empty.
+        """
+        if self.is_queue_empty():
+            return None
+
+        entries = self.get_queue_entries()
+        self.clear_queue()
+        responses = self.run_in_threads(
+            (self._blocking_call(task_creator) for _, task_creator in entries),
+            max_workers or self.settings.max_workers,
+        )
+        results = dict(zip((index for index, _ in entries), responses))
+        return [results[index] for index in sorted(results)]
+
+    def request_batch(
+            self,
+            batch: Iterable[Dict[str, Any]],
+            max_workers: Optional[int] = None,
+    ) -> List[HTTPClient]:
+        """
+        Perform a batch of requests on a thread pool, one session per worker thread.
+
+        Args:
+            batch (Iterable[Dict[str, Any]]): Keyword arguments for `request`, one dict per request.
+            max_workers (Optional[int]): The number of worker threads.
+                Defaults to `settings.max_workers`.
+
+        Returns:
+            List[requests.Response]: The responses in the order of the batch.
+
+        Example:
+            responses = client.request_batch([
+                {"method": HttpMethod.GET, "routes": client.routes("users", str(user_id))}
+                for user_id in range(100)
+            ])
+        """
+        return self.run_in_threads(
+            (functools.partial(self.request, **kwargs) for kwargs in batch),
+            max_workers or self.settings.max_workers,
+        )
+
+    def load_test(
+            self,
+            method: Union[str, HttpMethod],
+            routes: Optional[str] = None,
+            total: int = 1000,
+            processes: Optional[int] = None,
+            data: Optional[Dict] = None,
+            headers: Optional[Dict] = None,
+            params: Optional[Dict] = None,
+    ) -> LoadReport:
+        """
+        Send the same request `total` times, sharded across worker processes.
+
+        Every worker builds its own client from `base_url` and `settings`, runs its own event
+        loop with the asyncio transport and at most `settings.max_in_flight` requests in
+        flight, and sends back compact per-request statistics that are merged here.
+
+        Args:
+            method: The HTTP method to use.
+            routes: The routes for the request. Defaults to the current URL.
+            total: The total number of requests to send.
+            processes: The number of worker processes. Defaults to the CPU count.
+            data: The body data to send with each request.
+            headers: The headers to send with each request.
+            params: The query parameters to send with each request.
+
+        Returns:
+            LoadReport: The merged statistics of the run.
+        """
+        workload = Workload(
+            base_url=self.base_url,
+            method=method,
+            routes=routes or self.url,
+            data=data,
+            headers=headers,
+            params=params,
+            settings=self.settings,
+        )
+        return run_load(workload, total, type(self), processes)
+
+    async def stress_test(
+            self,
+            method: Union[str, HttpMethod],
+            routes: Optional[str] = None,
+            rate: float = 10,
+            duration: float = 10,
+            warmup: float = 0,
+            ramp_to: Optional[float] = None,
+            data: Optional[Dict] = None,
+            headers: Optional[Dict] = None,
+            params: Optional[Dict] = None,
+    ) -> StressReport:
+        """
+        Run an open-loop stress test at a fixed or ramping arrival rate.
+
+        Requests are sent at their scheduled time whether or not earlier requests have
+        completed, through the asyncio transport so slow responses never delay the schedule.
+        Latencies are measured from the intended send time to correct for coordinated omission.
+
+        Args:
+            method: The HTTP method to use.
+            routes: The routes for the request. Defaults to the current URL.
+            rate: Requests per second at the start of the test.
+            duration: Seconds of the measured phase.
+            warmup: Seconds sent at `rate` before the measured phase, not reported.
+            ramp_to: If set, ramp linearly from `rate` to this many requests per second.
+            data: The body data to send with each request.
+            headers: The headers to send with each request.
+            params: The query parameters to send with each request.
+
+        Returns:
+            StressReport: The timings and outcome of every measured request.
+
+        Example:
+            report = await client.stress_test(HttpMethod.GET, rate=50, ramp_to=500, duration=60)
+            print(report.summary())
+        """
+        url = routes or self.url
+        schedule = ArrivalSchedule(rate=rate, duration=duration, warmup=warmup, ramp_to=ramp_to)
+        return await run_stress(
+            lambda: self.async_send(method, url, params=params, data=data, headers=headers,
+                                    settings=self.settings),
+            schedule,
+        )
+
+    async def replay(
+            self,
+            recording: Union[str, Recording],
+            base_url: Optional[str] = None,
+            speed: Optional[float] = 1.0,
+            max_in_flight: Optional[int] = None,
+    ) -> ReplayReport:
+        """
+        Send the requests of a recording made with `record` again.
+
+        The recording is streamed from disk, and requests are sent through the asyncio
+        transport at their recorded time, so slow responses never delay the next request.
+
+        Args:
+            recording: The recording, or the path of its file.
+            base_url: The server to replay against, the recorded server by default. Its path,
+                if any, is prepended to the recorded paths.
+            speed: How many times faster than recorded to replay, None to replay as fast as
+                possible. Defaults to the recorded timing.
+            max_in_flight: Maximum number of requests waiting for a response. Defaults to
+                `settings.max_in_flight`.
+
+        Returns:
+            ReplayReport: The statuses and latencies of the replayed requests, and how many
+                statuses differ from the recording.
+
+        Example:
+            report = await client.replay("traffic.gmr", "http://staging:8080", speed=2)
+            print(report.summary())
+        """
+        if max_in_flight is None:
+            max_in_flight = self.settings.max_in_flight
+        if not isinstance(recording, Recording):
+            recording = Recording(recording)
+        return await run_replay(
+            lambda request: self.async_send_compiled(request, settings=self.settings),
+            recording,
+            base_url,
+            speed,
+            max_in_flight,
+        )
+
+    def _blocking_call(self, task_creator: Callable) -> Callable:
+        """
+        Turn a queued coroutine factory into a blocking call for a worker thread.
+        """
+        if isinstance(task_creator, functools.partial):
+            blocking = {self.async_request: self.request, self.perform_send: self.send}
+            for func, blocking_func in blocking.items():
+                if task_creator.func == func:  # pylint: disable=comparison-with-callable
+                    return functools.partial(blocking_func, *task_creator.args,
+                                             **task_creator.keywords)
+        return lambda: asyncio.run(task_creator())
+
+    async def stream_queue(
+            self,
+            max_in_flight: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Execute the queued requests with bounded concurrency, yielding results as they complete.
+
+        Requests are taken off the queue only when a slot frees up, so at most `max_in_flight`
+        requests are open at once and each response can be released as soon as it is consumed.
+        Breaking out of the iteration cancels the requests still in flight.
+
+        Args:
+            max_in_flight (Optional[int]): Maximum number of concurrent requests.
+                Defaults to `settings.max_in_flight`.
+
+        Yields:
+            Tuple[int, Any]: The enqueue index of the request and its response.
+
+        Raises:
+            ValueError: If `max_in_flight` is below 1.
+
+        Example:
+            async for index, response in client.stream_queue(max_in_flight=50):
+                print(index, response.status_code)
+        """
+        limit = self.settings.max_in_flight if max_in_flight is None else max_in_flight
+        if limit < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+
+        pending: Dict[asyncio.Future, int] = {}
+        try:
+            while pending or not self.is_queue_empty():
+                while len(pending) < limit and not self.is_queue_empty():
+                    index, task_creator = self.dequeue_with_index()
+                    pending[asyncio.ensure_future(task_creator())] = index
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def async_request(
             self,
@@ -160,6 +431,21 @@ class GetMan(HTTPClient, QueueManager):
             Optional[object]:
                 The response from the request method, or None if the request is queued.
         """
+        if self.settings.transport == Transport.ASYNCIO:
+            send = functools.partial(
+                self.async_send,
+                method,
+                url=routes or self.url,
+                params=params,
+                data=data,
+                headers=headers,
+                settings=self.settings,
+                **kwargs,
+            )
+            key = self._flight_key(method, routes or self.url, data, headers, params, kwargs)
+            if key is not None:
+                return await self.flights.acall(key, send)
+            return await send()
         return self.request(method, routes, data, headers, params, **kwargs)
 
     def request(
@@ -170,6 +456,8 @@ class GetMan(HTTPClient, QueueManager):
             headers: Union[Dict, DictManager] = None,
             params: Union[Dict, DictManager] = None,
             queue: Optional[bool] = False,
+            priority: Optional[int] = None,
+            stream: Optional[bool] = False,
             **kwargs
     ) -> HTTPClient or None:
         """
@@ -183,21 +471,193 @@ class GetMan(HTTPClient, QueueManager):
             data: The body data to send with the request.
             settings: The settings to use for the request.
             queue: If True, the request will be queued and if False will execute current request
+            priority: Queue the request ahead of unprioritized requests, lower values first
+            stream: If True, return once the headers arrive and leave the body unread, iterate it
+            with `getman.transport.iter_bytes`, `iter_ndjson` or `iter_sse`
 
         Returns:
             requests.Response: The response object containing the result of the request.
         """
 
         routes = routes or self.url
+        if stream:
+            kwargs["stream"] = True
 
         if queue:
             self.enqueue(
-                lambda: asyncio.create_task(
-                    self.async_request(method, routes, data, headers, params, **kwargs)
-                )
+                functools.partial(
+                    self.async_request, method, routes, data, headers, params, **kwargs
+                ),
+                priority=priority,
             )
             return
 
+        key = self._flight_key(method, routes, data, headers, params, kwargs)
+        if key is not None:
+            return self.flights.call(key, functools.partial(
+                self._dispatch, method, routes, data, headers, params, **kwargs
+            ))
+        return self._dispatch(method, routes, data, headers, params, **kwargs)
+
+    def prepare(
+            self,
+            method: Union[str, HttpMethod],
+            routes: Optional[str] = None,
+            data: Union[Dict, DictManager] = None,
+            headers: Union[Dict, DictManager] = None,
+            params: Union[Dict, DictManager] = None,
+            **kwargs
+    ) -> CompiledRequest:
+        """
+        Compile a request once, to send it many times with `send` or `perform_send`.
+
+        The URL, the merged session and request headers and the encoded body are serialized
+        now, so sending the compiled request skips that work.
+
+        Args:
+            method: The HTTP method to use.
+            routes: The routes for the request. Defaults to the current URL.
+            data: The body data to send with the request.
+            headers: The headers to send with the request.
+            params: The query parameters to send with the request.
+            **kwargs: `json`, `files`, `auth` and `cookies` are supported.
+
+        Raises:
+            ValueError: If the method is not supported.
+            TypeError: If the body is streamed, such as a file or a generator.
+
+        Returns:
+            CompiledRequest: The immutable, hashable compiled request.
+
+        Example:
+            compiled = client.prepare(HttpMethod.POST, client.routes("items"), data={"a": "b"})
+            responses = [client.send(compiled) for _ in range(100)]
+        """
+        method = parse_method(method)
+
+        data, headers = prepare_body(data if method is not HttpMethod.GET else None, headers)
+        request = requests.Request(
+            "OPTIONS" if method is HttpMethod.OPTION else method.upper(),
+            routes or self.url,
+            params=params,
+            data=data,
+            headers=headers,
+            **kwargs,
+        )
+        return CompiledRequest.from_prepared(self.session.prepare_request(request))
+
+    def send(
+            self,
+            compiled: CompiledRequest,
+            headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, str]] = None,
+            body: Optional[Union[bytes, str]] = None,
+            queue: Optional[bool] = False,
+            priority: Optional[int] = None,
+            stream: Optional[bool] = False,
+            **kwargs
+    ) -> HTTPClient or None:
+        """
+        Send a compiled request, with optional per-send overrides.
+
+        Args:
+            compiled: The request compiled by `prepare`.
+            headers: Headers added to, or replacing, the compiled ones for this send.
+            params: Query parameters appended to the compiled URL for this send.
+            body: A serialized body replacing the compiled one for this send.
+            queue: If True, the request will be queued and if False will execute current request
+            priority: Queue the request ahead of unprioritized requests, lower values first
+            stream: If True, return once the headers arrive and leave the body unread
+
+        Returns:
+            requests.Response: The response object containing the result of the request.
+        """
+        if headers or params or body is not None:
+            compiled = compiled.override(headers, params, body)
+        if stream:
+            kwargs["stream"] = True
+
+        if queue:
+            self.enqueue(functools.partial(self.perform_send, compiled, **kwargs),
+                         priority=priority)
+            return
+
+        send = functools.partial(self.send_compiled, compiled, settings=self.settings, **kwargs)
+        key = self._flight_key(compiled.method, compiled.url, compiled.body, compiled.headers,
+                               None, kwargs)
+        if key is not None:
+            return self.flights.call(key, send)
+        return send()
+
+    async def perform_send(
+            self,
+            compiled: CompiledRequest,
+            headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, str]] = None,
+            body: Optional[Union[bytes, str]] = None,
+            queue: Optional[bool] = False,
+            priority: Optional[int] = None,
+            stream: Optional[bool] = False,
+            **kwargs
+    ) -> HTTPClient or None:
+        """
+        Send a compiled request asynchronously, with optional per-send overrides.
+
+        With `Transport.ASYNCIO` the request goes through the asyncio transport, otherwise
+        it is sent as `send` does.
+
+        Args:
+            compiled: The request compiled by `prepare`.
+            headers: Headers added to, or replacing, the compiled ones for this send.
+            params: Query parameters appended to the compiled URL for this send.
+            body: A serialized body replacing the compiled one for this send.
+            queue: If True, the request will be queued and if False will execute current request
+            priority: Queue the request ahead of unprioritized requests, lower values first
+            stream: If True, return once the headers arrive and leave the body unread
+
+        Returns:
+            The response of the request or None if queue is true.
+        """
+        if headers or params or body is not None:
+            compiled = compiled.override(headers, params, body)
+        if stream:
+            kwargs["stream"] = True
+
+        if queue:
+            self.enqueue(functools.partial(self.perform_send, compiled, **kwargs),
+                         priority=priority)
+            return
+
+        if self.settings.transport != Transport.ASYNCIO:
+            return self.send(compiled, **kwargs)
+        send = functools.partial(self.async_send_compiled, compiled, settings=self.settings,
+                                 **kwargs)
+        key = self._flight_key(compiled.method, compiled.url, compiled.body, compiled.headers,
+                               None, kwargs)
+        if key is not None:
+            return await self.flights.acall(key, send)
+        return await send()
+
+    def _flight_key(self, method, routes, data, headers, params, kwargs):
+        """
+        Returns the single-flight key of a request, None when it must not be coalesced.
+        """
+        if not self.settings.single_flight:
+            return None
+        return flight_key(method, routes, params, headers, data, kwargs)
+
+    def _dispatch(
+            self,
+            method: Union[str, HttpMethod],
+            routes: str,
+            data: Union[Dict, DictManager] = None,
+            headers: Union[Dict, DictManager] = None,
+            params: Union[Dict, DictManager] = None,
+            **kwargs
+    ):
+        """
+        Sends a request with the method matching `method`.
+        """
         if isinstance(method, HttpMethod):
             method = method.value
 
@@ -259,6 +719,65 @@ class GetMan(HTTPClient, QueueManager):
                 )
 
 
+    def to_records(
+            self,
+            response,
+            route: Optional[str] = None,
+            schema: Any = None,
+    ) -> Union[Record, List[Record]]:
+        """
+        Decode a JSON response into slot-based records, whose type is generated once per route.
+
+        The first response of a route, or `schema`, defines the record type, later responses
+        of the route reuse it. Records use less memory and are faster to read than `Struct`.
+
+        Args:
+            response: The response to decode.
+            route: The key the record type is cached under, a template such as "users/{id}"
+                shares one type between URLs. Defaults to the path of the response URL.
+            schema: A sample or schema of a record, see `getman.models.record_type`.
+
+        Returns:
+            Union[Record, List[Record]]: A record, or a list of records for a JSON array.
+
+        Example:
+            users = client.to_records(client.request(HttpMethod.GET, client.routes("users")))
+            print(users[0].name)
+        """
+        route = route or urlsplit(response.url).path
+        return self.record_types.decode(route, response.json(), schema)
+
+    def to_columns(
+            self,
+            response,
+            path: Optional[str] = None,
+            fields: Optional[Iterable[str]] = None,
+            backend: str = "auto",
+    ) -> ColumnBatch:
+        """
+        Decode a JSON array of objects into columns, to check or aggregate fields across every
+        record at once.
+
+        Args:
+            response: The response to decode.
+            path: The dotted path of the array in the document, for example "data.items".
+                Defaults to the document itself.
+            fields: The dotted names of the columns to build. Defaults to every field.
+            backend: "array", "numpy" or "auto" for NumPy when it is installed.
+
+        Returns:
+            ColumnBatch: One column per field, nested fields named with dots.
+
+        Example:
+            batch = client.to_columns(response, path="items")
+            assert batch["price.amount"].gt(0).all()
+            print(batch["quantity"].sum())
+        """
+        records = response.json()
+        for key in path.split(".") if path else ():
+            records = records[key]
+        return ColumnBatch.from_records(records, fields, backend)
+
     def get_report(
             self,
             data,
@@ -266,17 +785,29 @@ class GetMan(HTTPClient, QueueManager):
             show_request_header: Optional[bool] = False,
             show_response_header: Optional[bool] = False,
             show_settings: Optional[bool] = False,
+            show_latency: Optional[bool] = False,
+            show_connections: Optional[bool] = False,
+            show_cache: Optional[bool] = False,
     ) -> str:
         """
         Generates a report based on provided data and optional flags.
 
-        :param data: Input data
+        A list of responses, such as the result of `execute_queue`, produces a batch report
+        with the status code counts and latency percentiles of the whole batch.
+
+        :param data: Input data, a response or a list of responses
         :param show_cookies: Flag to determine if cookies should be included in the report
         :param show_request_header: Flag to determine
         if request headers should be included in the report
         :param show_response_header: Flag to determine
         if response headers should be included in the report
         :param show_settings: Flag to determine if settings should be included in the report
+        :param show_latency: Flag to determine if the latency percentiles of every request
+        made by this client should be included in the report
+        :param show_connections: Flag to determine if the new and reused connection counts
+        per host should be included in the report
+        :param show_cache: Flag to determine if the response cache hit, miss and revalidation
+        counts should be included in the report
         :return: A formatted report string
         """
 
@@ -284,14 +815,8 @@ class GetMan(HTTPClient, QueueManager):
             raise ValueError("No data provided to generate a report.")
 
         if isinstance(data, list):
-            for item in data:
-                return self.get_report(
-                    item,
-                    show_cookies,
-                    show_request_header,
-                    show_response_header,
-                    show_settings,
-                )
+            return self._batch_report(data, show_settings, show_latency, show_connections,
+                                      show_cache)
 
         sections = [
             f"URL: {data.url}",
@@ -303,14 +828,67 @@ class GetMan(HTTPClient, QueueManager):
             f"Settings: {self.settings}" if show_settings else ""
         ]
 
-        try:
-            json_response = json.dumps(data.json(), indent=2)
-            sections.append(f"JSON Response: {json_response}")
-        except json.JSONDecodeError:
-            sections.append(f"Response Text: {data.text}")
+        if is_streamed(data):
+            sections.append("Response Body: streamed, not read by the report")
+        else:
+            try:
+                json_response = self.json_codec.dumps_str(data.json(), indent=2)
+                sections.append(f"JSON Response: {json_response}")
+            except json.JSONDecodeError:
+                sections.append(f"Response Text: {data.text}")
 
         sections.append(f"Elapsed Time (seconds): {data.elapsed.total_seconds()}")
+        if show_latency:
+            sections.append(f"Client Latency (seconds): {self.histogram.summary()}")
+        if show_connections:
+            sections.append(f"Connections: {self._connection_summary()}")
+        if show_cache:
+            sections.append(f"Cache: {self._cache_summary()}")
         report = "\n".join(filter(bool, sections))
         self.console.print(report, style="info")
 
         return report
+
+    def _batch_report(self, data: List, show_settings: bool, show_latency: bool,
+                      show_connections: bool, show_cache: bool = False) -> str:
+        """
+        Generates a report aggregating a list of responses.
+        """
+        responses = [item for item in data if item is not None]
+        histogram = LatencyHistogram()
+        histogram.record_many(response.elapsed.total_seconds() for response in responses)
+        failed = len(data) - len(responses)
+
+        sections = [
+            f"Requests: {len(data)}",
+            f"Failed Requests: {failed}" if failed else "",
+            f"Status Codes: {dict(Counter(response.status_code for response in responses))}",
+            f"Latency (seconds): {histogram.summary()}",
+            f"Client Latency (seconds): {self.histogram.summary()}" if show_latency else "",
+            f"Connections: {self._connection_summary()}" if show_connections else "",
+            f"Cache: {self._cache_summary()}" if show_cache else "",
+            f"Settings: {self.settings}" if show_settings else "",
+        ]
+        report = "\n".join(filter(bool, sections))
+        self.console.print(report, style="info")
+
+        return report
+
+    def _connection_summary(self) -> str:
+        """
+        Formats the new and reused connection counts per host.
+        """
+        return ", ".join(
+            f"{host} new={counts['new']} reused={counts['reused']}"
+            for host, counts in self.connection_stats().items()
+        ) or "none"
+
+    def _cache_summary(self) -> str:
+        """
+        Formats the response cache counters.
+        """
+        stats = self.cache_stats()
+        return " ".join(
+            f"{name}={stats[name]}"
+            for name in ("hits", "misses", "revalidations", "stores", "evictions")
+        ) if self.cache is not None else "disabled"
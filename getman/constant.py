@@ -15,6 +15,23 @@ class HttpMethod(StrEnum):
     OPTION = auto()
 
 
+class Transport(StrEnum):
+    """
+    Transports used to send requests
+    """
+    REQUESTS = auto()
+    ASYNCIO = auto()
+
+
+class CircuitState(StrEnum):
+    """
+    States of a circuit breaker
+    """
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
 class PlatformOS(StrEnum):
     """
     Platform operating systems
@@ -1,10 +1,49 @@
-from typing import Dict, Optional
+import operator
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import requests
 
-from getman.manager.sessions import SessionManager
+from getman.constant import HttpMethod
+from getman.manager.cache import ResponseCache
+from getman.manager.circuit import CircuitManager, RetryBudget
+from getman.manager.flight import SingleFlight
+from getman.manager.sessions import (ConnectionStats, SessionManager,
+                                     merge_stats)
+from getman.models.histogram import LatencyHistogram
+from getman.models.record import RecordRegistry
+from getman.models.request import CompiledRequest
+from getman.recording import COMPRESS_THRESHOLD, Recorder
 from getman.settings import Settings
-from getman.utils.decorators import retry_request
+from getman.transport import AsyncTransport
+from getman.transport.upload import (Body, blocking_body, is_async_iterable,
+                                     prepare_body)
+from getman.utils.decorators import (cache_response, guard_circuit,
+                                     record_latency, retry_request)
+
+
+def parse_method(method: Union[str, HttpMethod]) -> HttpMethod:
+    """
+    Convert a method name to an `HttpMethod`.
+
+    Args:
+        method (Union[str, HttpMethod]): The method, such as "get" or `HttpMethod.GET`.
+
+    Raises:
+        ValueError: If the method is not supported.
+
+    Returns:
+        HttpMethod: The method.
+    """
+    try:
+        return HttpMethod(method)
+    except ValueError as exc:
+        raise ValueError(
+            "Method not allowed, only get, post, delete, put, patch, and options"
+        ) from exc
 
 
 class HTTPClient(SessionManager):
@@ -12,11 +51,336 @@ class HTTPClient(SessionManager):
     A client class for performing HTTP requests with retry functionality.
 
     Inherits from SessionManager to manage HTTP sessions and adds methods for GET, POST, PUT,
-    DELETE, PATCH, and OPTIONS requests. Each method supports retries using the `retry_request`
-    decorator.
+    DELETE, PATCH, and OPTIONS requests. Each method supports retries with exponential backoff
+    using the `retry_request` decorator.
+
+    Requests can also be sent through a non-blocking `AsyncTransport` with `async_send`,
+    which shares the session headers and cookies but never blocks the event loop.
+
+    The latency of every response is recorded in `histogram`, whatever the transport, and
+    every exchange is appended to a recording while `record` is active.
+
+    With `Settings.circuit_breaker`, requests to a failing host fail fast with
+    `CircuitOpenError` before reaching the socket, and `Settings.retry_budget` caps the share
+    of requests that are retried.
+
+    With `Settings.cache`, GET responses are kept in a `ResponseCache` and served from it
+    while they are fresh, following their `Cache-Control` and `Expires` headers.
+
+    POST, PUT and PATCH bodies may be a `Path` or `FileBody`, sent from a memory map without
+    being read into memory, a `MultipartBody`, or a generator sent with chunked
+    transfer-encoding. Async iterables are only accepted by `async_send`.
     """
+    _transport: Optional[AsyncTransport] = None
+    _histogram: Optional[LatencyHistogram] = None
+    _circuits: Optional[CircuitManager] = None
+    _retry_budget: Optional[RetryBudget] = None
+    _cache: Optional[ResponseCache] = None
+    _flights: Optional[SingleFlight] = None
+    _record_types: Optional[RecordRegistry] = None
+    _recorder: Optional[Recorder] = None
+
+    @property
+    def histogram(self) -> LatencyHistogram:
+        """
+        The latency histogram of every response received by this client, created on first use.
+        """
+        if self._histogram is None:
+            self._histogram = LatencyHistogram()
+        return self._histogram
+
+    @property
+    def transport(self) -> AsyncTransport:
+        """
+        The asyncio transport owned by this client, created on first use.
+        """
+        if self._transport is None:
+            settings = self.pool_settings
+            self._transport = AsyncTransport(
+                max_connections=settings.pool_maxsize,
+                keep_alive=settings.keep_alive,
+                block=settings.pool_block,
+            )
+        return self._transport
+
+    @property
+    def circuits(self) -> Optional[CircuitManager]:
+        """
+        The per-host circuit breakers of this client, None unless `Settings.circuit_breaker`.
+        """
+        if self._circuits is None and self.pool_settings.circuit_breaker:
+            self._circuits = CircuitManager(self.pool_settings)
+        return self._circuits
+
+    @property
+    def retry_budget(self) -> Optional[RetryBudget]:
+        """
+        The retry budget shared by every request of this client, None unless
+        `Settings.retry_budget` is set.
+        """
+        settings = self.pool_settings
+        if self._retry_budget is None and settings.retry_budget is not None:
+            self._retry_budget = RetryBudget(settings.retry_budget, settings.retry_budget_reserve)
+        return self._retry_budget
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """
+        The response cache of this client, None unless `Settings.cache` is enabled.
+        """
+        settings = self.pool_settings
+        if self._cache is None and settings.cache:
+            self._cache = ResponseCache(settings.cache_max_bytes, settings.cache_dir)
+        return self._cache
+
+    @property
+    def flights(self) -> SingleFlight:
+        """
+        The single-flight group coalescing identical in-flight requests, created on first use.
+        """
+        if self._flights is None:
+            self._flights = SingleFlight()
+        return self._flights
+
+    @property
+    def record_types(self) -> RecordRegistry:
+        """
+        The record types generated per route by `GetMan.to_records`, created on first use.
+        """
+        if self._record_types is None:
+            self._record_types = RecordRegistry()
+        return self._record_types
+
+    @property
+    def recorder(self) -> Optional[Recorder]:
+        """
+        The recorder appending every exchange to a recording, None unless recording.
+        """
+        if self._recorder is not None and self._recorder.closed:
+            self._recorder = None
+        return self._recorder
+
+    def record(self, path: Union[str, os.PathLike],
+               compress_threshold: int = COMPRESS_THRESHOLD) -> Recorder:
+        """
+        Append every request and response of this client to a recording, until the returned
+        recorder is closed. A recording already in progress is closed first.
+
+        Args:
+            path (Union[str, os.PathLike]): The recording file, continued if it exists.
+            compress_threshold (int): The size from which bodies are compressed.
+
+        Returns:
+            Recorder: The recorder, close it or use it as a context manager to stop recording.
+
+        Example:
+            with client.record("traffic.gmr"):
+                client.request(HttpMethod.GET, client.routes("users"))
+        """
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder = Recorder(path, compress_threshold)
+        return self._recorder
+
+    def cache_stats(self) -> Counter:
+        """
+        Count the cache hits, misses, revalidations, stores and evictions of this client.
+
+        Returns:
+            Counter: The counters, empty when the cache is disabled.
+        """
+        return Counter(self._cache.stats) if self._cache is not None else Counter()
+
+    def connection_stats(self) -> ConnectionStats:
+        """
+        Count the new and reused connections per host across every transport of this client.
+
+        Returns:
+            ConnectionStats: Counters with `new` and `reused` keys, keyed by `scheme://host:port`.
+        """
+        sources = [self.session_stats()]
+        if self._transport is not None:
+            sources.append(self._transport.stats)
+        return merge_stats(*sources)
+
+    @cache_response
+    @retry_request()
+    @guard_circuit
+    @record_latency
+    async def async_send(
+        self,
+        method: Union[str, HttpMethod],
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[Body] = None,
+        headers: Optional[Dict[str, str]] = None,
+        settings: Optional[Settings] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Perform an HTTP request through the non-blocking asyncio transport.
 
+        Args:
+            method (Union[str, HttpMethod]): The HTTP method to use.
+            url (str): The URL to send the request to.
+            params (Optional[Dict[str, str]], optional):
+                Optional dictionary of query parameters to include in the request. Defaults to None.
+            data (Optional[Body], optional):
+                Dictionary containing the data to be sent as the body of the request, or a
+                file, multipart form, iterable or async iterable streamed as the body.
+            headers (Optional[Dict[str, str]], optional):
+                Optional dictionary of HTTP headers to include in the request. Defaults to None.
+            settings (Optional[Settings], optional):
+                Settings object that includes timeout and other configurations. Defaults to None.
+            **kwargs: `json`, `files`, `auth`, `cookies`, `hooks`, `timeout`, `verify`,
+                `allow_redirects` and `stream` are supported. With `stream=True` the body is
+                left unread in `response.raw`, read it with `getman.transport.aiter_bytes`.
+
+        Raises:
+            ValueError: If the method is not supported.
+
+        Returns:
+            requests.Response: The response object containing the result of the request.
+        """
+        method = parse_method(method)
+
+        timeout = kwargs.pop("timeout", settings.timeout if settings else None)
+        verify = kwargs.pop("verify", self.session.verify)
+        allow_redirects = kwargs.pop("allow_redirects", True)
+        stream = kwargs.pop("stream", False)
+        data, headers = prepare_body(data if method is not HttpMethod.GET else None, headers)
+        request = requests.Request(
+            "OPTIONS" if method is HttpMethod.OPTION else method.upper(),
+            url,
+            params=params,
+            data=None if is_async_iterable(data) else data,
+            headers=headers,
+            **kwargs,
+        )
+        prepared = self.session.prepare_request(request)
+        if is_async_iterable(data):
+            # requests cannot prepare async iterables, their length is never known upfront.
+            prepared.body = data
+            prepared.headers.pop("Content-Length", None)
+            prepared.headers["Transfer-Encoding"] = "chunked"
+        response = await self.transport.send(
+            prepared,
+            timeout=timeout,
+            verify=verify,
+            allow_redirects=allow_redirects,
+            stream=stream,
+        )
+        self.session.cookies.update(response.cookies)
+        return self.json_codec.bind(response)
+
+    @retry_request()
+    @guard_circuit
+    @record_latency
+    def send_compiled(
+        self,
+        request: CompiledRequest,
+        settings: Optional[Settings] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a compiled request through the session, without preparing it again.
+
+        Args:
+            request (CompiledRequest): The request to send.
+            settings (Optional[Settings], optional):
+                Settings object that includes timeout and other configurations. Defaults to None.
+            **kwargs: `timeout`, `verify`, `allow_redirects` and `stream` are supported.
+
+        Returns:
+            requests.Response: The response object containing the result of the request.
+        """
+        kwargs.setdefault("timeout", settings.timeout if settings else None)
+        return self.json_codec.bind(self.session.send(request.to_prepared(), **kwargs))
+
+    @retry_request()
+    @guard_circuit
+    @record_latency
+    async def async_send_compiled(
+        self,
+        request: CompiledRequest,
+        settings: Optional[Settings] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a compiled request through the non-blocking asyncio transport.
+
+        Args:
+            request (CompiledRequest): The request to send.
+            settings (Optional[Settings], optional):
+                Settings object that includes timeout and other configurations. Defaults to None.
+            **kwargs: `timeout`, `verify`, `allow_redirects` and `stream` are supported.
+
+        Returns:
+            requests.Response: The response object containing the result of the request.
+        """
+        response = await self.transport.send(
+            request.to_prepared(),
+            timeout=kwargs.pop("timeout", settings.timeout if settings else None),
+            verify=kwargs.pop("verify", self.session.verify),
+            allow_redirects=kwargs.pop("allow_redirects", True),
+            stream=kwargs.pop("stream", False),
+        )
+        self.session.cookies.update(response.cookies)
+        return self.json_codec.bind(response)
+
+    def run_in_threads(
+        self,
+        calls: Iterable[Callable[[], Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run blocking request calls on a thread pool where each worker owns its session.
+
+        Every worker thread gets a clone of the session with its own connection pool, so
+        the calls run in parallel without sharing a `requests.Session` across threads.
+        Cookies collected by the workers are merged back into the session afterwards.
+
+        Args:
+            calls (Iterable[Callable[[], Any]]): Zero-argument callables performing requests.
+            max_workers (Optional[int]): The number of worker threads. Defaults to None,
+                which uses the `ThreadPoolExecutor` default.
+
+        Returns:
+            List[Any]: The results of the calls, in submission order.
+        """
+        if self._histogram is None:
+            self._histogram = LatencyHistogram()
+        if self.thread_local is None:
+            self.thread_local = threading.local()
+        local = self.thread_local
+        sessions = []
+        lock = threading.Lock()
+
+        def bind_session():
+            session = self.clone_session()
+            local.session = session
+            with lock:
+                sessions.append(session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, initializer=bind_session) as executor:
+                return list(executor.map(operator.call, calls))
+        finally:
+            for session in sessions:
+                self.retire_session(session)
+
+    async def aclose(self) -> None:
+        """
+        Close the session and the idle connections held by the asyncio transport.
+        """
+        self.close_session()
+        if self._transport is not None:
+            await self._transport.close()
+
+    @cache_response
     @retry_request()
+    @guard_circuit
+    @record_latency
     def get(
         self,
         url: str,
@@ -45,11 +409,13 @@ class HTTPClient(SessionManager):
                                 **kwargs)
 
     @retry_request()
+    @guard_circuit
+    @record_latency
     def post(
         self,
         url: str,
         params: Optional[Dict[str, str]] = None,
-        data: Optional[Dict[str, str]] = None,
+        data: Optional[Body] = None,
         headers: Optional[Dict[str, str]] = None,
         settings: Optional[Settings] = None,
         **kwargs,
@@ -61,8 +427,9 @@ class HTTPClient(SessionManager):
             url (str): The URL to send the POST request to.
             params (Optional[Dict[str, str]], optional):
                 Optional dictionary of query parameters to include in the request. Defaults to None.
-            data (Optional[Dict[str, str]], optional):
-                Dictionary containing the data to be sent as the body of the request.
+            data (Optional[Body], optional):
+                Dictionary containing the data to be sent as the body of the request, or a
+                file, multipart form or iterable streamed as the body.
             headers (Optional[Dict[str, str]], optional):
                 Optional dictionary of HTTP headers to include in the request. Defaults to None.
             settings (Optional[Settings], optional):
@@ -72,15 +439,18 @@ class HTTPClient(SessionManager):
             requests.Response: The response object containing the result of the POST request.
         """
         timeout = settings.timeout if settings else None
+        data, headers = blocking_body(data, headers)
         return self.session.post(url, params=params, data=data, headers=headers, timeout=timeout,
                                  **kwargs)
 
     @retry_request()
+    @guard_circuit
+    @record_latency
     def put(
         self,
         url: str,
         params: Optional[Dict[str, str]] = None,
-        data: Optional[Dict[str, str]] = None,
+        data: Optional[Body] = None,
         headers: Optional[Dict[str, str]] = None,
         settings: Optional[Settings] = None,
         **kwargs,
@@ -92,8 +462,9 @@ class HTTPClient(SessionManager):
             url (str): The URL to send the PUT request to.
             params (Optional[Dict[str, str]], optional):
                 Optional dictionary of query parameters to include in the request. Defaults to None.
-            data (Optional[Dict[str, str]], optional):
-                Dictionary containing the data to be sent as the body of the request.
+            data (Optional[Body], optional):
+                Dictionary containing the data to be sent as the body of the request, or a
+                file, multipart form or iterable streamed as the body.
             headers (Optional[Dict[str, str]], optional):
                 Optional dictionary of HTTP headers to include in the request. Defaults to None.
             settings (Optional[Settings], optional):
@@ -103,10 +474,13 @@ class HTTPClient(SessionManager):
             requests.Response: The response object containing the result of the PUT request.
         """
         timeout = settings.timeout if settings else None
+        data, headers = blocking_body(data, headers)
         return self.session.put(url, params=params, data=data, headers=headers, timeout=timeout,
                                 **kwargs)
 
     @retry_request()
+    @guard_circuit
+    @record_latency
     def delete(
         self,
         url: str,
@@ -138,11 +512,13 @@ class HTTPClient(SessionManager):
                                    **kwargs)
 
     @retry_request()
+    @guard_circuit
+    @record_latency
     def patch(
         self,
         url: str,
         params: Optional[Dict[str, str]] = None,
-        data: Optional[Dict[str, str]] = None,
+        data: Optional[Body] = None,
         headers: Optional[Dict[str, str]] = None,
         settings: Optional[Settings] = None,
         **kwargs,
@@ -154,8 +530,9 @@ class HTTPClient(SessionManager):
             url (str): The URL to send the PATCH request to.
             params (Optional[Dict[str, str]], optional):
                 Optional dictionary of query parameters to include in the request. Defaults to None.
-            data (Optional[Dict[str, str]], optional):
-                Dictionary containing the data to be sent as the body of the request.
+            data (Optional[Body], optional):
+                Dictionary containing the data to be sent as the body of the request, or a
+                file, multipart form or iterable streamed as the body.
             headers (Optional[Dict[str, str]], optional):
                 Optional dictionary of HTTP headers to include in the request. Defaults to None.
             settings (Optional[Settings], optional):
@@ -165,10 +542,13 @@ class HTTPClient(SessionManager):
             requests.Response: The response object containing the result of the PATCH request.
         """
         timeout = settings.timeout if settings else None
+        data, headers = blocking_body(data, headers)
         return self.session.patch(url, params=params, data=data, headers=headers, timeout=timeout,
                                   **kwargs)
 
     @retry_request()
+    @guard_circuit
+    @record_latency
     def options(
         self,
         url: str,
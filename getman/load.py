@@ -0,0 +1,227 @@
+import asyncio
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from getman.constant import HttpMethod, Transport
+from getman.models.histogram import LatencyHistogram
+from getman.settings import Settings
+
+# Builds a client from `base_url` and `settings` keywords, such as the `GetMan` class.
+ClientFactory = Callable[..., Any]
+
+
+@dataclass(frozen=True)
+class Workload:
+    """
+    A picklable description of the requests a load run sends.
+
+    Attributes:
+        base_url (str): The base URL of the client created in each worker.
+        method (Union[str, HttpMethod]): The HTTP method to use.
+        routes (Optional[str]): The URL to send the requests to. Defaults to the base URL.
+        data (Optional[Dict]): The body data to send with each request.
+        headers (Optional[Dict]): The headers to send with each request.
+        params (Optional[Dict]): The query parameters to send with each request.
+        settings (Settings): The settings of the client created in each worker.
+    """
+    base_url: str
+    method: Union[str, HttpMethod] = HttpMethod.GET.value
+    routes: Optional[str] = None
+    data: Optional[Dict] = None
+    headers: Optional[Dict] = None
+    params: Optional[Dict] = None
+    settings: Settings = field(default_factory=Settings)
+
+
+@dataclass
+class LoadStats:
+    """
+    Compact per-request statistics collected by a worker.
+
+    Statuses are counted and latencies are recorded in a fixed-size histogram, so the
+    statistics a worker sends back to the parent process have the same size whether the
+    shard sent a thousand requests or a hundred million.
+
+    Attributes:
+        statuses (Counter): The number of requests per status code, 0 when no response
+            was received.
+        latencies (LatencyHistogram): The latency of every request.
+        started (float): The wall-clock time the first request started.
+        finished (float): The wall-clock time the last request finished.
+    """
+    statuses: Counter = field(default_factory=Counter)
+    latencies: LatencyHistogram = field(default_factory=LatencyHistogram)
+    started: float = 0.0
+    finished: float = 0.0
+
+    def record(self, status: int, latency: float) -> None:
+        """
+        Record the outcome of a single request.
+        """
+        self.statuses[status] += 1
+        self.latencies.record(latency)
+
+    def merge(self, other: "LoadStats") -> None:
+        """
+        Merge the statistics collected by another worker into these.
+        """
+        self.statuses.update(other.statuses)
+        self.latencies.merge(other.latencies)
+        self.started = min(self.started, other.started) if self.started else other.started
+        self.finished = max(self.finished, other.finished)
+
+
+@dataclass
+class LoadReport:
+    """
+    The merged result of a load run.
+
+    Attributes:
+        stats (LoadStats): The merged per-request statistics.
+        processes (int): The number of worker processes used.
+    """
+    stats: LoadStats
+    processes: int
+
+    @property
+    def total(self) -> int:
+        """The number of requests sent."""
+        return self.stats.statuses.total()
+
+    @property
+    def errors(self) -> int:
+        """The number of requests without a response or with a 5xx status."""
+        return sum(count for status, count in self.stats.statuses.items()
+                   if status == 0 or status >= 500)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds between the first request starting and the last one finishing."""
+        return max(self.stats.finished - self.stats.started, 0.0)
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second over the whole run."""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def status_counts(self) -> Dict[int, int]:
+        """The number of requests per status code, 0 for failed requests."""
+        return dict(self.stats.statuses)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile in seconds.
+
+        Args:
+            percent (float): The percentile between 0 and 100.
+
+        Returns:
+            float: The latency below which `percent` of the requests completed.
+        """
+        return self.stats.latencies.percentile(percent)
+
+    def summary(self) -> str:
+        """
+        Format the report as text.
+        """
+        return "\n".join([
+            f"Requests: {self.total} ({self.processes} processes)",
+            f"Errors: {self.errors}",
+            f"Status Codes: {self.status_counts}",
+            f"Elapsed Time (seconds): {self.elapsed:.3f}",
+            f"Throughput (req/s): {self.throughput:.1f}",
+            f"Latency (seconds): {self.stats.latencies.summary()}",
+        ])
+
+
+def split_total(total: int, shards: int) -> List[int]:
+    """
+    Split a number of requests as evenly as possible between shards.
+    """
+    size, remainder = divmod(total, shards)
+    return [size + (1 if shard < remainder else 0) for shard in range(shards)]
+
+
+def run_shard(workload: Workload, count: int, client_factory: ClientFactory) -> LoadStats:
+    """
+    Send `count` requests of the workload from the current process on its own event loop.
+
+    Args:
+        workload (Workload): The requests to send.
+        count (int): The number of requests to send.
+        client_factory (ClientFactory): Builds the client sending the requests.
+
+    Returns:
+        LoadStats: The statistics of the requests sent by this shard.
+    """
+    return asyncio.run(_run_shard(workload, count, client_factory))
+
+
+async def _run_shard(workload: Workload, count: int, client_factory: ClientFactory) -> LoadStats:
+    settings = replace(workload.settings, transport=Transport.ASYNCIO)
+    client = client_factory(base_url=workload.base_url, settings=settings)
+    stats = LoadStats()
+
+    async def send_one():
+        start = time.perf_counter()
+        try:
+            response = await client.async_request(
+                workload.method,
+                workload.routes,
+                workload.data,
+                workload.headers,
+                workload.params,
+            )
+            status = response.status_code if response is not None else 0
+        except Exception:  # pylint: disable=broad-except
+            status = 0
+        stats.record(status, time.perf_counter() - start)
+
+    pending = set()
+    stats.started = time.time()
+    for _ in range(count):
+        if len(pending) >= settings.max_in_flight:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        pending.add(asyncio.ensure_future(send_one()))
+    if pending:
+        await asyncio.wait(pending)
+    stats.finished = time.time()
+
+    await client.aclose()
+    return stats
+
+
+def run_load(workload: Workload, total: int, client_factory: ClientFactory,
+             processes: Optional[int] = None) -> LoadReport:
+    """
+    Shard a workload across worker processes and merge their statistics.
+
+    Each worker runs its own event loop with the asyncio transport and at most
+    `settings.max_in_flight` concurrent requests, so throughput scales with the number of cores
+    instead of being limited by one interpreter.
+
+    Args:
+        workload (Workload): The requests to send.
+        total (int): The total number of requests across all workers.
+        client_factory (ClientFactory): Builds the client of each worker, it must be picklable,
+            such as a client class.
+        processes (Optional[int]): The number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        LoadReport: The merged statistics.
+    """
+    processes = max(1, min(processes or os.cpu_count() or 1, total))
+    stats = LoadStats()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(run_shard, workload, count, client_factory)
+            for count in split_total(total, processes)
+        ]
+        for future in futures:
+            stats.merge(future.result())
+    return LoadReport(stats=stats, processes=processes)
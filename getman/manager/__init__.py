@@ -1,4 +1,7 @@
 from .browser import Browser
+from .cache import ResponseCache
+from .circuit import (CircuitBreaker, CircuitManager, CircuitOpenError,
+                      RetryBudget)
 from .dict import DictManager, HeaderManager, ParamManager
 from .platform import Platform
 from .sessions import SessionManager
@@ -0,0 +1,399 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from getman.transport.protocol import Headers
+from getman.transport.response import build_response
+
+CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+HEURISTIC_FRACTION = 0.1
+# Headers of a 304 response describing its own framing, never merged into the stored response.
+FRAMING_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding"})
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a `Cache-Control` header into lower-cased directives and their optional values.
+    """
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def parse_http_date(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an HTTP-date header into a timestamp, None if it is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_seconds(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a delta-seconds header or directive value, None if it is missing or invalid.
+    """
+    if value is None or not value.strip().isdigit():
+        return None
+    return int(value)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A stored response and the time until which it may be served without revalidation.
+
+    Attributes:
+        url (str): The URL of the request, which is also the cache key.
+        status (int): The response status code.
+        reason (str): The response reason phrase.
+        headers (Headers): The response header pairs.
+        content (bytes): The decoded response body.
+        expires_at (float): The timestamp the response becomes stale at.
+        vary (Dict[str, str]): The request header values named by the `Vary` header.
+    """
+    url: str
+    status: int
+    reason: str
+    headers: Headers
+    content: bytes
+    expires_at: float
+    vary: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """The approximate number of bytes the entry holds."""
+        return len(self.content) + sum(len(key) + len(value) for key, value in self.headers)
+
+    def header(self, name: str) -> Optional[str]:
+        """
+        Get a response header, the header name is case-insensitive.
+        """
+        name = name.lower()
+        return next((value for key, value in self.headers if key.lower() == name), None)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the response may be served without revalidation.
+        """
+        return (now or time.time()) < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Get the `If-None-Match` and `If-Modified-Since` headers revalidating this response.
+        """
+        headers = {}
+        if etag := self.header("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.header("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def refresh(self, headers: CaseInsensitiveDict) -> None:
+        """
+        Update the stored headers and freshness from a `304 Not Modified` response.
+        """
+        updated = [(key, value) for key, value in headers.items()
+                   if key.lower() not in FRAMING_HEADERS]
+        names = {key.lower() for key, _ in updated}
+        self.headers = [(key, value) for key, value in self.headers
+                        if key.lower() not in names] + updated
+        self.expires_at = expiration_time(self.headers, time.time())
+
+    def to_response(self, request: requests.PreparedRequest,
+                    elapsed: float = 0.0) -> requests.Response:
+        """
+        Build a response object from the stored response.
+        """
+        return build_response(request, self.status, self.reason, self.headers, self.content,
+                              elapsed)
+
+
+def expiration_time(headers: Headers, response_time: float) -> float:
+    """
+    Compute the timestamp a response becomes stale at, following RFC 7234 section 4.2.
+
+    The freshness lifetime comes from `max-age`, then `Expires`, then 10% of the time since
+    `Last-Modified`. The age the response already had when it was received, from its `Age` and
+    `Date` headers, is subtracted. A `no-cache` response is stale immediately.
+
+    Args:
+        headers (Headers): The response header pairs.
+        response_time (float): The timestamp the response was received at.
+
+    Returns:
+        float: The timestamp, at most `response_time` when the response must be revalidated.
+    """
+    values = {key.lower(): value for key, value in headers}
+    directives = parse_cache_control(values.get("cache-control"))
+    if "no-cache" in directives:
+        return response_time
+    date = parse_http_date(values.get("date")) or response_time
+    lifetime = parse_seconds(directives.get("max-age"))
+    if lifetime is None and "expires" in values:
+        expires = parse_http_date(values["expires"])
+        lifetime = max(expires - date, 0) if expires is not None else 0
+    if lifetime is None:
+        last_modified = parse_http_date(values.get("last-modified"))
+        lifetime = max(date - last_modified, 0) * HEURISTIC_FRACTION if last_modified else 0
+    age = max(response_time - date, parse_seconds(values.get("age")) or 0, 0)
+    return response_time + lifetime - age
+
+
+def is_cacheable(response: requests.Response) -> bool:
+    """
+    Check whether a response to a GET request may be stored.
+    """
+    directives = parse_cache_control(response.headers.get("Cache-Control"))
+    if "no-store" in directives or response.headers.get("Vary", "").strip() == "*":
+        return False
+    if response.status_code not in CACHEABLE_STATUSES:
+        return False
+    return bool(directives.keys() & {"max-age", "no-cache", "public", "private"}) or any(
+        name in response.headers for name in ("Expires", "ETag", "Last-Modified")
+    )
+
+
+class ResponseCache:
+    """
+    A private HTTP cache for GET responses with a memory tier and an optional disk tier.
+
+    Responses are kept in a least-recently-used memory tier bounded by `max_bytes`, evicting
+    the least recently used responses until the stored bodies and headers fit. With a
+    `directory`, every stored response is also written there and read back on a memory miss,
+    so the cache survives restarts. Stale responses carrying an `ETag` or `Last-Modified`
+    validator are revalidated with a conditional request instead of being downloaded again.
+
+    Args:
+        max_bytes (int): The memory budget of the in-memory tier. Default: 64 MiB.
+        directory (Optional[str]): The directory of the on-disk tier. Default: None.
+
+    Attributes:
+        stats (Counter): The number of `hits`, `misses`, `revalidations`, `stores` and
+            `evictions`.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.size = 0
+        self.stats = Counter()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a stored response, reading it from disk on a memory miss.
+        """
+        entry = self._recall(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    async def aget(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a stored response like `get`, reading the disk tier from a worker thread.
+        """
+        entry = self._recall(key)
+        if entry is None and self.directory:
+            entry = await asyncio.to_thread(self._read, key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    def put(self, entry: CacheEntry) -> None:
+        """
+        Store a response in memory, evicting older responses, and on disk.
+        """
+        self._remember(entry.url, entry)
+        self._write(entry)
+        self.stats["stores"] += 1
+
+    async def aput(self, entry: CacheEntry) -> None:
+        """
+        Store a response like `put`, writing the disk tier from a worker thread.
+        """
+        self._remember(entry.url, entry)
+        if self.directory:
+            await asyncio.to_thread(self._write, entry)
+        self.stats["stores"] += 1
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a stored response from both tiers.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Remove every response from memory; the disk tier is kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def lookup(self, request: requests.PreparedRequest) -> Optional[CacheEntry]:
+        """
+        Find the stored response matching a request, including the headers named by `Vary`.
+        """
+        return self._varied(request, self.get(request.url))
+
+    async def alookup(self, request: requests.PreparedRequest) -> Optional[CacheEntry]:
+        """
+        Find the stored response matching a request like `lookup`, without blocking the loop.
+        """
+        return self._varied(request, await self.aget(request.url))
+
+    def fresh_response(self, request: requests.PreparedRequest,
+                       entry: Optional[CacheEntry]) -> Optional[requests.Response]:
+        """
+        Serve a request from a fresh stored response, None if it must go to the network.
+        """
+        directives = parse_cache_control(request.headers.get("Cache-Control"))
+        if entry is None or "no-cache" in directives or not entry.is_fresh():
+            return None
+        self.stats["hits"] += 1
+        return entry.to_response(request)
+
+    def update(self, request: requests.PreparedRequest, entry: Optional[CacheEntry],
+               response: Optional[requests.Response]) -> Optional[requests.Response]:
+        """
+        Store the network response of a request, or refresh the entry it revalidated.
+
+        Args:
+            request (requests.PreparedRequest): The request, without conditional headers.
+            entry (Optional[CacheEntry]): The stale entry that was revalidated, if any.
+            response (Optional[requests.Response]): The network response.
+
+        Returns:
+            Optional[requests.Response]: The stored response when the server answered
+                `304 Not Modified`, otherwise the network response.
+        """
+        stored, response = self._settle(request, entry, response)
+        if stored is not None:
+            self.put(stored)
+        return response
+
+    async def aupdate(self, request: requests.PreparedRequest, entry: Optional[CacheEntry],
+                      response: Optional[requests.Response]) -> Optional[requests.Response]:
+        """
+        Store the network response of a request like `update`, without blocking the loop.
+        """
+        stored, response = self._settle(request, entry, response)
+        if stored is not None:
+            await self.aput(stored)
+        return response
+
+    def _settle(self, request: requests.PreparedRequest, entry: Optional[CacheEntry],
+                response: Optional[requests.Response],
+                ) -> Tuple[Optional[CacheEntry], Optional[requests.Response]]:
+        """
+        Get the entry to store for a network response, and the response to return.
+        """
+        if response is None:
+            return None, None
+        if response.status_code == 304 and entry is not None:
+            self.stats["revalidations"] += 1
+            entry.refresh(response.headers)
+            return entry, entry.to_response(request, response.elapsed.total_seconds())
+        self.stats["misses"] += 1
+        if not is_cacheable(response):
+            return None, response
+        vary = [name.strip() for name in response.headers.get("Vary", "").split(",")]
+        return CacheEntry(
+            url=request.url,
+            status=response.status_code,
+            reason=response.reason or "",
+            headers=list(response.headers.items()),
+            content=response.content or b"",
+            expires_at=expiration_time(list(response.headers.items()), time.time()),
+            vary={name: request.headers.get(name, "") for name in vary if name},
+        ), response
+
+    @staticmethod
+    def _varied(request: requests.PreparedRequest,
+                entry: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        if entry is None or any(request.headers.get(name, "") != value
+                                for name, value in entry.vary.items()):
+            return None
+        return entry
+
+    def _recall(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.stats["evictions"] += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest())
+
+    def _write(self, entry: CacheEntry) -> None:
+        if not self.directory:
+            return
+        metadata = asdict(entry)
+        content = metadata.pop("content")
+        path = self._path(entry.url)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(json.dumps(metadata).encode() + b"\n" + content)
+        os.replace(temporary, path)
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "rb") as file:
+                metadata, _, content = file.read().partition(b"\n")
+            metadata = json.loads(metadata)
+        except (OSError, ValueError):
+            return None
+        if metadata.get("url") != key:
+            return None
+        metadata["headers"] = [tuple(pair) for pair in metadata["headers"]]
+        return CacheEntry(content=content, **metadata)
@@ -0,0 +1,239 @@
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from getman.constant import CircuitState
+from getman.settings import Settings
+from getman.transport.aio import DEFAULT_PORTS
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Raised instead of sending a request while the circuit of its host is open.
+    """
+
+
+def host_key(url: str) -> str:
+    """
+    Get the `scheme://host:port` key of a URL, the same key used by the connection statistics.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme or "http"
+    return f"{scheme}://{parts.hostname}:{parts.port or DEFAULT_PORTS.get(scheme, 80)}"
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker guarding the requests sent to a single host.
+
+    The breaker starts closed and keeps the outcome of the last `window` requests. Once at least
+    `min_requests` outcomes are known and the share of failures reaches `failure_threshold`, it
+    opens: every request is rejected without touching the network until `reset_timeout` seconds
+    have passed. It is then half-open and lets a single probe through, closing again if the
+    probe succeeds and re-opening if it fails.
+
+    Args:
+        failure_threshold (float): Share of failures, between 0 and 1, that opens the circuit.
+            Default: 0.5.
+        window (int): Number of recent outcomes the failure share is computed over. Default: 20.
+        min_requests (int): Minimum number of outcomes before the circuit can open. Default: 5.
+        reset_timeout (float): Seconds an open circuit waits before letting a probe through.
+            Default: 30.
+        failure_statuses (Tuple[int, ...]): Status codes counted as failures in addition to
+            every 5xx status. Default: (429,).
+    """
+
+    def __init__(self, failure_threshold: float = 0.5, window: int = 20, min_requests: int = 5,
+                 reset_timeout: float = 30.0, failure_statuses: Tuple[int, ...] = (429,)):
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.failure_statuses = failure_statuses
+        self.outcomes: Deque[bool] = deque(maxlen=max(window, 1))
+        self.rejected = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, an open circuit becomes half-open once `reset_timeout` passed."""
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failure_rate(self) -> float:
+        """The share of failures among the recent outcomes."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent, reserving the probe of a half-open circuit.
+
+        Returns:
+            bool: True if the request may be sent, False if it must be rejected.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def acquire(self, host: str = "") -> None:
+        """
+        Allow a request or fail fast.
+
+        Args:
+            host (str): The host named in the error message.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit open for {host or 'host'}, request not sent.")
+
+    def record_success(self) -> None:
+        """
+        Record a successful request, closing a half-open circuit.
+        """
+        with self._lock:
+            if self._current_state() is CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._probing = False
+                self.outcomes.clear()
+            self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """
+        Record a failed request, opening the circuit when the failure share is reached.
+        """
+        with self._lock:
+            state = self._current_state()
+            self.outcomes.append(False)
+            if state is CircuitState.HALF_OPEN or (
+                    state is CircuitState.CLOSED
+                    and len(self.outcomes) >= self.min_requests
+                    and self.failure_rate >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def record_response(self, response: Optional[requests.Response]) -> None:
+        """
+        Record the outcome of a request from its response, None counts as a failure.
+        """
+        if response is None or response.status_code >= 500 \
+                or response.status_code in self.failure_statuses:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def release(self) -> None:
+        """
+        Give back the probe of a half-open circuit whose request ended without an outcome.
+        """
+        with self._lock:
+            self._probing = False
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN \
+                and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+
+class RetryBudget:
+    """
+    A token bucket limiting retries to a share of the requests sent.
+
+    Every request deposits `ratio` tokens and every retry withdraws one, so retries never
+    exceed `ratio` of the requests plus a reserve of `min_retries`. When a host fails, the
+    retries stop once the budget is spent instead of multiplying the traffic against it.
+
+    Args:
+        ratio (float): Retries allowed per request sent. Default: 0.1.
+        min_retries (int): Retries always available after a quiet period, so a client sending
+            few requests can still retry. Default: 10.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10):
+        self.ratio = ratio
+        self.capacity = float(max(min_retries, 1))
+        self.requests = 0
+        self.retries = 0
+        self.rejected = 0
+        self._tokens = self.capacity
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """
+        Record a request, depositing `ratio` tokens.
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.ratio, self.capacity)
+
+    def try_retry(self) -> bool:
+        """
+        Withdraw a token for a retry.
+
+        Returns:
+            bool: True if the retry may be sent, False if the budget is spent.
+        """
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries += 1
+                return True
+            self.rejected += 1
+            return False
+
+
+class CircuitManager:
+    """
+    A class that keeps a circuit breaker per `scheme://host:port`.
+
+    Args:
+        settings (Settings): The breaker options: `failure_threshold`, `failure_window`,
+            `circuit_min_requests`, `reset_timeout`, and `retry_statuses` counted as failures.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url: str) -> Tuple[str, CircuitBreaker]:
+        """
+        Get the host key of a URL and its breaker, created on first use.
+        """
+        key = host_key(url)
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(key, CircuitBreaker(
+                    failure_threshold=self.settings.failure_threshold,
+                    window=self.settings.failure_window,
+                    min_requests=self.settings.circuit_min_requests,
+                    reset_timeout=self.settings.reset_timeout,
+                    failure_statuses=self.settings.retry_statuses,
+                ))
+        return key, breaker
+
+    def states(self) -> Dict[str, CircuitState]:
+        """
+        Get the state of every host's circuit.
+        """
+        return {key: breaker.state for key, breaker in self.breakers.items()}
@@ -1,5 +1,27 @@
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Tuple
+from typing import Any, Hashable, List, Optional, Tuple
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert a value into a hashable equivalent, recursively for dictionaries, lists and sets.
+
+    `DictManager` instances are frozen from a snapshot of their data, so the result does not
+    change when they are modified afterwards.
+
+    Raises:
+        TypeError: If the value contains an object that cannot be hashed.
+    """
+    if isinstance(value, DictManager):
+        return freeze(value.data)
+    if isinstance(value, dict):
+        return frozenset((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    hash(value)
+    return value
 
 
 @dataclass
@@ -11,6 +33,7 @@ class DictManager:
         data (dict): The dictionary that stores the data.
     """
     data: dict[Any, Any] = field(default_factory=dict)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __repr__(self) -> str:
         """Return the dictionary representation of the DictManager object."""
@@ -26,6 +49,7 @@ class DictManager:
     def __setitem__(self, key: str, value: Any) -> None:
         """Set the value associated with the key in the dictionary."""
         self.data[key] = value
+        self._hash = None
 
     def __delitem__(self, key: str) -> None:
         """Delete the value associated with the key from the dictionary."""
@@ -33,6 +57,7 @@ class DictManager:
             del self.data[key]
         except KeyError as exc:
             raise KeyError(f"Key '{key}' not found.") from exc
+        self._hash = None
 
     def __contains__(self, key: Any) -> bool:
         """Check if a key exists in the dictionary."""
@@ -43,8 +68,16 @@ class DictManager:
         return len(self.data)
 
     def __hash__(self):
-        """Generate a hash for the DictManager instance."""
-        return hash(tuple(sorted(self.data.items())))
+        """
+        Generate a hash for the DictManager instance.
+
+        The hash is cached until the dictionary is modified through the DictManager methods,
+        so it is cheap to use as part of a request key. Modifying `data` directly requires
+        calling `clear_hash`.
+        """
+        if self._hash is None:
+            self._hash = hash(freeze(self.data))
+        return self._hash
 
     def __iter__(self):
         """Make the DictManager instance iterable over its data."""
@@ -53,10 +86,12 @@ class DictManager:
     def add(self, key: str, value: Any) -> None:
         """Add an item to the dictionary."""
         self.data[key] = value
+        self._hash = None
 
     def remove(self, key: Any) -> None:
         """Remove an item from the dictionary."""
         self.data.pop(key, None)
+        self._hash = None
 
     def get(self, key: Optional[str] = None) -> Any:
         """
@@ -90,9 +125,14 @@ class DictManager:
     def clear(self) -> None:
         """Clear the dictionary."""
         self.data.clear()
+        self._hash = None
 
+    def clear_hash(self) -> None:
+        """Reset the cached hash after modifying `data` directly."""
+        self._hash = None
 
-@dataclass
+
+@dataclass(eq=False)
 class HeaderManager(DictManager):
     """
     A specialized dictionary manager for handling HTTP headers.
@@ -102,7 +142,7 @@ class HeaderManager(DictManager):
         super().__init__()
 
 
-@dataclass
+@dataclass(eq=False)
 class ParamManager(DictManager):
     """
     A specialized dictionary manager for handling URL parameters.
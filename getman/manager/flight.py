@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+
+from getman.constant import HttpMethod
+from getman.manager.dict import freeze
+
+IDEMPOTENT_METHODS = frozenset({HttpMethod.GET.value, HttpMethod.OPTION.value, "options"})
+
+
+def flight_key(
+        method: Union[str, HttpMethod],
+        url: str,
+        params: Any = None,
+        headers: Any = None,
+        data: Any = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+) -> Optional[Hashable]:
+    """
+    Build the key identifying identical requests.
+
+    Args:
+        method (Union[str, HttpMethod]): The HTTP method.
+        url (str): The URL of the request.
+        params (Any): The query parameters, a dictionary or a `DictManager`.
+        headers (Any): The request headers, a dictionary or a `DictManager`.
+        data (Any): The body data, a dictionary, a `DictManager` or a string.
+        kwargs (Optional[Dict[str, Any]]): The other request options.
+
+    Returns:
+        Optional[Hashable]: The key, None if the request is not idempotent, is streamed, or
+            one of its options cannot be hashed, in which case it must not be shared.
+    """
+    method = method.value if isinstance(method, HttpMethod) else str(method).lower()
+    if method not in IDEMPOTENT_METHODS or (kwargs or {}).get("stream"):
+        return None
+    try:
+        return method, url, freeze(params), freeze(headers), freeze(data), freeze(kwargs or {})
+    except TypeError:
+        return None
+
+
+class _Call:
+    """
+    A call in flight, shared by the threads waiting for it.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into a single execution.
+
+    The first caller of a key runs the call, and every caller arriving with the same key while
+    it is in flight waits for it and gets the same result or exception. Once the call completes
+    the key is forgotten, so results are never reused afterwards; see `ResponseCache` for that.
+
+    Attributes:
+        stats (Counter): The number of `calls` executed and of `shared` calls that waited for
+            another caller's result.
+    """
+
+    def __init__(self):
+        self.stats = Counter()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run a blocking call, or wait for the identical call another thread is running.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            func (Callable[[], Any]): The call to run.
+
+        Returns:
+            Any: The result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self.stats["calls" if leader else "shared"] += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def acall(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a coroutine, or wait for the identical one already running on the event loop.
+
+        The coroutine runs as a task shielded from the cancellation of any single caller, so
+        the others still get its result.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            func (Callable[[], Awaitable[Any]]): Creates the coroutine to run.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.stats["calls"] += 1
+        else:
+            self.stats["shared"] += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
@@ -1,14 +1,33 @@
-from typing import Any, List
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, List, Optional, Tuple
 
 
+@dataclass
 class QueueManager:
     """
        A simple queue management class that provides basic queue operations.
 
+       Every instance owns its queue. Plain items are kept in a deque, so enqueue and
+       dequeue are O(1). Items enqueued with a priority are kept in a heap and are served
+       before plain items, lowest priority value first, in FIFO order for equal priorities.
+
        Attributes:
-           items (List[Any]): The list that stores the queue items.
+           items (Deque[Tuple[int, Any]]): The FIFO entries as (enqueue index, item) pairs.
+           priority_items (List[Tuple[int, int, Any]]): The heap of prioritized entries as
+               (priority, enqueue index, item) tuples.
    """
-    items = []
+    items: Deque[Tuple[int, Any]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    priority_items: List[Tuple[int, int, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _sequence: itertools.count = field(
+        default_factory=itertools.count, init=False, repr=False, compare=False
+    )
 
     def is_queue_empty(self) -> bool:
         """
@@ -17,16 +36,22 @@ class QueueManager:
         Returns:
             bool: True if the queue is empty, False otherwise.
         """
-        return len(self.items) == 0
+        return not self.items and not self.priority_items
 
-    def enqueue(self, item: Any) -> None:
+    def enqueue(self, item: Any, priority: Optional[int] = None) -> None:
         """
         Add an item to the end of the queue.
 
         Args:
             item (Any): The item to be added to the queue.
+            priority (Optional[int]): If set, the item jumps ahead of every plain item and is
+                ordered against other prioritized items, lower values first.
         """
-        self.items.insert(0, item)
+        index = next(self._sequence)
+        if priority is None:
+            self.items.append((index, item))
+        else:
+            heapq.heappush(self.priority_items, (priority, index, item))
 
     def dequeue(self) -> Any:
         """
@@ -38,9 +63,24 @@ class QueueManager:
         Raises:
             IndexError: If the queue is empty when trying to dequeue.
         """
-        if self.is_queue_empty():
+        return self.dequeue_with_index()[1]
+
+    def dequeue_with_index(self) -> Tuple[int, Any]:
+        """
+        Remove and return the item from the front of the queue with its enqueue index.
+
+        Returns:
+            Tuple[int, Any]: The position at which the item was enqueued, and the item.
+
+        Raises:
+            IndexError: If the queue is empty when trying to dequeue.
+        """
+        if self.priority_items:
+            _, index, item = heapq.heappop(self.priority_items)
+            return index, item
+        if not self.items:
             raise IndexError("Cannot dequeue from an empty queue.")
-        return self.items.pop()
+        return self.items.popleft()
 
     def size_queue(self) -> int:
         """
@@ -49,19 +89,33 @@ class QueueManager:
         Returns:
             int: The number of items in the queue.
         """
-        return len(self.items)
+        return len(self.items) + len(self.priority_items)
 
     def clear_queue(self) -> None:
         """
-        Remove all items from the queue.
+        Remove all items from the queue and restart the enqueue index at zero.
         """
         self.items.clear()
+        self.priority_items.clear()
+        self._sequence = itertools.count()
 
     def get_queues(self) -> List[Any]:
         """
         Get a list of all items currently in the queue.
 
         Returns:
-            List[Any]: The list of items in the queue.
+            List[Any]: The list of items in the queue, the next one to be dequeued last.
+        """
+        return [item for _, item in reversed(self.get_queue_entries())]
+
+    def get_queue_entries(self) -> List[Tuple[int, Any]]:
+        """
+        Get all items currently in the queue with their enqueue index.
+
+        Returns:
+            List[Tuple[int, Any]]: (enqueue index, item) pairs in the order they will be dequeued.
         """
-        return self.items.copy()
+        prioritized = [(index, item) for _, index, item in sorted(
+            self.priority_items, key=lambda entry: entry[:2]
+        )]
+        return prioritized + list(self.items)
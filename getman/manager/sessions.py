@@ -1,13 +1,187 @@
-from typing import Any, Optional
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from getman.settings import Settings
+from getman.utils.codec import JsonCodec, get_codec
+
+ConnectionStats = Dict[str, Counter]
+
+
+def pool_stats(session: requests.Session) -> ConnectionStats:
+    """
+    Count the new and reused connections of every host in a session's connection pools.
+
+    Args:
+        session (requests.Session): The session to inspect.
+
+    Returns:
+        ConnectionStats: Counters with `new` and `reused` keys, keyed by `scheme://host:port`.
+    """
+    stats: ConnectionStats = {}
+    for adapter in set(session.adapters.values()):
+        manager = getattr(adapter, "poolmanager", None)
+        if manager is None:
+            continue
+        for key in manager.pools.keys():
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            counts = stats.setdefault(f"{pool.scheme}://{pool.host}:{pool.port}", Counter())
+            counts["new"] += pool.num_connections
+            counts["reused"] += max(pool.num_requests - pool.num_connections, 0)
+    return stats
+
+
+def merge_stats(*sources: ConnectionStats) -> ConnectionStats:
+    """
+    Add up connection statistics per host.
+    """
+    merged: ConnectionStats = {}
+    for source in sources:
+        for host, counts in source.items():
+            merged.setdefault(host, Counter()).update(counts)
+    return merged
+
+
+class CodecSession(requests.Session):
+    """
+    A session encoding `json=` bodies and decoding `response.json()` with a `JsonCodec`.
+
+    Args:
+        codec (JsonCodec): The JSON codec.
+    """
+
+    def __init__(self, codec: JsonCodec):
+        super().__init__()
+        self.codec = codec
+        self.hooks["response"].append(self._bind_codec)
+
+    def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+        if request.json is not None and not request.data and not request.files:
+            request.data = self.codec.dumps(request.json)
+            request.json = None
+            headers = dict(request.headers or {})
+            if not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+            request.headers = headers
+        return super().prepare_request(request)
+
+    def _bind_codec(self, response: requests.Response, **_) -> requests.Response:
+        return self.codec.bind(response)
 
 
 class SessionManager:
     """
     A class that manages HTTP sessions and cookies.
+
+    Every instance owns its session, created on first use with the connection pool options of
+    `settings`, so cookies and connections are never shared between clients. Worker threads
+    started by `HTTPClient.run_in_threads` get their own session through `thread_local`,
+    because a `requests.Session` must not be shared between threads.
     """
-    session: requests.Session = requests.Session()
+    _session: Optional[requests.Session] = None
+    _retired_stats: Optional[ConnectionStats] = None
+    thread_local: Optional[threading.local] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The session used by the current thread.
+
+        Returns:
+            requests.Session: The session bound to this worker thread, or the client's session.
+        """
+        if self.thread_local is not None:
+            session = getattr(self.thread_local, "session", None)
+            if session is not None:
+                return session
+        if self._session is None:
+            self._session = self.new_session()
+        return self._session
+
+    @property
+    def pool_settings(self) -> Settings:
+        """
+        The settings used to configure connection pools, the defaults if the client has none.
+        """
+        return getattr(self, "settings", None) or Settings()
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """
+        The JSON codec selected by `Settings.json_codec`.
+        """
+        return get_codec(self.pool_settings.json_codec)
+
+    def new_session(self) -> requests.Session:
+        """
+        Create an empty session whose connection pools follow `pool_settings`.
+
+        Returns:
+            requests.Session: A session with its own connection pools.
+        """
+        settings = self.pool_settings
+        session = CodecSession(self.json_codec)
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, HTTPAdapter(
+                pool_connections=settings.pool_connections,
+                pool_maxsize=settings.pool_maxsize,
+                pool_block=settings.pool_block,
+            ))
+        if not settings.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def retire_session(self, session: requests.Session) -> None:
+        """
+        Close a worker session, keeping its cookies and connection statistics.
+
+        Args:
+            session (requests.Session): The session to close.
+        """
+        self.session.cookies.update(session.cookies)
+        self._retired_stats = merge_stats(self._retired_stats or {}, pool_stats(session))
+        session.close()
+
+    def session_stats(self) -> ConnectionStats:
+        """
+        Count the new and reused connections per host made by this client's sessions.
+
+        Returns:
+            ConnectionStats: Counters with `new` and `reused` keys, keyed by `scheme://host:port`.
+        """
+        sources = [self._retired_stats or {}]
+        if self._session is not None:
+            sources.append(pool_stats(self._session))
+        return merge_stats(*sources)
+
+    def close_session(self) -> None:
+        """
+        Close the client's session and its pooled connections.
+        """
+        if self._session is not None:
+            self._session.close()
+
+    def clone_session(self) -> requests.Session:
+        """
+        Create a new session with the headers, cookies and options of the current session.
+
+        Returns:
+            requests.Session: A session with its own connection pool.
+        """
+        source = self.session
+        session = self.new_session()
+        session.headers.update(source.headers)
+        session.cookies.update(source.cookies)
+        session.proxies.update(source.proxies)
+        session.auth = source.auth
+        session.verify = source.verify
+        session.cert = source.cert
+        return session
 
     def get_cookie(self, key: Optional[str] = None) -> Optional[str]:
         """
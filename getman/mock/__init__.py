@@ -0,0 +1,5 @@
+from .faults import FaultProfile, Fixed, LogNormal, Uniform
+from .manager import MockMan, run_mock_server
+from .router import Router
+from .server import Fault, MockRequest, MockResponse, MockServer
+from .workers import MockCluster
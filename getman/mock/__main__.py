@@ -0,0 +1,11 @@
+import argparse
+
+from getman.mock.manager import MockMan, run_mock_server
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the GetMan mock server.")
+    parser.add_argument("--host", default=MockMan.host)
+    parser.add_argument("--port", type=int, default=MockMan.port)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    run_mock_server(MockMan(args.host, args.port), workers=args.workers)
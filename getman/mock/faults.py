@@ -0,0 +1,153 @@
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Union
+
+from getman.mock.server import Fault, MockResponse
+
+
+@dataclass(frozen=True)
+class Fixed:
+    """
+    The same latency for every request.
+
+    Attributes:
+        seconds (float): The latency.
+    """
+    seconds: float
+
+    def sample(self, rng: random.Random) -> float:  # pylint: disable=unused-argument
+        """
+        Draw a latency in seconds.
+        """
+        return self.seconds
+
+
+@dataclass(frozen=True)
+class Uniform:
+    """
+    Latencies spread evenly between two bounds.
+
+    Attributes:
+        low (float): The shortest latency in seconds.
+        high (float): The longest latency in seconds.
+    """
+    low: float
+    high: float
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw a latency in seconds.
+        """
+        return rng.uniform(self.low, self.high)
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    """
+    Log-normally distributed latencies, the long-tailed shape of real service latencies.
+
+    Attributes:
+        median (float): The median latency in seconds.
+        sigma (float): The standard deviation of the log of the latency, larger values give a
+            longer tail. Default: 0.5.
+        maximum (float): Latencies are capped to this many seconds. Default: no cap.
+    """
+    median: float
+    sigma: float = 0.5
+    maximum: float = math.inf
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw a latency in seconds.
+        """
+        return min(rng.lognormvariate(math.log(self.median), self.sigma), self.maximum)
+
+
+Distribution = Union[Fixed, Uniform, LogNormal]
+
+
+@dataclass
+class FaultProfile:
+    """
+    How a mock route misbehaves, drawn independently for every request.
+
+    Rates are probabilities between 0 and 1. A request is first delayed by the latency,
+    then reset, stalled, or answered, with an error status instead of its response at the
+    error rate, and with its body dripped slowly at the drip rate.
+
+    Attributes:
+        latency (Union[Distribution, float, None]): The latency added before answering, a
+            number of seconds for a fixed latency. Default: None.
+        error_rate (float): The share of requests answered with an error status.
+        error_status (Union[int, Sequence[int]]): The error status, or statuses to pick
+            from. Default: 503.
+        retry_after (Optional[float]): The `Retry-After` seconds of error responses.
+        reset_rate (float): The share of connections reset instead of answered.
+        stall_rate (float): The share of requests that hang before being answered.
+        stall (float): How long stalled requests hang, `math.inf` to never answer them.
+        drip_rate (float): The share of responses whose body is sent slowly.
+        drip_bytes (int): The bytes sent per write of a dripped body. Default: 1.
+        drip_interval (float): The seconds between the writes of a dripped body. Default: 0.1.
+        seed (Optional[int]): Seed the random draws to replay the same faults.
+
+    Example:
+        mockman.add_fault("GET /users", FaultProfile(latency=LogNormal(0.05, 0.8),
+                                                     error_rate=0.1, retry_after=1))
+    """
+    latency: Union[Distribution, float, None] = None
+    error_rate: float = 0.0
+    error_status: Union[int, Sequence[int]] = 503
+    retry_after: Optional[float] = None
+    reset_rate: float = 0.0
+    stall_rate: float = 0.0
+    stall: float = math.inf
+    drip_rate: float = 0.0
+    drip_bytes: int = 1
+    drip_interval: float = 0.1
+    seed: Optional[int] = None
+    _random: random.Random = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for name in ("error_rate", "reset_rate", "stall_rate", "drip_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1.")
+        if isinstance(self.latency, (int, float)):
+            self.latency = Fixed(float(self.latency))
+        self._random = random.Random(self.seed)
+
+    def _happens(self, rate: float) -> bool:
+        return rate > 0.0 and self._random.random() < rate
+
+    def apply(self, response: MockResponse) -> Union[MockResponse, Fault]:
+        """
+        Draw the faults of one request.
+
+        Args:
+            response (MockResponse): The response the route would send.
+
+        Returns:
+            Union[MockResponse, Fault]: The response, or an error response, when it is sent at
+                once, otherwise the fault to play.
+        """
+        delay = self.latency.sample(self._random) if self.latency is not None else 0.0
+        if self._happens(self.reset_rate):
+            return Fault(response, delay, reset=True)
+        stall = self.stall if self._happens(self.stall_rate) else None
+        if self._happens(self.error_rate):
+            response = self.error_response()
+        drip = (self.drip_bytes, self.drip_interval) if self._happens(self.drip_rate) else None
+        if delay <= 0 and stall is None and drip is None:
+            return response
+        return Fault(response, delay, stall=stall, drip=drip)
+
+    def error_response(self) -> MockResponse:
+        """
+        Build an injected error response.
+        """
+        status = self.error_status
+        if not isinstance(status, int):
+            status = self._random.choice(list(status))
+        headers = {"Retry-After": f"{self.retry_after:g}"} if self.retry_after is not None \
+            else None
+        return MockResponse(status, {"error": "Injected fault"}, headers)
@@ -0,0 +1,339 @@
+import asyncio
+import inspect
+import os
+from array import array
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from getman.mock.faults import FaultProfile
+from getman.mock.router import Router
+from getman.mock.server import Answer, MockRequest, MockResponse, MockServer
+from getman.mock.workers import MockCluster
+from getman.recording import Recording
+from getman.utils.codec import JsonCodec
+
+host: str = 'localhost'
+port: int = 8888
+
+METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+ANY_ROUTE = "*"
+
+Route = Union[MockResponse, Callable[[MockRequest], Any]]
+
+# Headers describing how a recorded body was framed or encoded, it is served decoded.
+RECORDED_FRAMING = frozenset({"content-length", "transfer-encoding", "content-encoding",
+                              "connection", "keep-alive"})
+
+
+def route_key(key: str) -> Tuple[Optional[str], str]:
+    """
+    Split a mock key such as "GET /users" or "users" into its method and path.
+
+    Returns:
+        Tuple[Optional[str], str]: The upper-case method, None for any method, and the path
+            with a leading slash.
+    """
+    method, _, path = key.strip().partition(" ")
+    if not path or method.upper() not in METHODS:
+        method, path = None, key.strip()
+    path = path.strip().partition("?")[0]
+    return (method.upper() if method else None), "/" + path.lstrip("/")
+
+
+def as_response(value: Any) -> MockResponse:
+    """
+    Wrap the value of a mock as a response, a `MockResponse` is returned as it is.
+    """
+    return value if isinstance(value, MockResponse) else MockResponse(body=value)
+
+
+class RecordedRoute:
+    """
+    Answers a route with its recorded responses, in recorded order, starting over once they
+    have all been served. Each response is read from the recording when it is served, from a
+    worker thread, so decompressing a large body never holds up the other connections.
+
+    Args:
+        recording (Recording): The recording the responses are read from.
+        offsets (array): The offsets of the exchanges of the route in the recording.
+    """
+
+    def __init__(self, recording: Recording, offsets: array):
+        self.recording = recording
+        self.offsets = offsets
+        self._next = 0
+
+    def __call__(self, request: MockRequest) -> Awaitable[MockResponse]:
+        offset = self.offsets[self._next % len(self.offsets)]
+        self._next += 1
+        return self._serve(offset)
+
+    async def _serve(self, offset: int) -> MockResponse:
+        exchange = await asyncio.to_thread(self.recording.read, offset)
+        headers = [(key, value) for key, value in exchange.headers
+                   if key.lower() not in RECORDED_FRAMING]
+        return MockResponse(exchange.status, exchange.body or b"", headers)
+
+
+@dataclass
+class MockMan:
+    """
+    A class to manage a mock server for testing HTTP requests.
+
+    Mocks map a route to a response. Routes are a path, matching any method, or a method and a
+    path such as "POST /users". Path segments such as "{id}" in "/users/{id}/orders" match any
+    segment, captured in `MockRequest.params`, while static segments take precedence. Routes
+    are kept in a path-segment trie, so matching costs the same with thousands of routes and
+    mocks are added or removed while serving. Responses are a `MockResponse`, a callable
+    receiving the `MockRequest`, possibly a coroutine function, or a body served with status
+    200, encoded as JSON unless it is bytes or a str, or a path, sent from the file with
+    `sendfile`. Static mocks are serialized once when they are added, so answering them is a
+    single write of a ready buffer. HEAD requests are answered by the GET mock when the route
+    has no HEAD mock. Requests without a mock get the original echo replies: GET returns the
+    query parameters, POST the JSON body, and other methods a 400.
+
+    Fault profiles added with `add_fault` make routes slow or unreliable on purpose, to test
+    retries, timeouts and circuit breakers.
+
+    With `workers` above 1, the mocks are served by that many forked processes sharing the
+    port with `SO_REUSEPORT`, so a multi-core load generator does not saturate the mock.
+
+    Example:
+        mockman = MockMan(port=0)
+        mockman.add_mock("GET /users", [{"id": 1}])
+        mockman.add_mock("POST /users", lambda request: MockResponse(201, request.json()))
+        mockman.add_mock("GET /users/{id}", lambda request: {"id": request.params["id"]})
+        with mockman.start() as server:
+            GetMan(base_url=f"http://localhost:{server.port}").get("users")
+    """
+    host: str = 'localhost'
+    port: int = 8888
+    mock: dict = None
+    backlog: int = 1024
+    codec: Union[str, JsonCodec, None] = None
+    workers: int = 1
+    faults: dict = None
+    _routes: Router = field(default_factory=Router, init=False, repr=False)
+    _faults: Router = field(default_factory=Router, init=False, repr=False)
+    _any_fault: Optional[FaultProfile] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.mock is None:
+            self.mock = {}
+        if self.faults is None:
+            self.faults = {}
+        for key, value in self.mock.items():
+            self._routes.add(*route_key(key), self._compile(value))
+        for key, profile in self.faults.items():
+            self._set_fault(key, profile)
+
+    def add_mock(self, key, value):
+        """
+        Add a key-value pair to the mock data.
+        """
+        self.mock[key] = value
+        self._routes.add(*route_key(key), self._compile(value))
+
+    def _compile(self, value: Any) -> Route:
+        """
+        Serialize a static mock once, a callable is called for every request.
+        """
+        return value if callable(value) else as_response(value).prepare(self.codec)
+
+    def add_recording(self, recording: Union[str, os.PathLike, Recording]) -> int:
+        """
+        Serve the responses of a recording made with `GetMan.record`, one route per recorded
+        method and path, replacing existing mocks of those routes.
+
+        Only the offsets of the exchanges are kept in memory, responses are read from the
+        recording when they are served. A route recorded several times answers with its
+        recorded responses in turn. Query strings are ignored, and HEAD requests are answered
+        by the GET responses.
+
+        Args:
+            recording (Union[str, os.PathLike, Recording]): The recording, or its file.
+
+        Returns:
+            int: The number of routes added.
+        """
+        if not isinstance(recording, Recording):
+            recording = Recording(recording)
+        offsets: Dict[str, array] = {}
+        for offset, method, url in recording.index():
+            if method in METHODS:
+                key = f"{method} {urlsplit(url).path or '/'}"
+                offsets.setdefault(key, array("q")).append(offset)
+        for key, route_offsets in offsets.items():
+            self.add_mock(key, RecordedRoute(recording, route_offsets))
+        return len(offsets)
+
+    def remove_data(self, key):
+        """
+        Remove a key from the mock data.
+        """
+        self.mock.pop(key, None)
+        self._routes.remove(*route_key(key))
+
+    def get_data(self):
+        """
+        Get the mock data.
+        """
+        return self.mock
+
+    def add_fault(self, key: str, profile: FaultProfile) -> None:
+        """
+        Make a route misbehave according to a fault profile.
+
+        Args:
+            key (str): The route, as for `add_mock`, or "*" for every route without a profile.
+            profile (FaultProfile): The latency, errors, resets, stalls and drips of the route.
+        """
+        self.faults[key] = profile
+        self._set_fault(key, profile)
+
+    def remove_fault(self, key: str) -> None:
+        """
+        Remove the fault profile of a route.
+        """
+        self.faults.pop(key, None)
+        self._set_fault(key, None)
+
+    def _set_fault(self, key: str, profile: Optional[FaultProfile]) -> None:
+        if key.strip() == ANY_ROUTE:
+            self._any_fault = profile
+        elif profile is None:
+            self._faults.remove(*route_key(key))
+        else:
+            self._faults.add(*route_key(key), profile)
+
+    def handle(self, request: MockRequest) -> Union[Answer, Awaitable[Answer]]:
+        """
+        Build the response to a request from the mock of its route.
+
+        Args:
+            request (MockRequest): The request received.
+
+        Returns:
+            Union[Answer, Awaitable[Answer]]: The response of the mock, or the echo reply
+                without a mock, or the fault drawn from the fault profile of the route. An
+                awaitable of it when the mock returned an awaitable.
+        """
+        path, method = request.path, request.method
+        matched = self._routes.match(method, path)
+        if matched is None and method == "HEAD":
+            method = "GET"
+            matched = self._routes.match(method, path)
+        if matched is None:
+            response = self.echo(request)
+        elif isinstance(matched[0], MockResponse):
+            response = matched[0]
+        else:
+            route, request.params = matched
+            response = route(request)
+            if inspect.isawaitable(response):
+                return self._settle(response, method, path)
+            response = as_response(response)
+        return self._fault(response, method, path)
+
+    async def _settle(self, pending: Awaitable[Any], method: str, path: str) -> Answer:
+        return self._fault(as_response(await pending), method, path)
+
+    def _fault(self, response: MockResponse, method: str, path: str) -> Answer:
+        if self._faults or self._any_fault is not None:
+            matched = self._faults.match(method, path) if self._faults else None
+            profile = matched[0] if matched is not None else self._any_fault
+            if profile is not None:
+                return profile.apply(response)
+        return response
+
+    def echo(self, request: MockRequest) -> MockResponse:
+        """
+        Reply to a request without a mock.
+        """
+        if request.method in ("GET", "HEAD"):
+            return MockResponse(body={"message": "Mock GET request received",
+                                      "params": request.query})
+        if request.method == "POST":
+            try:
+                data = request.json(self.codec)
+            except ValueError:
+                return MockResponse(400, "Invalid JSON body")
+            return MockResponse(body={"message": "Mock POST request received", "data": data})
+        return MockResponse(400, "Invalid request method")
+
+    def server(self) -> MockServer:
+        """
+        Create a server answering requests with the mocks.
+        """
+        return MockServer(self.handle, self.host, self.port, self.backlog, self.codec)
+
+    def cluster(self) -> MockCluster:
+        """
+        Create worker processes answering requests with the mocks, sharing one port.
+        """
+        return MockCluster(self.handle, self.workers, self.host, self.port, self.backlog,
+                           self.codec)
+
+    def start(self) -> Union[MockServer, MockCluster]:
+        """
+        Serve the mocks from a background thread, or from `workers` processes, returning once
+        the mocks are served.
+
+        Returns:
+            Union[MockServer, MockCluster]: The running server or workers, their `port` is the
+                port actually listened on and `requests` counts the requests answered. Stop
+                them with `stop_background` or use them as a context manager.
+        """
+        if self.workers > 1:
+            return self.cluster().start_background()
+        return self.server().start_background()
+
+    async def serve(self) -> None:
+        """
+        Serve the mocks on the running event loop until cancelled, in this process only.
+        """
+        server = self.server()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    def run(self) -> None:
+        """
+        Serve the mocks until interrupted.
+        """
+        if self.workers > 1:
+            cluster = self.cluster().start_background()
+            print(f"Mock server running on {self.host}:{cluster.port} "
+                  f"with {self.workers} workers")
+            try:
+                cluster.join()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                cluster.stop_background()
+            return
+        print(f"Mock server running on {self.host}:{self.port}")
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+
+
+def run_mock_server(mockman: Optional[MockMan] = None, workers: Optional[int] = None):
+    """
+    Run a mock server that listens for incoming HTTP requests and responds with mock
+    data, until interrupted.
+
+    Args:
+        mockman (Optional[MockMan]): The mocks to serve. Defaults to no mocks on
+            `localhost:8888`.
+        workers (Optional[int]): The number of worker processes, overriding
+            `MockMan.workers`.
+    """
+    mockman = mockman or MockMan(host, port)
+    if workers is not None:
+        mockman = replace(mockman, workers=workers)
+    mockman.run()
@@ -0,0 +1,185 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+
+class Route:
+    """
+    A value registered on a path, with the names of the parameters the path captures.
+    """
+    __slots__ = ("value", "names")
+
+    def __init__(self, value: Any, names: Tuple[str, ...]):
+        self.value = value
+        self.names = names
+
+
+class Node:
+    """
+    A path segment of the trie.
+
+    Attributes:
+        children (Dict[str, Node]): The static segments that can follow this one.
+        param (Optional[Node]): The parameter segment that can follow this one.
+        routes (Dict[Optional[str], Route]): The routes ending here per method, None for any
+            method.
+    """
+    __slots__ = ("children", "param", "routes")
+
+    def __init__(self):
+        self.children: Dict[str, Node] = {}
+        self.param: Optional[Node] = None
+        self.routes: Dict[Optional[str], Route] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.children or self.param or self.routes)
+
+
+def segments(path: str) -> List[str]:
+    """
+    Split a path into its segments, ignoring leading and trailing slashes.
+    """
+    path = path.strip("/")
+    return path.split("/") if path else []
+
+
+def is_param(segment: str) -> bool:
+    """
+    Check whether a pattern segment is a parameter, such as "{id}".
+    """
+    return len(segment) > 2 and segment[0] == "{" and segment[-1] == "}"
+
+
+class Router:
+    """
+    A path-segment trie matching a method and a path to a value in O(path segments).
+
+    Patterns are paths whose segments are static, or parameters such as "{id}" that match any
+    single segment and are captured under their name. Static segments win over parameters,
+    and a method-specific route wins over a route for any method, falling back to the other
+    branch when the preferred one does not match. Routes are added and removed in place, so
+    the trie never has to be rebuilt. Routes without parameters are also indexed by their
+    whole path, so they are found with a single lookup.
+
+    Example:
+        router = Router()
+        router.add("GET", "/v1/users/{id}/orders", "orders")
+        router.match("GET", "/v1/users/42/orders")  # ("orders", {"id": "42"})
+    """
+
+    def __init__(self):
+        self.root = Node()
+        self._count = 0
+        self._static: Dict[Tuple[Optional[str], str], Route] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, method: Optional[str], pattern: str, value: Any) -> None:
+        """
+        Register a value on a pattern, replacing any value of the same method and pattern.
+
+        Args:
+            method (Optional[str]): The upper-case method, None for any method.
+            pattern (str): The path pattern, for example "/users/{id}".
+            value (Any): The value returned by `match`.
+        """
+        node, names = self.root, []
+        for segment in segments(pattern):
+            if is_param(segment):
+                names.append(segment[1:-1])
+                if node.param is None:
+                    node.param = Node()
+                node = node.param
+            else:
+                node = node.children.setdefault(segment, Node())
+        if method not in node.routes:
+            self._count += 1
+        node.routes[method] = route = Route(value, tuple(names))
+        if not names:
+            self._static[method, pattern.strip("/")] = route
+
+    def remove(self, method: Optional[str], pattern: str) -> bool:
+        """
+        Remove the value of a method and pattern, pruning the segments left empty.
+
+        Returns:
+            bool: Whether a value was removed.
+        """
+        path: List[Tuple[Node, Optional[str]]] = []
+        node = self.root
+        for segment in segments(pattern):
+            key = None if is_param(segment) else segment
+            child = node.param if key is None else node.children.get(key)
+            if child is None:
+                return False
+            path.append((node, key))
+            node = child
+        if node.routes.pop(method, None) is None:
+            return False
+        self._count -= 1
+        self._static.pop((method, pattern.strip("/")), None)
+        for parent, key in reversed(path):
+            child = parent.param if key is None else parent.children[key]
+            if child:
+                break
+            if key is None:
+                parent.param = None
+            else:
+                del parent.children[key]
+        return True
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """
+        Find the value of a request.
+
+        Args:
+            method (str): The upper-case request method.
+            path (str): The request path, without its query string.
+
+        Returns:
+            Optional[Tuple[Any, Dict[str, str]]]: The value and the decoded path parameters,
+                None if no route matches.
+        """
+        key = path.strip("/")
+        route = self._static.get((method, key)) or self._static.get((None, key))
+        if route is not None:
+            return route.value, {}
+        parts = key.split("/") if key else []
+        values: List[str] = []
+        route = self._match(self.root, parts, 0, method, values)
+        if route is None:
+            return None
+        if not route.names:
+            return route.value, {}
+        return route.value, dict(zip(route.names, map(unquote, values)))
+
+    def _match(self, node: Node, parts: List[str], index: int, method: str,
+               values: List[str]) -> Optional[Route]:
+        if index == len(parts):
+            return node.routes.get(method) or node.routes.get(None)
+        part = parts[index]
+        child = node.children.get(part)
+        if child is not None:
+            route = self._match(child, parts, index + 1, method, values)
+            if route is not None:
+                return route
+        if node.param is not None and part:
+            values.append(part)
+            route = self._match(node.param, parts, index + 1, method, values)
+            if route is not None:
+                return route
+            values.pop()
+        return None
+
+    def __iter__(self) -> Iterator[Tuple[Optional[str], str, Any]]:
+        """
+        Iterate over the method, pattern with unnamed parameters, and value of every route.
+        """
+        stack = [(self.root, "")]
+        while stack:
+            node, prefix = stack.pop()
+            for method, route in node.routes.items():
+                yield method, prefix or "/", route.value
+            if node.param is not None:
+                stack.append((node.param, prefix + "/{}"))
+            stack.extend((child, f"{prefix}/{segment}") for segment, child in node.children.items())
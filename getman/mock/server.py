@@ -0,0 +1,691 @@
+import asyncio
+import inspect
+import math
+import mimetypes
+import os
+import socket
+import struct
+import threading
+from collections import deque
+from http import HTTPStatus
+from typing import (Any, Awaitable, Callable, Deque, Dict, List, NamedTuple,
+                    Optional, Set, Tuple, Union)
+from urllib.parse import parse_qsl
+
+from getman.transport.protocol import Headers, header_value
+from getman.utils.codec import JsonCodec, get_codec
+
+MAX_HEAD_SIZE = 64 * 1024
+
+MAX_DEFERRED = 64
+
+REASONS = {status.value: status.phrase for status in HTTPStatus}
+
+Answer = Union["MockResponse", "Fault"]
+
+Handler = Callable[["MockRequest"], Union[Answer, Awaitable[Answer]]]
+
+
+class BadRequest(Exception):
+    """
+    Raised when a request cannot be parsed, the connection is answered and closed.
+
+    Args:
+        status (int): The status of the error response.
+    """
+
+    def __init__(self, status: int = 400):
+        super().__init__(REASONS[status])
+        self.status = status
+
+
+class MockRequest:
+    """
+    A request received by the mock server.
+
+    Headers are kept as received and only split into pairs when they are read, so routes
+    that never look at them cost nothing to parse.
+
+    Args:
+        method (str): The upper-case request method.
+        target (str): The request target, the path with its query string.
+        version (str): The HTTP version. Default: "HTTP/1.1".
+        headers (Union[Headers, bytes, None]): The header pairs, or the raw header lines.
+        body (bytes): The complete body, de-chunked.
+
+    Attributes:
+        params (Dict[str, str]): The path parameters captured by the route, such as
+            {"id": "42"} for "/users/{id}".
+    """
+    __slots__ = ("method", "target", "version", "_headers", "body", "params")
+
+    def __init__(self, method: str, target: str, version: str = "HTTP/1.1",
+                 headers: Union[Headers, bytes, None] = None, body: bytes = b""):
+        self.method = method
+        self.target = target
+        self.version = version
+        self._headers = headers if headers is not None else []
+        self.body = body
+        self.params: Dict[str, str] = {}
+
+    def __repr__(self):
+        return f"MockRequest({self.method} {self.target})"
+
+    @property
+    def headers(self) -> Headers:
+        """
+        The header pairs, in the order received.
+        """
+        if isinstance(self._headers, bytes):
+            headers = []
+            for line in self._headers.decode("latin-1").split("\r\n"):
+                key, _, value = line.partition(":")
+                if key:
+                    headers.append((key.strip(), value.strip()))
+            self._headers = headers
+        return self._headers
+
+    @property
+    def path(self) -> str:
+        """
+        The path of the target, without the query string.
+        """
+        return self.target.partition("?")[0]
+
+    @property
+    def query(self) -> Dict[str, str]:
+        """
+        The query parameters, the last value of a repeated parameter wins.
+        """
+        return dict(parse_qsl(self.target.partition("?")[2], keep_blank_values=True))
+
+    def header(self, name: str) -> Optional[str]:
+        """
+        Get the value of a header, None if it is not present.
+        """
+        return header_value(self.headers, name)
+
+    def json(self, codec: Union[str, JsonCodec, None] = None) -> Any:
+        """
+        Decode the body as JSON, None for an empty body.
+        """
+        return get_codec(codec).loads(self.body) if self.body else None
+
+
+class MockResponse:
+    """
+    A response served by the mock server.
+
+    Args:
+        status (int): The status code. Default: 200.
+        body (Any): The body, bytes are sent as they are, a str is encoded as UTF-8 text, a
+            path such as `Path("dump.json")` is sent from the file and anything else is
+            encoded as JSON. Default: None, an empty body.
+        headers (Union[Dict[str, str], Headers, None]): Extra headers.
+        content_type (Optional[str]): The `Content-Type`, inferred from the body by default.
+    """
+    __slots__ = ("status", "body", "headers", "content_type", "_messages")
+
+    def __init__(self, status: int = 200, body: Any = None,
+                 headers: Union[Dict[str, str], Headers, None] = None,
+                 content_type: Optional[str] = None):
+        self.status = status
+        self.body = body
+        self.headers = list(headers.items()) if isinstance(headers, dict) else list(headers or ())
+        self.content_type = content_type
+        self._messages: Optional[Dict[Tuple[bool, bool], bytes]] = None
+
+    def __repr__(self):
+        return f"MockResponse({self.status})"
+
+    @property
+    def file(self) -> Optional[str]:
+        """
+        The path of the file the body is sent from, None for an in-memory body.
+        """
+        return os.fspath(self.body) if isinstance(self.body, os.PathLike) else None
+
+    def prepare(self, codec: Union[str, JsonCodec, None] = None) -> "MockResponse":
+        """
+        Serialize the response once, for every request it answers.
+
+        The status line, headers and body are joined into one buffer per connection state, so
+        answering a request is a lookup and a single write. The head of a file body is built
+        with the size of the file, its content is sent with `sendfile` for every request. The
+        response must not be changed once prepared.
+
+        Args:
+            codec (Union[str, JsonCodec, None]): The JSON codec of a non-byte body.
+
+        Returns:
+            MockResponse: The response itself.
+        """
+        self._messages = None
+        include = (False,) if self.file is not None else (False, True)
+        self._messages = {(keep_alive, include_body): self.encode(keep_alive, include_body, codec)
+                          for keep_alive in (True, False) for include_body in include}
+        return self
+
+    def encode(self, keep_alive: bool = True, include_body: bool = True,
+               codec: Union[str, JsonCodec, None] = None) -> bytes:
+        """
+        Serialize the response into an HTTP/1.1 message.
+
+        Args:
+            keep_alive (bool): If False, tell the client the connection is closed after it.
+            include_body (bool): If False, send the headers only, for a HEAD request.
+            codec (Union[str, JsonCodec, None]): The JSON codec of non-byte bodies.
+
+        Returns:
+            bytes: The status line, headers and body.
+        """
+        if self._messages is not None:
+            message = self._messages.get((keep_alive, include_body))
+            if message is not None:
+                return message
+        body, content_type = self.body, self.content_type
+        if body is None:
+            body = b""
+        elif isinstance(body, os.PathLike):
+            content_type = content_type or mimetypes.guess_type(body)[0] \
+                or "application/octet-stream"
+            if include_body:
+                with open(body, "rb") as file:
+                    body = file.read()
+            else:
+                return self._head(os.path.getsize(body), content_type, keep_alive)
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+            content_type = content_type or "text/plain; charset=utf-8"
+        elif not isinstance(body, (bytes, bytearray, memoryview)):
+            body = get_codec(codec).dumps(body)
+            content_type = content_type or "application/json"
+        head = self._head(len(body), content_type, keep_alive)
+        return head + body if include_body and body else head
+
+    def _head(self, length: int, content_type: Optional[str], keep_alive: bool) -> bytes:
+        lines = [f"HTTP/1.1 {self.status} {REASONS.get(self.status, '')}"]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        lines.append(f"Content-Length: {length}")
+        if not keep_alive:
+            lines.append("Connection: close")
+        lines.extend(f"{key}: {value}" for key, value in self.headers)
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+class Framing(NamedTuple):
+    """
+    How the body of a request is delimited and whether the connection is kept alive after it.
+    """
+    length: int
+    chunked: bool
+    keep_alive: bool
+
+
+class Fault(NamedTuple):
+    """
+    A response sent late, slowly, or not at all, returned by a handler instead of the response.
+
+    Faults are played on the event loop, so a stalled or dripping connection costs a pending
+    task and never blocks the other connections.
+
+    Attributes:
+        response (MockResponse): The response eventually sent.
+        delay (float): Seconds to wait before answering. Default: 0.
+        reset (bool): Reset the connection after the delay instead of answering.
+        stall (Optional[float]): Seconds to hang after the delay, `math.inf` to never answer.
+        drip (Optional[Tuple[int, float]]): Send the body a number of bytes at a time, waiting
+            a number of seconds between writes.
+    """
+    response: "MockResponse"
+    delay: float = 0.0
+    reset: bool = False
+    stall: Optional[float] = None
+    drip: Optional[Tuple[int, float]] = None
+
+
+def parse_head(buffer: bytearray, start: int, end: int) -> Tuple[MockRequest, Framing]:
+    """
+    Parse the request line and the framing headers of a request.
+
+    Args:
+        buffer (bytearray): The received bytes.
+        start (int): The offset of the request line.
+        end (int): The offset of the empty line terminating the headers.
+
+    Returns:
+        Tuple[MockRequest, Framing]: The request, without its body, and its framing.
+
+    Raises:
+        BadRequest: If the request line or the `Content-Length` is malformed.
+    """
+    line_end = buffer.find(b"\r\n", start, end)
+    if line_end < 0:
+        line_end = end
+    parts = buffer[start:line_end].decode("latin-1").split(" ")
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise BadRequest()
+    fields = bytes(buffer[line_end + 2:end])
+    # A leading newline lets the first header be found like the others.
+    lowered = b"\n" + fields.lower()
+    length = _field(lowered, b"content-length")
+    try:
+        length = int(length) if length is not None else 0
+    except ValueError as error:
+        raise BadRequest() from error
+    if length < 0:
+        raise BadRequest()
+    chunked = b"chunked" in (_field(lowered, b"transfer-encoding") or b"")
+    connection = _field(lowered, b"connection") or b""
+    if parts[2] == "HTTP/1.0":
+        keep_alive = b"keep-alive" in connection
+    else:
+        keep_alive = b"close" not in connection
+    return MockRequest(parts[0].upper(), parts[1], parts[2], fields), \
+        Framing(length, chunked, keep_alive)
+
+
+def _field(lowered: bytes, name: bytes) -> Optional[bytes]:
+    start = lowered.find(b"\n" + name + b":")
+    if start < 0:
+        return None
+    start += len(name) + 2
+    end = lowered.find(b"\r", start)
+    return lowered[start:end if end >= 0 else None].strip()
+
+
+def parse_chunked(buffer: bytearray, offset: int) -> Optional[Tuple[bytes, int]]:
+    """
+    Parse a chunked body, ignoring chunk extensions and trailers.
+
+    Args:
+        buffer (bytearray): The received bytes.
+        offset (int): The offset of the first chunk size line.
+
+    Returns:
+        Optional[Tuple[bytes, int]]: The body and the offset after it, None if incomplete.
+
+    Raises:
+        BadRequest: If a chunk size is malformed.
+    """
+    chunks = []
+    while True:
+        line_end = buffer.find(b"\r\n", offset)
+        if line_end < 0:
+            return None
+        try:
+            size = int(buffer[offset:line_end].split(b";", 1)[0], 16)
+        except ValueError as error:
+            raise BadRequest() from error
+        if size < 0:
+            raise BadRequest()
+        offset = line_end + 2
+        if size == 0:
+            trailers_end = buffer.find(b"\r\n", offset)
+            while trailers_end > offset:
+                offset = trailers_end + 2
+                trailers_end = buffer.find(b"\r\n", offset)
+            if trailers_end < 0:
+                return None
+            return b"".join(chunks), trailers_end + 2
+        if len(buffer) < offset + size + 2:
+            return None
+        chunks.append(bytes(buffer[offset:offset + size]))
+        offset += size + 2
+
+
+class MockProtocol(asyncio.Protocol):
+    """
+    Serves the HTTP/1.1 requests of one connection.
+
+    Requests are parsed straight from the receive buffer, so every request pipelined in one
+    read is answered with a single write, in order. Connections are kept alive unless the
+    client asks otherwise. Once a handler returns a `Fault`, a file response or an awaitable,
+    the requests after it wait in `deferred` and are answered in order by a task, which waits
+    for awaitables and sends files with `sendfile`.
+
+    Args:
+        server (MockServer): The server the connection was accepted by.
+    """
+
+    def __init__(self, server: "MockServer"):
+        self.server = server
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = bytearray()
+        self.pending: Optional[Tuple[MockRequest, Framing, int]] = None
+        self.deferred: Deque[Tuple[Optional[MockRequest], bool, Any]] = deque()
+        self.task: Optional[asyncio.Task] = None
+        self._write_paused = False
+        self._deferred_paused = False
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.server.connections.add(self)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.server.connections.discard(self)
+        self.transport = None
+        if self.task is not None:
+            self.task.cancel()
+        for _, _, response in self.deferred:
+            if inspect.iscoroutine(response):
+                response.close()
+
+    def pause_writing(self) -> None:
+        self._write_paused = True
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self._write_paused = False
+        self._resume_reading()
+
+    def _resume_reading(self) -> None:
+        """
+        Read again once neither the write buffer nor the deferred requests are full.
+        """
+        if not (self._write_paused or self._deferred_paused) and self.transport is not None:
+            self.transport.resume_reading()
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        responses: List[bytes] = []
+        offset = 0
+        close = False
+        deferred = self.deferred
+        try:
+            while not close:
+                parsed = self._next_request(offset)
+                if parsed is None:
+                    break
+                request, keep_alive, offset = parsed
+                close = not keep_alive
+                response = self.server.handle(request)
+                if deferred or isinstance(response, Fault) or inspect.isawaitable(response) \
+                        or response.file is not None:
+                    deferred.append((request, keep_alive, response))
+                else:
+                    responses.append(self.server.encode(response, request, keep_alive))
+        except BadRequest as error:
+            deferred.append((None, False, MockResponse(error.status, error.args[0])))
+            close = True
+        del self.buffer[:offset]
+        if responses:
+            self.transport.write(b"".join(responses))
+        if deferred:
+            if self.task is None:
+                self.task = asyncio.get_running_loop().create_task(self._answer_deferred())
+            if len(deferred) >= MAX_DEFERRED:
+                self._deferred_paused = True
+                self.transport.pause_reading()
+        elif close:
+            self.transport.close()
+
+    async def _answer_deferred(self) -> None:
+        """
+        Answer the deferred requests in order, playing their faults.
+        """
+        try:
+            while self.deferred:
+                request, keep_alive, response = self.deferred[0]
+                if inspect.isawaitable(response):
+                    response = await self.server.resolve(response)
+                if isinstance(response, Fault):
+                    if not await self._play(response, request, keep_alive):
+                        return
+                elif response.file is not None and request.method != "HEAD":
+                    if not await self._send_file(response, keep_alive):
+                        return
+                else:
+                    self.transport.write(self.server.encode(response, request, keep_alive))
+                self.deferred.popleft()
+                if not keep_alive:
+                    self.transport.close()
+                    return
+                if self._deferred_paused and len(self.deferred) < MAX_DEFERRED:
+                    self._deferred_paused = False
+                    self._resume_reading()
+        finally:
+            self.task = None
+
+    async def _play(self, fault: Fault, request: MockRequest, keep_alive: bool) -> bool:
+        """
+        Send the response of a fault, False if the connection was reset instead.
+        """
+        if fault.delay > 0:
+            await asyncio.sleep(fault.delay)
+        if fault.reset:
+            self.reset()
+            return False
+        if fault.stall is not None:
+            if fault.stall == math.inf:
+                await asyncio.get_running_loop().create_future()
+            await asyncio.sleep(fault.stall)
+        message = self.server.encode(fault.response, request, keep_alive)
+        if fault.drip is None:
+            self.transport.write(message)
+            return True
+        size, interval = fault.drip
+        start = message.find(b"\r\n\r\n") + 4
+        self.transport.write(message[:start])
+        for offset in range(start, len(message), max(size, 1)):
+            await asyncio.sleep(interval)
+            self.transport.write(message[offset:offset + max(size, 1)])
+        return True
+
+    async def _send_file(self, response: MockResponse, keep_alive: bool) -> bool:
+        """
+        Send the head of a file response, then the file with `sendfile`, False if the file
+        could not be sent and the connection was aborted.
+        """
+        self.transport.write(response.encode(keep_alive, False, self.server.codec))
+        try:
+            with open(response.file, "rb") as file:
+                await asyncio.get_running_loop().sendfile(self.transport, file)
+        except (OSError, RuntimeError):
+            if self.transport is not None:
+                self.transport.abort()
+            return False
+        return True
+
+    def reset(self) -> None:
+        """
+        Abort the connection with a TCP reset instead of an orderly close.
+        """
+        sock = self.transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.transport.abort()
+
+    def _next_request(self, offset: int) -> Optional[Tuple[MockRequest, bool, int]]:
+        """
+        Parse the request starting at `offset`, None until it has been received completely.
+
+        Returns:
+            Optional[Tuple[MockRequest, bool, int]]: The request, whether the connection is
+                kept alive after it and the offset of the next request.
+        """
+        buffer = self.buffer
+        if self.pending is None:
+            head_end = buffer.find(b"\r\n\r\n", offset)
+            if head_end < 0:
+                if len(buffer) - offset > MAX_HEAD_SIZE:
+                    raise BadRequest(431)
+                return None
+            request, framing = parse_head(buffer, offset, head_end)
+            self.pending = (request, framing, head_end + 4 - offset)
+        request, framing, body_start = self.pending
+        body_start += offset
+        if framing.chunked:
+            parsed = parse_chunked(buffer, body_start)
+            if parsed is None:
+                return None
+            request.body, end = parsed
+        else:
+            end = body_start + framing.length
+            if len(buffer) < end:
+                return None
+            if framing.length:
+                request.body = bytes(buffer[body_start:end])
+        self.pending = None
+        return request, framing.keep_alive, end
+
+
+def server_error(error: Exception) -> MockResponse:
+    """
+    The response to a request whose handler failed.
+    """
+    return MockResponse(500, {"error": f"{type(error).__name__}: {error}"})
+
+
+class MockServer:
+    """
+    An asyncio HTTP/1.1 server answering every request with a handler.
+
+    Args:
+        handler (Handler): Builds the response to a request, or returns an awaitable of it
+            when building it must wait, answered in order once it is done.
+        host (str): The host to listen on. Default: "localhost".
+        port (int): The port to listen on, 0 for any free port. Default: 8888.
+        backlog (int): The maximum number of pending connections. Default: 1024.
+        codec (Union[str, JsonCodec, None]): The JSON codec of response bodies.
+        reuse_port (bool): Set `SO_REUSEPORT`, so several processes can listen on the port.
+            Default: False.
+
+    Attributes:
+        requests (int): The number of requests answered.
+        connections (Set[MockProtocol]): The open connections.
+
+    Example:
+        with MockServer(lambda request: MockResponse(body={"ok": True}), port=0) as server:
+            requests.get(f"http://localhost:{server.port}/")
+    """
+
+    def __init__(self, handler: Handler, host: str = "localhost", port: int = 8888,
+                 backlog: int = 1024, codec: Union[str, JsonCodec, None] = None, *,
+                 reuse_port: bool = False):
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.reuse_port = reuse_port
+        self.codec = get_codec(codec)
+        self.requests = 0
+        self.connections: Set[MockProtocol] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def handle(self, request: MockRequest) -> Union[Answer, Awaitable[Answer]]:
+        """
+        Build the response to a request, a 500 response if the handler fails.
+        """
+        self.requests += 1
+        try:
+            return self.handler(request)
+        except Exception as error:  # pylint: disable=broad-except
+            return server_error(error)
+
+    @staticmethod
+    async def resolve(pending: Awaitable[Answer]) -> Answer:
+        """
+        Wait for a response returned as an awaitable, a 500 response if it fails.
+        """
+        try:
+            return await pending
+        except Exception as error:  # pylint: disable=broad-except
+            return server_error(error)
+
+    def encode(self, response: MockResponse, request: Optional[MockRequest],
+               keep_alive: bool) -> bytes:
+        """
+        Serialize the response to a request, without a body for a HEAD request.
+        """
+        include_body = request is None or request.method != "HEAD"
+        return response.encode(keep_alive, include_body, self.codec)
+
+    async def start(self) -> None:
+        """
+        Start listening, the port is updated when listening on any free port.
+        """
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: MockProtocol(self), self.host,
+                                                self.port, backlog=self.backlog,
+                                                reuse_port=self.reuse_port or None)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def shutdown(self) -> None:
+        """
+        Stop listening, ending `serve_forever`, from a callback or signal handler of the loop.
+        """
+        if self._server is not None:
+            self._server.close()
+
+    async def serve_forever(self) -> None:
+        """
+        Start listening if needed and serve until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stop listening and close every open connection.
+        """
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self.connections):
+                if connection.transport is not None:
+                    connection.transport.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def start_background(self) -> "MockServer":
+        """
+        Serve from an event loop in a daemon thread, returning once the server listens.
+        """
+        started = threading.Event()
+        errors: List[BaseException] = []
+
+        async def serve():
+            try:
+                await self.start()
+            except OSError as error:
+                errors.append(error)
+                return
+            finally:
+                started.set()
+            try:
+                await self._server.serve_forever()
+            except asyncio.CancelledError:
+                pass
+            finally:
+                await self.close()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_until_complete, args=(serve(),),
+                                        name="getman-mock", daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            self._thread.join()
+            raise errors[0]
+        return self
+
+    def stop_background(self) -> None:
+        """
+        Stop a server started with `start_background` and wait for its thread.
+        """
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self.shutdown)
+        self._thread.join()
+        self._loop.close()
+        self._thread = self._loop = None
+
+    def __enter__(self) -> "MockServer":
+        return self if self._thread is not None else self.start_background()
+
+    def __exit__(self, *args) -> None:
+        self.stop_background()
@@ -0,0 +1,186 @@
+import asyncio
+import multiprocessing
+import signal
+import socket
+from queue import Empty
+from typing import Any, List, Optional
+
+from getman.mock.server import Handler, MockRequest, MockResponse, MockServer
+
+START_TIMEOUT = 10.0
+
+
+def reserve_port(host: str, port: int) -> socket.socket:
+    """
+    Bind, without listening, a `SO_REUSEPORT` socket on the address the workers share.
+
+    Holding the socket keeps a port chosen by the system, for port 0, reserved until every
+    worker listens on it. A socket that does not listen is never given connections.
+    """
+    family = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][0]
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def counted(handler: Handler, counter: Any, slot: int) -> Handler:
+    """
+    Wrap a handler to count the requests of a worker in its slot of a shared array.
+    """
+    def handle(request: MockRequest) -> MockResponse:
+        counter[slot] += 1
+        return handler(request)
+    return handle
+
+
+def serve_worker(server: MockServer, ready: Any) -> None:
+    """
+    Serve in a worker process until it receives SIGTERM or SIGINT.
+
+    Args:
+        server (MockServer): The server of the worker, listening with `reuse_port`.
+        ready (Any): A queue told None once the server listens, or the error it failed with.
+    """
+    async def serve():
+        try:
+            await server.start()
+        except OSError as error:
+            ready.put(f"{type(error).__name__}: {error}")
+            return
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, server.shutdown)
+        ready.put(None)
+        try:
+            await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await server.close()
+
+    asyncio.run(serve())
+
+
+class MockCluster:
+    """
+    Forks worker processes serving the same handler on one port with `SO_REUSEPORT`.
+
+    The kernel spreads the connections of the port across the workers, so the mock scales
+    with the cores of the machine instead of becoming the bottleneck of a load test. Each
+    worker counts its requests in its own slot of a shared array, which the parent sums.
+
+    The workers are forked, so they serve the handler and mocks as they were when the cluster
+    started, later changes in the parent are not seen by the workers.
+
+    Args:
+        handler (Handler): Builds the response to a request.
+        workers (int): The number of worker processes.
+        host (str): The host to listen on. Default: "localhost".
+        port (int): The port to listen on, 0 for any free port. Default: 8888.
+        backlog (int): The maximum number of pending connections per worker. Default: 1024.
+        codec: The JSON codec of response bodies.
+
+    Raises:
+        ValueError: If the platform cannot fork or does not support `SO_REUSEPORT`.
+
+    Example:
+        with MockMan(port=0, workers=4).start() as cluster:
+            run_load(...)
+            print(cluster.requests)
+    """
+
+    def __init__(self, handler: Handler, workers: int, host: str = "localhost",
+                 port: int = 8888, backlog: int = 1024, codec: Any = None):
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("Mock workers need SO_REUSEPORT, which this platform lacks.")
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("Mock workers are forked, which this platform does not support.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.handler = handler
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.codec = codec
+        self._context = multiprocessing.get_context("fork")
+        self._counter = self._context.RawArray("Q", workers)
+        self._processes: List[multiprocessing.Process] = []
+
+    @property
+    def requests(self) -> int:
+        """
+        The number of requests answered by every worker.
+        """
+        return sum(self._counter)
+
+    def worker_requests(self) -> List[int]:
+        """
+        The number of requests answered by each worker.
+        """
+        return list(self._counter)
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the workers have been started and not stopped.
+        """
+        return bool(self._processes)
+
+    def start_background(self) -> "MockCluster":
+        """
+        Fork the workers, returning once every one of them listens.
+
+        Raises:
+            OSError: If a worker failed to listen, the other workers are stopped.
+        """
+        reserved = reserve_port(self.host, self.port)
+        self.port = reserved.getsockname()[1]
+        ready = self._context.Queue()
+        try:
+            for slot in range(self.workers):
+                server = MockServer(counted(self.handler, self._counter, slot), self.host,
+                                    self.port, self.backlog, self.codec, reuse_port=True)
+                process = self._context.Process(target=serve_worker, args=(server, ready),
+                                                name=f"getman-mock-{slot}", daemon=True)
+                process.start()
+                self._processes.append(process)
+            errors = [error for error in (self._wait(ready) for _ in self._processes) if error]
+        finally:
+            reserved.close()
+        if errors:
+            self.stop_background()
+            raise OSError(f"Mock workers failed to start: {errors[0]}")
+        return self
+
+    @staticmethod
+    def _wait(ready: Any) -> Optional[str]:
+        try:
+            return ready.get(timeout=START_TIMEOUT)
+        except Empty:
+            return "timed out"
+
+    def join(self) -> None:
+        """
+        Wait for the workers to exit.
+        """
+        for process in self._processes:
+            process.join()
+
+    def stop_background(self) -> None:
+        """
+        Stop the workers and wait for them to exit. The request counters are kept.
+        """
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def __enter__(self) -> "MockCluster":
+        return self if self.running else self.start_background()
+
+    def __exit__(self, *args) -> None:
+        self.stop_background()
@@ -1 +1,5 @@
-from .struct import Struct
+from .columns import Column, ColumnBatch, Mask
+from .histogram import LatencyHistogram
+from .record import Record, RecordRegistry, record_type
+from .request import CompiledRequest
+from .struct import LazyList, LazyStruct, Struct
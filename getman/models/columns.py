@@ -0,0 +1,490 @@
+import math
+import operator
+from array import array
+from itertools import chain, compress, repeat
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Sequence)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
+BACKENDS = ("auto", "array", "numpy")
+
+TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+
+DTYPES = {"bool": "bool", "int": "int64", "float": "float64"}
+
+_NONE = type(None)
+
+
+def _backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown column backend: {backend!r}, expected one of {BACKENDS}.")
+    if backend == "auto":
+        return "numpy" if numpy is not None else "array"
+    if backend == "numpy" and numpy is None:
+        raise ValueError("The numpy column backend requires NumPy to be installed.")
+    return backend
+
+
+class Mask:
+    """
+    A boolean value per row, returned by the comparisons of a `Column` and used to filter.
+
+    Masks combine with `&`, `|` and `~`. The values are an `array("b")` of 0 and 1, or a NumPy
+    boolean array with the numpy backend.
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[bool]:
+        return map(bool, self.values)
+
+    def __repr__(self):
+        return f"Mask({self.count()}/{len(self)})"
+
+    def _combine(self, other: "Mask", function: Callable[[Any, Any], Any]) -> "Mask":
+        if len(other) != len(self):
+            raise ValueError("Masks have different lengths.")
+        if isinstance(self.values, array):
+            return Mask(array("b", map(function, self.values, other.values)))
+        return Mask(function(self.values, other.values))
+
+    def __and__(self, other: "Mask") -> "Mask":
+        return self._combine(other, operator.and_)
+
+    def __or__(self, other: "Mask") -> "Mask":
+        return self._combine(other, operator.or_)
+
+    def __invert__(self) -> "Mask":
+        if isinstance(self.values, array):
+            return Mask(array("b", map(operator.not_, self.values)))
+        return Mask(~self.values)
+
+    def all(self) -> bool:
+        """
+        Whether every row is True, True for an empty mask.
+        """
+        if isinstance(self.values, array):
+            return all(self.values)
+        return bool(self.values.all())
+
+    def any(self) -> bool:
+        """
+        Whether any row is True.
+        """
+        if isinstance(self.values, array):
+            return any(self.values)
+        return bool(self.values.any())
+
+    def count(self) -> int:
+        """
+        The number of True rows.
+        """
+        if isinstance(self.values, array):
+            return self.values.count(1)
+        return int(self.values.sum())
+
+    def indices(self) -> List[int]:
+        """
+        The positions of the True rows, for example to report which records failed a check.
+        """
+        return list(compress(range(len(self.values)), self.values))
+
+
+class Column:
+    """
+    The values of one field across a list of records.
+
+    Integer, float and boolean fields are stored in a typed `array`, or a NumPy array with
+    the numpy backend, so comparisons, filters and aggregates run in C rather than once per
+    record in Python. Missing and null values are recorded in `nulls` and stored as 0, they
+    never match a comparison and are skipped by aggregates. Other fields, such as strings,
+    are kept in a list.
+
+    Attributes:
+        name (str): The dotted path of the field, for example "price.amount".
+        kind (str): "int", "float", "bool" or "object".
+        values: The values, an `array`, a NumPy array or a list for object columns.
+        nulls: 1 for every missing or null value, an `array("b")` or a NumPy boolean array.
+    """
+    __slots__ = ("name", "kind", "values", "nulls")
+
+    def __init__(self, name: str, kind: str, values, nulls):
+        self.name = name
+        self.kind = kind
+        self.values = values
+        self.nulls = nulls
+
+    @classmethod
+    def from_values(cls, name: str, values: Sequence[Any], backend: str = "auto") -> "Column":
+        """
+        Build a column from Python values, None for missing values.
+
+        Args:
+            name (str): The name of the column.
+            values (Sequence[Any]): The values.
+            backend (str): "array", "numpy" or "auto" for NumPy when it is installed.
+
+        Returns:
+            Column: The column, typed after the non-null values.
+        """
+        backend = _backend(backend)
+        values = list(values)
+        types = set(map(type, values))
+        if _NONE in types:
+            types.discard(_NONE)
+            nulls = array("b", map(operator.is_, values, repeat(None)))
+        else:
+            nulls = array("b", bytes(len(values)))
+        if not types:
+            kind = "object"
+        elif types <= {bool}:
+            kind = "bool"
+        elif types <= {int}:
+            kind = "int"
+        elif types <= {int, float}:
+            kind = "float"
+        else:
+            kind = "object"
+
+        if kind != "object":
+            filled = [0 if value is None else value for value in values] if nulls.count(1) \
+                else values
+            try:
+                values = array(TYPECODES[kind], filled)
+            except OverflowError:
+                kind = "object"
+        if backend == "numpy":
+            if kind != "object":
+                values = numpy.frombuffer(values, dtype=DTYPES[kind])
+            nulls = numpy.frombuffer(nulls, dtype=bool)
+        return cls(name, kind, values, nulls)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        if self.nulls[index]:
+            return None
+        value = self.values[index]
+        if self.kind == "bool":
+            return bool(value)
+        return value.item() if not self._is_array() and self.kind != "object" else value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_list())
+
+    def __repr__(self):
+        return f"Column({self.name!r}, kind={self.kind!r}, rows={len(self)})"
+
+    @property
+    def numeric(self) -> bool:
+        """
+        Whether the column holds integers or floats.
+        """
+        return self.kind in ("int", "float")
+
+    def _is_array(self) -> bool:
+        return isinstance(self.nulls, array)
+
+    def _mask(self, values) -> Mask:
+        """
+        Wrap a per-row result as a mask, clearing the null rows.
+        """
+        if self._is_array():
+            values = values if isinstance(values, array) else array("b", values)
+            if self.nulls.count(1):
+                # For 0 and 1, value > null is value and not null.
+                values = array("b", map(operator.gt, values, self.nulls))
+            return Mask(values)
+        if not isinstance(values, numpy.ndarray):
+            values = numpy.fromiter(values, dtype=bool, count=len(self))
+        return Mask(values & ~self.nulls)
+
+    def compare(self, op: Callable[[Any, Any], Any], value: Any) -> Mask:
+        """
+        Compare every value with `value`, null values never match.
+
+        Args:
+            op (Callable[[Any, Any], Any]): A comparison from the `operator` module.
+            value (Any): The value compared with.
+
+        Returns:
+            Mask: The rows for which the comparison is true.
+        """
+        if self.kind == "object":
+            return self._mask([not null and bool(op(item, value))
+                               for item, null in zip(self.values, self.nulls)])
+        if self._is_array():
+            return self._mask(map(op, self.values, repeat(value)))
+        return self._mask(op(self.values, value))
+
+    def eq(self, value: Any) -> Mask:
+        """
+        The rows equal to `value`.
+        """
+        return self.compare(operator.eq, value)
+
+    def ne(self, value: Any) -> Mask:
+        """
+        The non-null rows not equal to `value`.
+        """
+        return self.compare(operator.ne, value)
+
+    def gt(self, value: Any) -> Mask:
+        """
+        The rows greater than `value`.
+        """
+        return self.compare(operator.gt, value)
+
+    def ge(self, value: Any) -> Mask:
+        """
+        The rows greater than or equal to `value`.
+        """
+        return self.compare(operator.ge, value)
+
+    def lt(self, value: Any) -> Mask:
+        """
+        The rows less than `value`.
+        """
+        return self.compare(operator.lt, value)
+
+    def le(self, value: Any) -> Mask:
+        """
+        The rows less than or equal to `value`.
+        """
+        return self.compare(operator.le, value)
+
+    def between(self, low: Any, high: Any) -> Mask:
+        """
+        The rows between `low` and `high`, both included.
+        """
+        return self.ge(low) & self.le(high)
+
+    def isin(self, values: Iterable[Any]) -> Mask:
+        """
+        The rows whose value is one of `values`.
+        """
+        values = list(values)
+        if self.kind == "object" or self._is_array():
+            try:
+                lookup = frozenset(values).__contains__
+            except TypeError:
+                lookup = values.__contains__
+            return self._mask(array("b", map(lookup, self.values)))
+        return self._mask(numpy.isin(self.values, values))
+
+    def is_null(self) -> Mask:
+        """
+        The rows whose value is missing or null.
+        """
+        return Mask(array("b", self.nulls) if self._is_array() else self.nulls.copy())
+
+    def filter(self, mask: Mask) -> "Column":
+        """
+        Keep the rows selected by a mask.
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"The mask has {len(mask)} rows, column {self.name!r} has "
+                             f"{len(self)}.")
+        if self._is_array():
+            values = list(compress(self.values, mask.values)) if self.kind == "object" \
+                else array(self.values.typecode, compress(self.values, mask.values))
+            return Column(self.name, self.kind, values,
+                          array("b", compress(self.nulls, mask.values)))
+        selected = numpy.asarray(mask.values, dtype=bool)
+        values = list(compress(self.values, selected)) if self.kind == "object" \
+            else self.values[selected]
+        return Column(self.name, self.kind, values, self.nulls[selected])
+
+    def _valid(self):
+        """
+        The non-null values.
+        """
+        if self._is_array():
+            return compress(self.values, map(operator.not_, self.nulls)) \
+                if self.nulls.count(1) else self.values
+        if self.kind == "object":
+            return compress(self.values, ~self.nulls)
+        return self.values[~self.nulls]
+
+    def _require_numeric(self) -> None:
+        if not self.numeric:
+            raise TypeError(f"Column {self.name!r} is not numeric, it holds {self.kind} values.")
+
+    def count(self) -> int:
+        """
+        The number of non-null values.
+        """
+        return len(self) - self.null_count()
+
+    def null_count(self) -> int:
+        """
+        The number of missing or null values.
+        """
+        return self.nulls.count(1) if self._is_array() else int(self.nulls.sum())
+
+    def sum(self) -> float:
+        """
+        The sum of the non-null values.
+
+        Raises:
+            TypeError: If the column is not numeric.
+        """
+        self._require_numeric()
+        if self._is_array():
+            return math.fsum(self.values) if self.kind == "float" else sum(self.values)
+        return self.values.sum().item()
+
+    def mean(self) -> Optional[float]:
+        """
+        The mean of the non-null values, None if there are none.
+        """
+        count = self.count()
+        return self.sum() / count if count else None
+
+    def min(self) -> Any:
+        """
+        The smallest non-null value, None if there are none.
+        """
+        return self._extreme(min)
+
+    def max(self) -> Any:
+        """
+        The largest non-null value, None if there are none.
+        """
+        return self._extreme(max)
+
+    def _extreme(self, function: Callable[..., Any]) -> Any:
+        if not self.count():
+            return None
+        valid = self._valid()
+        if numpy is not None and isinstance(valid, numpy.ndarray):
+            return (valid.min() if function is min else valid.max()).item()
+        value = function(valid)
+        return bool(value) if self.kind == "bool" else value
+
+    def to_list(self) -> List[Any]:
+        """
+        The values as Python objects, None for null values.
+        """
+        values = self.values.tolist() if self.kind != "object" else list(self.values)
+        if self.kind == "bool":
+            values = list(map(bool, values))
+        if self.null_count():
+            values = [None if null else value for value, null in zip(values, self.nulls)]
+        return values
+
+
+class ColumnBatch:
+    """
+    A columnar view of a list of JSON objects, one `Column` per field.
+
+    Nested objects are flattened into dotted names, so `{"price": {"amount": 1}}` gives the
+    column "price.amount". Checks across thousands of records run once per column instead
+    of once per record.
+
+    Args:
+        columns (Dict[str, Column]): The columns by name, all of the same length.
+
+    Example:
+        batch = ColumnBatch.from_records(response.json())
+        assert batch["price.amount"].gt(0).all()
+        cheap = batch.filter(batch["price.amount"].lt(10))
+        print(cheap["quantity"].sum())
+    """
+
+    def __init__(self, columns: Dict[str, Column]):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Columns have different lengths.")
+        self.columns = columns
+        self.length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(
+            cls,
+            records: Iterable[Any],
+            fields: Optional[Iterable[str]] = None,
+            backend: str = "auto",
+    ) -> "ColumnBatch":
+        """
+        Build the columns of a list of JSON objects.
+
+        Args:
+            records (Iterable[Any]): The decoded objects, items that are not objects give
+                null values.
+            fields (Optional[Iterable[str]]): The dotted names of the columns to build.
+                Defaults to every field found in the records.
+            backend (str): "array", "numpy" or "auto" for NumPy when it is installed.
+
+        Returns:
+            ColumnBatch: The batch.
+        """
+        rows = list(records)
+        if not all(isinstance(row, dict) for row in rows):
+            rows = [row if isinstance(row, dict) else {} for row in rows]
+        if fields is None:
+            columns: Dict[str, Column] = {}
+            _collect(rows, "", backend, columns)
+            return cls(columns)
+        return cls({field: Column.from_values(field, _extract(rows, field.split(".")), backend)
+                    for field in fields})
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __repr__(self):
+        return f"ColumnBatch(rows={self.length}, columns={list(self.columns)})"
+
+    def filter(self, mask: Mask) -> "ColumnBatch":
+        """
+        Keep the rows selected by a mask in every column.
+        """
+        return ColumnBatch({name: column.filter(mask) for name, column in self.columns.items()})
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        The values of every column as Python lists.
+        """
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+
+def _collect(rows: List[Dict[str, Any]], prefix: str, backend: str,
+             columns: Dict[str, Column]) -> None:
+    """
+    Build a column for every field of the rows, in the order the fields first appear, and
+    recurse into the fields holding objects.
+    """
+    for key in dict.fromkeys(chain.from_iterable(map(dict.keys, rows))):
+        values = [row.get(key) for row in rows]
+        types = set(map(type, values))
+        if dict not in types or types - {dict, _NONE}:
+            columns[prefix + key] = Column.from_values(prefix + key, values, backend)
+        if dict in types:
+            nested = [value if isinstance(value, dict) else {} for value in values]
+            _collect(nested, f"{prefix}{key}.", backend, columns)
+
+
+def _extract(rows: List[Dict[str, Any]], path: List[str]) -> List[Any]:
+    values = [row.get(path[0]) for row in rows]
+    for key in path[1:]:
+        values = [value.get(key) if isinstance(value, dict) else None for value in values]
+    return values
@@ -0,0 +1,185 @@
+import threading
+from array import array
+from typing import Dict, Iterable
+
+MICROSECONDS = 1_000_000
+
+
+class LatencyHistogram:
+    """
+    A fixed-memory, log-bucketed latency histogram in the style of HdrHistogram.
+
+    Latencies are stored as microsecond counts in buckets whose width doubles with each power
+    of two, and each power of two is split into linear sub-buckets. Every recorded value is
+    therefore kept within a relative error of about 1% with two significant figures, and the
+    memory used depends only on the trackable range, never on the number of values recorded.
+
+    Histograms are thread-safe, picklable and can be merged, so per-thread or per-process
+    histograms can be combined into one view.
+
+    Args:
+        highest (float): The highest trackable latency in seconds, larger values are
+            clamped to it. Default: 3600.
+        significant_figures (int): The number of significant decimal digits kept. Default: 2.
+
+    Example:
+        histogram = LatencyHistogram()
+        histogram.record(0.120)
+        histogram.percentile(99)  # 0.1201...
+    """
+
+    def __init__(self, highest: float = 3600.0, significant_figures: int = 2):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5.")
+        self.highest = highest
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        self._sub_bucket_half_magnitude = (largest_single_unit - 1).bit_length() - 1
+        self._sub_bucket_count = 1 << (self._sub_bucket_half_magnitude + 1)
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._highest_value = max(int(highest * MICROSECONDS), self._sub_bucket_count)
+        self._max_index = self._index_for(self._highest_value)
+
+        self.counts = array("Q", bytes(8 * (self._max_index + 1)))
+        self.total = 0
+        self.sum = 0
+        self.min_value = 0
+        self.max_value = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.total
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """
+        Record a latency.
+
+        Args:
+            seconds (float): The latency in seconds.
+            count (int): The number of times to record it. Defaults to 1.
+        """
+        value = min(max(int(seconds * MICROSECONDS), 0), self._highest_value)
+        index = self._index_for(value)
+        with self._lock:
+            self.counts[index] += count
+            self.total += count
+            self.sum += value * count
+            if self.total == count or value < self.min_value:
+                self.min_value = value
+            self.max_value = max(self.max_value, value)
+
+    def record_many(self, latencies: Iterable[float]) -> None:
+        """
+        Record several latencies, in seconds.
+        """
+        for seconds in latencies:
+            self.record(seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the values recorded by another histogram with the same layout.
+
+        Raises:
+            ValueError: If the histograms track different ranges or precisions.
+        """
+        if len(other.counts) != len(self.counts):
+            raise ValueError("Cannot merge histograms with different layouts.")
+        if not other.total:
+            return
+        with self._lock:
+            for index, count in enumerate(other.counts):
+                if count:
+                    self.counts[index] += count
+            self.min_value = other.min_value if not self.total else min(
+                self.min_value, other.min_value
+            )
+            self.total += other.total
+            self.sum += other.sum
+            self.max_value = max(self.max_value, other.max_value)
+
+    def reset(self) -> None:
+        """
+        Remove every recorded value.
+        """
+        with self._lock:
+            self.counts = array("Q", bytes(8 * len(self.counts)))
+            self.total = self.sum = self.min_value = self.max_value = 0
+
+    @property
+    def min(self) -> float:
+        """The lowest recorded latency in seconds."""
+        return self.min_value / MICROSECONDS
+
+    @property
+    def max(self) -> float:
+        """The highest recorded latency in seconds."""
+        return self.max_value / MICROSECONDS
+
+    @property
+    def mean(self) -> float:
+        """The mean recorded latency in seconds."""
+        return self.sum / self.total / MICROSECONDS if self.total else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile.
+
+        Args:
+            percent (float): The percentile between 0 and 100.
+
+        Returns:
+            float: The latency in seconds below which `percent` of the values fall,
+                0.0 if nothing was recorded.
+        """
+        if not self.total:
+            return 0.0
+        target = max(1, round(self.total * min(percent, 100.0) / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max_value) / MICROSECONDS
+        return self.max
+
+    def percentiles(self, percents: Iterable[float] = (50, 90, 99, 99.9)) -> Dict[str, float]:
+        """
+        Get several latency percentiles and the maximum in seconds.
+
+        Returns:
+            Dict[str, float]: Values keyed by names such as "p50" and "p99.9", plus "max".
+        """
+        result = {f"p{percent:g}": self.percentile(percent) for percent in percents}
+        result["max"] = self.max
+        return result
+
+    def summary(self) -> str:
+        """
+        Format the count and percentiles as text.
+        """
+        values = " ".join(f"{key}={value:.6f}" for key, value in self.percentiles().items())
+        return f"count={self.total} {values}"
+
+    def _index_for(self, value: int) -> int:
+        bucket = max((value | (self._sub_bucket_count - 1)).bit_length()
+                     - self._sub_bucket_half_magnitude - 1, 0)
+        sub_bucket = value >> bucket
+        return ((bucket + 1) << self._sub_bucket_half_magnitude) + sub_bucket \
+            - self._sub_bucket_half_count
+
+    def _highest_equivalent(self, index: int) -> int:
+        bucket = (index >> self._sub_bucket_half_magnitude) - 1
+        sub_bucket = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket < 0:
+            sub_bucket -= self._sub_bucket_half_count
+            bucket = 0
+        return (sub_bucket << bucket) + (1 << bucket) - 1
@@ -0,0 +1,278 @@
+import keyword
+import re
+import threading
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from getman.utils.codec import JsonCodec, get_codec
+
+SAMPLE_SIZE = 100
+
+_MISSING = object()
+
+
+class Record:
+    """
+    The base class of the record types generated by `record_type`.
+
+    Records store their fields in `__slots__`, so they have no per-instance `__dict__`, and
+    are decoded by a function generated for their shape. Like `Struct`, fields missing from
+    the decoded data read as None. Keys that are not in the schema are kept aside, readable
+    as attributes or items, so `to_json` gives back the decoded data.
+
+    Attributes:
+        _fields (Tuple[Tuple[str, str], ...]): The attribute name and JSON key of every field.
+    """
+    __slots__ = ("_extra",)
+    _fields: Tuple[Tuple[str, str], ...] = ()
+    _keys: Dict[str, str] = {}
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            setattr(self, self._keys.get(key, key), value)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """
+        Decode a dictionary, nested dictionaries and lists of dictionaries become records.
+        """
+        return cls._decode(data)
+
+    @classmethod
+    def from_list(cls, items: Iterable[Dict[str, Any]]) -> List["Record"]:
+        """
+        Decode a list of dictionaries.
+        """
+        return list(map(cls._decode, items))
+
+    @staticmethod
+    def _decode(data: Dict[str, Any]) -> "Record":
+        raise NotImplementedError
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        extra = _get(self, "_extra")
+        if extra is not _MISSING and extra is not None:
+            return extra.get(name)
+        return None
+
+    def __getitem__(self, key):
+        return getattr(self, self._keys.get(key, key))
+
+    def __setitem__(self, key, value):
+        setattr(self, self._keys.get(key, key), value)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        attributes = ', '.join(f'{attr}={getattr(self, attr)!r}' for attr, _ in self._fields
+                               if _has(self, attr))
+        return f'{type(self).__name__}({attributes})'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record, and the records nested in it, back to dictionaries.
+        """
+        data = {}
+        for attr, key in self._fields:
+            value = _get(self, attr)
+            if value is _MISSING:
+                continue
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            data[key] = value
+        extra = _get(self, "_extra")
+        if extra is not _MISSING and extra:
+            data.update(extra)
+        return data
+
+    def to_json(self, indent: Optional[int] = None,
+                codec: Union[str, JsonCodec, None] = None) -> str:
+        """
+        Converts the record to a JSON string.
+        """
+        return get_codec(codec).dumps_str(self.to_dict(), indent=indent)
+
+
+def _get(record: Record, attr: str) -> Any:
+    try:
+        return object.__getattribute__(record, attr)
+    except AttributeError:
+        return _MISSING
+
+
+def _has(record: Record, attr: str) -> bool:
+    return _get(record, attr) is not _MISSING
+
+
+def _shape(value: Any, sample_size: int = SAMPLE_SIZE) -> Any:
+    """
+    Reduce a sample value or a schema to its shape: a dict of shapes for objects, a one item
+    list for lists of objects, None for anything else.
+    """
+    if isinstance(value, dict):
+        return {key: _shape(item, sample_size) for key, item in value.items()}
+    if isinstance(value, list):
+        shapes = [_shape(item, sample_size) for item in islice(value, sample_size)
+                  if isinstance(item, dict)]
+        if shapes:
+            merged = {}
+            for shape in shapes:
+                _merge(merged, shape)
+            return [merged]
+    return None
+
+
+def _merge(target: Dict[str, Any], shape: Dict[str, Any]) -> None:
+    for key, value in shape.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            _merge(current[0], value[0])
+        elif current is None:
+            target[key] = value
+
+
+def _identifier(key: str, taken: set) -> str:
+    name = re.sub(r"\W", "_", str(key)) or "_"
+    if name[0].isdigit() or keyword.iskeyword(name) or hasattr(Record, name):
+        name = f"{name}_" if not name[0].isdigit() else f"_{name}"
+    while name in taken:
+        name += "_"
+    taken.add(name)
+    return name
+
+
+def _class_name(name: str) -> str:
+    words = re.findall(r"[A-Za-z0-9]+", name)
+    name = "".join(word[:1].upper() + word[1:] for word in words) or "Record"
+    return f"_{name}" if name[0].isdigit() else name
+
+
+def record_type(name: str, sample: Any, sample_size: int = SAMPLE_SIZE) -> Type[Record]:
+    """
+    Generate a slot-based record type from a sample or a schema.
+
+    The sample is a decoded JSON object, or a list of them whose keys are merged, and a schema
+    is the same structure with any values, for example `{"id": int, "tags": [str],
+    "owner": {"name": str}}`. Nested objects become nested record types, and lists of objects
+    become lists of records.
+
+    Args:
+        name (str): The name of the type, turned into a class name.
+        sample (Any): The sample or schema.
+        sample_size (int): The number of list items inspected. Default: 100.
+
+    Returns:
+        Type[Record]: The generated record type.
+
+    Raises:
+        TypeError: If the sample is neither an object nor a list of objects.
+
+    Example:
+        User = record_type("user", {"id": 1, "name": "John", "roles": [{"name": "admin"}]})
+        users = User.from_list(response.json())
+    """
+    shape = _shape(sample, sample_size)
+    if isinstance(shape, list):
+        shape = shape[0]
+    if not isinstance(shape, dict):
+        raise TypeError("Record types are derived from an object or a list of objects.")
+    return _build(_class_name(name), shape)
+
+
+def _build(name: str, shape: Dict[str, Any]) -> Type[Record]:
+    taken = set()
+    fields = tuple((_identifier(key, taken), key) for key in shape)
+    namespace: Dict[str, Any] = {"new": object.__new__, "MISSING": _MISSING,
+                                 "KEYS": frozenset(shape)}
+    lines = ["def decode(data):", "    self = new(cls)", "    get = data.get"]
+    for index, (attr, key) in enumerate(fields):
+        nested = shape[key]
+        lines += [f"    value = get({key!r}, MISSING)", "    if value is not MISSING:"]
+        if isinstance(nested, dict):
+            namespace[f"decode_{index}"] = _build(name + _class_name(attr), nested)._decode
+            lines.append(f"        self.{attr} = decode_{index}(value) "
+                         f"if type(value) is dict else value")
+        elif isinstance(nested, list):
+            namespace[f"decode_{index}"] = _build(name + _class_name(attr), nested[0])._decode
+            lines.append(f"        self.{attr} = [decode_{index}(item) if type(item) is dict "
+                         f"else item for item in value] if type(value) is list else value")
+        else:
+            lines.append(f"        self.{attr} = value")
+    lines += [
+        "    if not data.keys() <= KEYS:",
+        "        self._extra = {key: value for key, value in data.items() if key not in KEYS}",
+        "    return self",
+    ]
+
+    cls = type(name, (Record,), {
+        "__slots__": tuple(attr for attr, _ in fields),
+        "_fields": fields,
+        "_keys": {key: attr for attr, key in fields},
+    })
+    namespace["cls"] = cls
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    cls._decode = staticmethod(namespace["decode"])
+    return cls
+
+
+class RecordRegistry:
+    """
+    The record types of a client, generated once per route from the first response decoded.
+
+    Routes are the keys types are cached under, use a template such as "users/{id}" to share
+    one type between the URLs of a resource.
+    """
+
+    def __init__(self):
+        self._types: Dict[str, Type[Record]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, route: str) -> Optional[Type[Record]]:
+        """
+        Get the record type of a route, None if it has none yet.
+        """
+        return self._types.get(route)
+
+    def register(self, route: str, sample: Any) -> Type[Record]:
+        """
+        Generate the record type of a route from a sample or a schema, replacing any other.
+        """
+        cls = record_type(route, sample)
+        with self._lock:
+            self._types[route] = cls
+        return cls
+
+    def decode(self, route: str, data: Any, schema: Any = None) -> Union[Record, List[Record]]:
+        """
+        Decode an object or a list of objects into the records of a route.
+
+        Args:
+            route (str): The route the data was returned by.
+            data (Any): The decoded JSON.
+            schema (Any): A schema used if the route has no type yet. Defaults to the data.
+
+        Returns:
+            Union[Record, List[Record]]: A record, or a list of records for a list.
+        """
+        cls = self._types.get(route)
+        if cls is None:
+            with self._lock:
+                cls = self._types.get(route)
+                if cls is None:
+                    cls = self._types[route] = record_type(
+                        route, data if schema is None else schema
+                    )
+        if isinstance(data, list):
+            return cls.from_list(data)
+        return cls.from_dict(data)
@@ -0,0 +1,112 @@
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Tuple, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass(frozen=True)
+class CompiledRequest:
+    """
+    An immutable request whose URL, headers and body are already serialized.
+
+    Compiled requests are created once by `GetMan.prepare` and sent any number of times with
+    `GetMan.send` or `GetMan.perform_send`, skipping method dispatch, URL building, body
+    encoding and `requests` preparation on every send. They are hashable, so they can be
+    used as cache or deduplication keys.
+
+    The session headers and cookies are merged when the request is compiled, cookies set
+    by later responses are not added to it.
+
+    Attributes:
+        method (str): The upper-case HTTP method.
+        url (str): The full URL, query string included.
+        headers (Tuple[Tuple[str, str], ...]): The headers in the order they are sent.
+        body (Optional[bytes]): The serialized body. Default: None.
+
+    Example:
+        compiled = client.prepare(HttpMethod.POST, client.routes("items"), data={"a": "b"})
+        for _ in range(100):
+            client.send(compiled)
+    """
+    method: str
+    url: str
+    headers: Tuple[Tuple[str, str], ...] = ()
+    body: Optional[bytes] = None
+    _template: requests.PreparedRequest = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        template = requests.PreparedRequest()
+        template.method = self.method
+        template.url = self.url
+        template.headers = CaseInsensitiveDict(self.headers)
+        template.body = self.body
+        template.prepare_cookies(None)
+        object.__setattr__(self, "_template", template)
+
+    @classmethod
+    def from_prepared(cls, request: requests.PreparedRequest) -> "CompiledRequest":
+        """
+        Compile a request prepared by `requests`, keeping its hooks.
+
+        Raises:
+            TypeError: If the body is streamed, such as a file or a generator, and so cannot
+                be sent more than once from a compiled request.
+        """
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif isinstance(body, (bytearray, memoryview)):
+            body = bytes(body)
+        elif body is not None and not isinstance(body, bytes):
+            raise TypeError("Only bodies serialized to bytes can be compiled.")
+        compiled = cls(request.method, request.url, tuple(request.headers.items()), body)
+        compiled._template.hooks = request.hooks  # pylint: disable=protected-access
+        return compiled
+
+    def header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get a header value, matching the name case-insensitively.
+        """
+        return self._template.headers.get(name, default)
+
+    def override(
+            self,
+            headers: Optional[Mapping[str, str]] = None,
+            params: Optional[Mapping[str, str]] = None,
+            body: Optional[Union[bytes, str]] = None,
+    ) -> "CompiledRequest":
+        """
+        Create a copy with some headers, query parameters or the body replaced.
+
+        Args:
+            headers (Optional[Mapping[str, str]]): Headers added to, or replacing, the
+                compiled ones.
+            params (Optional[Mapping[str, str]]): Query parameters appended to the URL.
+            body (Optional[Union[bytes, str]]): A new serialized body, its `Content-Length`
+                is updated.
+
+        Returns:
+            CompiledRequest: The new compiled request, this one is unchanged.
+        """
+        url = self.url
+        if params:
+            prepared = requests.PreparedRequest()
+            prepared.prepare_url(url, params)
+            url = prepared.url
+        merged = CaseInsensitiveDict(self.headers)
+        merged.update(headers or {})
+        if body is None:
+            body = self.body
+        else:
+            body = body.encode("utf-8") if isinstance(body, str) else bytes(body)
+            merged["Content-Length"] = str(len(body))
+        compiled = CompiledRequest(self.method, url, tuple(merged.items()), body)
+        compiled._template.hooks = self._template.hooks  # pylint: disable=protected-access
+        return compiled
+
+    def to_prepared(self) -> requests.PreparedRequest:
+        """
+        Get a `requests.PreparedRequest` ready to be sent, a fresh copy on every call.
+        """
+        return self._template.copy()
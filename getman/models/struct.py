@@ -1,4 +1,8 @@
-import json
+from collections.abc import Sequence
+from typing import Any
+
+from getman.models.record import Record
+from getman.utils.codec import get_codec
 
 
 class Struct:
@@ -38,6 +42,9 @@ class Struct:
     Note:
         The `Struct` class does not enforce strict attribute typing,
         and attribute values can be of any type.
+
+        Wrapping a large decoded JSON document with `Struct.lazy` is much cheaper, nested
+        values are only wrapped when they are accessed.
     """
 
     def __init__(self, **kwargs):
@@ -47,6 +54,21 @@ class Struct:
             else:
                 setattr(self, key, value)
 
+    @classmethod
+    def lazy(cls, data: Any) -> Any:
+        """
+        Wrap decoded JSON without copying it, as a `LazyStruct` for a dictionary or a
+        `LazyList` for a list.
+
+        Nested dictionaries and lists, including dictionaries inside lists, are wrapped in a
+        view when they are accessed, so wrapping costs the same for any payload size.
+
+        Example:
+            user = Struct.lazy(response.json())
+            print(user.orders[0].total)
+        """
+        return _wrap(data)
+
     def __repr__(self):
         attributes = ', '.join(f'{key}={value}' for key, value in self.__dict__.items())
         return f'Struct({attributes})'
@@ -67,9 +89,160 @@ class Struct:
     def __delitem__(self, key):
         delattr(self, key)
 
-    def to_json(self, indent=0):
+    def to_json(self, indent=None, codec=None):
         """
         Converts the `Struct` object to a JSON string.
+
+        Args:
+            indent: Indent nested values by this many spaces, None for compact output.
+            codec: The JSON codec, a name or a `JsonCodec`. Defaults to the fastest installed.
+        """
+
+        return get_codec(codec).dumps_str(self.__dict__, default=_struct_dict, indent=indent)
+
+
+class LazyStruct:
+    """
+    A read and write view of a dictionary with the attribute access of `Struct`.
+
+    Missing attributes are None, nested dictionaries and lists are returned as `LazyStruct`
+    and `LazyList` views created on access, and changes are written to the wrapped
+    dictionary. Views hold a single slot, so no per-key attributes are allocated.
+
+    Args:
+        data (dict): The dictionary to wrap, it is not copied.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _wrap(self._data.get(name))
+
+    def __setattr__(self, name, value):
+        self._data[name] = _unwrap(value)
+
+    def __delattr__(self, name):
+        try:
+            del self._data[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
+
+    def __getitem__(self, key):
+        return _wrap(self._data.get(key))
+
+    def __setitem__(self, key, value):
+        self._data[key] = _unwrap(value)
+
+    def __delitem__(self, key):
+        self.__delattr__(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyStruct):
+            return self._data == other._data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return LazyStruct, (self._data,)
+
+    def __repr__(self):
+        attributes = ', '.join(f'{key}={self[key]!r}' for key in self._data)
+        return f'Struct({attributes})'
+
+    def __str__(self):
+        attributes = ', '.join(f'{key}={self[key]}' for key in self._data)
+        return f'Struct: {attributes}'
+
+    def to_dict(self) -> dict:
+        """
+        Get the wrapped dictionary.
+        """
+        return self._data
+
+    def to_json(self, indent=None, codec=None):
         """
+        Converts the wrapped dictionary to a JSON string, without walking the views.
+        """
+        return get_codec(codec).dumps_str(self._data, default=_struct_dict, indent=indent)
+
+
+class LazyList(Sequence):
+    """
+    A read-only sequence view of a list whose dictionaries and lists are wrapped on access.
+
+    Args:
+        data (list): The list to wrap, it is not copied.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyList(self._data[index])
+        return _wrap(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return map(_wrap, self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyList):
+            return self._data == other._data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'[{", ".join(repr(item) for item in self)}]'
+
+    def to_list(self) -> list:
+        """
+        Get the wrapped list.
+        """
+        return self._data
+
+    def to_json(self, indent=None, codec=None):
+        """
+        Converts the wrapped list to a JSON string, without walking the views.
+        """
+        return get_codec(codec).dumps_str(self._data, default=_struct_dict, indent=indent)
+
+
+def _wrap(value):
+    if isinstance(value, dict):
+        return LazyStruct(value)
+    if isinstance(value, list):
+        return LazyList(value)
+    return value
+
+
+def _unwrap(value):
+    if isinstance(value, (LazyStruct, LazyList)):
+        return value._data  # pylint: disable=protected-access
+    return value
+
 
-        return json.dumps(self.__dict__, default=lambda o: o.__dict__, indent=indent)
+def _struct_dict(value):
+    if isinstance(value, (LazyStruct, LazyList)):
+        return value._data  # pylint: disable=protected-access
+    if isinstance(value, Record):
+        return value.to_dict()
+    return vars(value)
@@ -0,0 +1,281 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import requests
+
+from getman.transport.protocol import Headers
+from getman.transport.stream import is_streamed
+from getman.utils.codec import get_codec
+
+MAGIC = b"GMREC\x00\x01\n"
+
+# Sizes of the metadata, the request body and the response body, then the flags.
+FRAME = struct.Struct("<IIIB")
+
+REQUEST_COMPRESSED = 1
+BODY_COMPRESSED = 2
+REQUEST_UNRECORDED = 4
+BODY_UNRECORDED = 8
+
+COMPRESS_THRESHOLD = 1024
+
+
+class Exchange(NamedTuple):
+    """
+    A request and its response, as recorded.
+
+    Attributes:
+        time (float): Seconds from the start of the recording to the request being sent.
+        elapsed (float): Seconds between sending the request and receiving the headers.
+        method (str): The upper-case request method.
+        url (str): The full URL, query string included.
+        request_headers (Headers): The request header pairs.
+        request_body (Optional[bytes]): The request body, None if it was streamed.
+        status (int): The response status code.
+        reason (str): The response reason phrase.
+        headers (Headers): The response header pairs.
+        body (Optional[bytes]): The decoded response body, None if it was streamed.
+    """
+    time: float
+    elapsed: float
+    method: str
+    url: str
+    request_headers: Headers
+    request_body: Optional[bytes]
+    status: int
+    reason: str
+    headers: Headers
+    body: Optional[bytes]
+
+
+def _pack(body: Optional[bytes], threshold: int, compressed: int,
+          unrecorded: int) -> Tuple[bytes, int]:
+    if body is None:
+        return b"", unrecorded
+    if len(body) >= threshold:
+        packed = zlib.compress(body, 6)
+        if len(packed) < len(body):
+            return packed, compressed
+    return body, 0
+
+
+def _unpack(data: bytes, flags: int, compressed: int, unrecorded: int) -> Optional[bytes]:
+    if flags & unrecorded:
+        return None
+    return zlib.decompress(data) if flags & compressed else data
+
+
+def _text(value: Union[str, bytes]) -> str:
+    return value.decode("latin-1") if isinstance(value, bytes) else value
+
+
+def _request_body(request: requests.PreparedRequest) -> Optional[bytes]:
+    body = request.body
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return bytes(body)
+    return None
+
+
+class Recorder:
+    """
+    Appends every exchange of a client to a recording, started with `HTTPClient.record`.
+
+    A recording starts with a magic number, followed by one frame per exchange: a fixed
+    header with the sizes and flags, the metadata encoded as JSON, then the request and
+    response bodies. Bodies of at least `compress_threshold` bytes are compressed with zlib
+    when that makes them smaller. Frames are only ever appended, so recording again to the
+    same file continues it, and a frame cut short by a crash is ignored when reading.
+
+    Args:
+        path (Union[str, os.PathLike]): The recording file, created if it does not exist.
+        compress_threshold (int): The size from which bodies are compressed. Default: 1024.
+
+    Raises:
+        ValueError: If the file exists and is not a recording.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike],
+                 compress_threshold: int = COMPRESS_THRESHOLD):
+        self.path = path
+        self.compress_threshold = compress_threshold
+        self.count = 0
+        self._codec = get_codec(None)
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._file = open(path, "ab")  # pylint: disable=consider-using-with
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        else:
+            with open(path, "rb") as file:
+                if file.read(len(MAGIC)) != MAGIC:
+                    self._file.close()
+                    raise ValueError(f"{path} is not a GetMan recording.")
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the recording has been closed.
+        """
+        return self._file.closed
+
+    def append(self, response: requests.Response, received: Optional[float] = None) -> None:
+        """
+        Append the exchange of a response, the body of a streamed response is not recorded.
+
+        Args:
+            response (requests.Response): The response, with its prepared request.
+            received (Optional[float]): The `time.monotonic()` at which the response was
+                received, when it is appended later or from another thread. Default: now.
+        """
+        request = response.request
+        elapsed = response.elapsed.total_seconds()
+        received = time.monotonic() if received is None else received
+        meta = self._codec.dumps({
+            "t": max(received - self._start - elapsed, 0.0),
+            "e": elapsed,
+            "m": request.method,
+            "u": request.url,
+            "q": [(key, _text(value)) for key, value in request.headers.items()],
+            "s": response.status_code,
+            "r": response.reason or "",
+            "h": list(response.headers.items()),
+        })
+        request_body, request_flags = _pack(_request_body(request), self.compress_threshold,
+                                            REQUEST_COMPRESSED, REQUEST_UNRECORDED)
+        body, body_flags = _pack(None if is_streamed(response) else response.content,
+                                 self.compress_threshold, BODY_COMPRESSED, BODY_UNRECORDED)
+        frame = FRAME.pack(len(meta), len(request_body), len(body), request_flags | body_flags)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(b"".join((frame, meta, request_body, body)))
+            self.count += 1
+
+    def flush(self) -> None:
+        """
+        Write the buffered frames to the file.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """
+        Stop recording and close the file.
+        """
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class Recording:
+    """
+    Reads a recording from disk one frame at a time, so recordings of any size are replayed
+    or served without being loaded into memory.
+
+    Args:
+        path (Union[str, os.PathLike]): The recording file.
+
+    Example:
+        for exchange in Recording("traffic.gmr"):
+            print(exchange.method, exchange.url, exchange.status)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self._codec = get_codec(None)
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._pid = 0
+
+    def __iter__(self) -> Iterator[Exchange]:
+        with open(self.path, "rb") as file:
+            self._check(file.read(len(MAGIC)))
+            while True:
+                head = file.read(FRAME.size)
+                if len(head) < FRAME.size:
+                    return
+                sizes = FRAME.unpack(head)
+                data = file.read(sum(sizes[:3]))
+                if len(data) < sum(sizes[:3]):
+                    return
+                yield self._exchange(sizes, data)
+
+    def index(self) -> Iterator[Tuple[int, str, str]]:
+        """
+        Iterate over the offset, method and URL of every exchange, skipping the bodies.
+        """
+        with open(self.path, "rb") as file:
+            self._check(file.read(len(MAGIC)))
+            offset = len(MAGIC)
+            size = os.fstat(file.fileno()).st_size
+            while True:
+                head = file.read(FRAME.size)
+                if len(head) < FRAME.size:
+                    return
+                meta_size, request_size, body_size, _ = FRAME.unpack(head)
+                end = offset + FRAME.size + meta_size + request_size + body_size
+                if end > size:
+                    return
+                meta = self._codec.loads(file.read(meta_size))
+                yield offset, meta["m"], meta["u"]
+                file.seek(end)
+                offset = end
+
+    def read(self, offset: int) -> Exchange:
+        """
+        Read the exchange at an offset given by `index`.
+
+        The file is kept open between reads, by each thread in turn, and opened again in a
+        forked process so processes never share its position.
+        """
+        with self._lock:
+            if self._file is None or self._pid != os.getpid():
+                self._file = open(self.path, "rb")  # pylint: disable=consider-using-with
+                self._pid = os.getpid()
+            self._file.seek(offset)
+            sizes = FRAME.unpack(self._file.read(FRAME.size))
+            data = self._file.read(sum(sizes[:3]))
+        return self._exchange(sizes, data)
+
+    def close(self) -> None:
+        """
+        Close the file kept open by `read`.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _check(self, magic: bytes) -> None:
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a GetMan recording.")
+
+    def _exchange(self, sizes: Tuple[int, int, int, int], data: bytes) -> Exchange:
+        meta_size, request_size, _, flags = sizes
+        meta = self._codec.loads(data[:meta_size])
+        request_body = data[meta_size:meta_size + request_size]
+        body = data[meta_size + request_size:]
+        return Exchange(
+            meta["t"], meta["e"], meta["m"], meta["u"], _pairs(meta["q"]),
+            _unpack(request_body, flags, REQUEST_COMPRESSED, REQUEST_UNRECORDED),
+            meta["s"], meta["r"], _pairs(meta["h"]),
+            _unpack(body, flags, BODY_COMPRESSED, BODY_UNRECORDED),
+        )
+
+
+def _pairs(items: List[List[str]]) -> Headers:
+    return list(map(tuple, items))
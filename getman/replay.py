@@ -0,0 +1,174 @@
+import asyncio
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from getman.models.histogram import LatencyHistogram
+from getman.models.request import CompiledRequest
+from getman.recording import Exchange
+
+# Headers the transport sets again for the URL and body actually sent.
+UNREPLAYED_HEADERS = frozenset({"host", "content-length", "transfer-encoding", "connection"})
+
+
+def rebase(url: str, base_url: Optional[str]) -> str:
+    """
+    Move a recorded URL to another server.
+
+    Args:
+        url (str): The recorded URL.
+        base_url (Optional[str]): The scheme and host to send to, with an optional path
+            prepended to the recorded path. None keeps the URL.
+
+    Returns:
+        str: The URL to replay.
+    """
+    if not base_url:
+        return url
+    base, recorded = urlsplit(base_url), urlsplit(url)
+    return urlunsplit((base.scheme, base.netloc, base.path.rstrip("/") + recorded.path,
+                       recorded.query, ""))
+
+
+def compile_exchange(exchange: Exchange, base_url: Optional[str] = None) -> CompiledRequest:
+    """
+    Build the request replaying a recorded exchange.
+    """
+    headers = tuple((key, value) for key, value in exchange.request_headers
+                    if key.lower() not in UNREPLAYED_HEADERS)
+    return CompiledRequest(exchange.method, rebase(exchange.url, base_url), headers,
+                           exchange.request_body or None)
+
+
+@dataclass
+class ReplayReport:
+    """
+    The outcome of replaying a recording.
+
+    Attributes:
+        statuses (Counter): The number of replayed requests per status code, 0 for requests
+            without a response.
+        mismatches (int): The number of responses whose status differs from the recording.
+        latencies (LatencyHistogram): The latency of every replayed request.
+        elapsed (float): Seconds between the first request being sent and the last response.
+        max_send_lag (float): The longest delay between a request's scheduled and actual send
+            time, 0 when replaying as fast as possible.
+    """
+    statuses: Counter = field(default_factory=Counter)
+    mismatches: int = 0
+    latencies: LatencyHistogram = field(default_factory=LatencyHistogram)
+    elapsed: float = 0.0
+    max_send_lag: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """The number of replayed requests."""
+        return self.statuses.total()
+
+    @property
+    def errors(self) -> int:
+        """The number of requests without a response or with a 5xx status."""
+        return sum(count for status, count in self.statuses.items()
+                   if status == 0 or status >= 500)
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second over the whole replay."""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """
+        Format the report as text.
+        """
+        return "\n".join([
+            f"Requests: {self.total}",
+            f"Errors: {self.errors}",
+            f"Status Mismatches: {self.mismatches}",
+            f"Status Codes: {dict(self.statuses)}",
+            f"Elapsed Time (seconds): {self.elapsed:.3f}",
+            f"Throughput (req/s): {self.throughput:.1f}",
+            f"Latency (seconds): {self.latencies.summary()}",
+            f"Max Send Lag (seconds): {self.max_send_lag:.6f}",
+        ])
+
+
+async def run_replay(
+        send: Callable[[CompiledRequest], Awaitable[requests.Response]],
+        exchanges: Iterable[Exchange],
+        base_url: Optional[str] = None,
+        speed: Optional[float] = 1.0,
+        max_in_flight: int = 100,
+) -> ReplayReport:
+    """
+    Send the requests of a recording again, at their recorded time divided by `speed`.
+
+    Exchanges are pulled from `exchanges` one at a time, from a worker thread so reading and
+    decompressing a recording streamed from disk never blocks the event loop, and no faster
+    than request slots free up, so the recording is replayed in bounded memory. Requests are
+    sent without waiting for earlier responses, like the recorded traffic, up to
+    `max_in_flight` at a time.
+
+    Args:
+        send (Callable[[CompiledRequest], Awaitable[requests.Response]]): Sends one request.
+        exchanges (Iterable[Exchange]): The recorded exchanges, in recorded order.
+        base_url (Optional[str]): The server to replay against, see `rebase`.
+        speed (Optional[float]): How many times faster than recorded to replay, None or
+            `math.inf` to replay as fast as possible. Default: 1.0, the recorded timing.
+        max_in_flight (int): The maximum number of requests waiting for a response.
+
+    Returns:
+        ReplayReport: The statuses and latencies of the replayed requests, requests failing
+            with any exception counted under status 0.
+
+    Raises:
+        ValueError: If `speed` is not positive or `max_in_flight` is below 1.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive.")
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
+    timed = speed is not None and speed != math.inf
+    loop = asyncio.get_running_loop()
+    report = ReplayReport()
+    slots = asyncio.Semaphore(max_in_flight)
+    pending = set()
+    start = loop.time()
+    first: Optional[float] = None
+
+    async def send_one(exchange: Exchange):
+        sent = loop.time()
+        try:
+            response = await send(compile_exchange(exchange, base_url))
+            status = response.status_code if response is not None else 0
+        except Exception:  # pylint: disable=broad-except
+            status = 0
+        finally:
+            slots.release()
+        report.latencies.record(loop.time() - sent)
+        report.statuses[status] += 1
+        if status != exchange.status:
+            report.mismatches += 1
+
+    iterator = iter(exchanges)
+    while (exchange := await asyncio.to_thread(next, iterator, None)) is not None:
+        await slots.acquire()
+        if timed:
+            first = exchange.time if first is None else first
+            due = start + (exchange.time - first) / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                report.max_send_lag = max(report.max_send_lag, -delay)
+        task = asyncio.ensure_future(send_one(exchange))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    if pending:
+        await asyncio.wait(pending)
+    report.elapsed = loop.time() - start
+    return report
@@ -1,5 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Dict, Literal, Optional
+from typing import Dict, Literal, Optional, Tuple, Union
+
+from getman.constant import Transport
+from getman.utils.codec import JsonCodec
 
 
 @dataclass
@@ -11,9 +14,10 @@ class Settings:
     Attributes:
         timeout (int): Duration in seconds to wait for an operation before timing out. Default: 20.
         retries (int): Number of allowed retries if an operation fails. Default: 1.
-        delay (int): Duration in seconds between retries. Default: 1.
-        timeout_increment (int): Increment in timeout duration after each timeout event, useful for
-            operations that may need progressively longer wait times. Default: 10.
+        delay (int): Duration in seconds before the first retry. Default: 1.
+        timeout_increment (int): Increment in timeout duration for each retry attempt, useful for
+            operations that may need progressively longer wait times. The settings object itself
+            is never modified. Default: 10.
         style (Dict[str, str]): Styling for different operation statuses,
             mapping status keys to style values.
             Default: {'success': 'green', 'failed': 'bold red', 'info': 'yellow bold'}.
@@ -21,6 +25,56 @@ class Settings:
             'standard', '256', 'truecolor', 'windows']]): Color system
             used for output formatting. Supports a range
             of color modes or 'None' for no color. Default: 'windows'.
+        transport (Transport): Transport used by asynchronous requests. `Transport.REQUESTS`
+            runs the blocking `requests` session, `Transport.ASYNCIO` uses the non-blocking
+            keep-alive transport so queued requests overlap. Default: Transport.REQUESTS.
+        max_in_flight (int): Maximum number of concurrent requests when streaming the queue
+            with `GetMan.stream_queue`. Default: 100.
+        max_workers (int): Number of worker threads used by `GetMan.execute_queue_threaded`
+            and `GetMan.request_batch`. Default: 8.
+        pool_connections (int): Number of hosts whose connection pools are kept by each
+            session. Default: 10.
+        pool_maxsize (int): Maximum number of connections kept open per host. Default: 100.
+        pool_block (bool): If True, wait for a free connection when a host's pool is full,
+            otherwise open an extra connection that is discarded after use. Default: False.
+        keep_alive (bool): Reuse connections between requests. Default: True.
+        backoff_factor (float): Multiplier applied to `delay` after each retry. Default: 2.
+        max_delay (float): Upper bound in seconds of the delay between retries. Default: 30.
+        jitter (bool): Draw each delay uniformly between zero and its backoff value, so clients
+            do not retry in lockstep. Default: True.
+        retry_statuses (Tuple[int, ...]): Response status codes that are retried.
+            Default: (429, 502, 503).
+        respect_retry_after (bool): Wait for the `Retry-After` header of a retried response
+            instead of the backoff delay, at most `max_delay`. Default: True.
+        retry_budget (Optional[float]): Share of the requests that may be retried, for example
+            0.1 for 10%, on top of a reserve of `retry_budget_reserve` retries. Retries beyond
+            the budget are dropped. None disables the budget. Default: None.
+        retry_budget_reserve (int): Retries always available to a client sending few
+            requests. Default: 10.
+        circuit_breaker (bool): Keep a circuit breaker per host. Requests to a host whose
+            circuit is open fail fast with `CircuitOpenError` without being sent. Default: False.
+        failure_threshold (float): Share of failed requests, between 0 and 1, that opens a
+            host's circuit. 5xx statuses, `retry_statuses`, timeouts and connection errors
+            count as failures. Default: 0.5.
+        failure_window (int): Number of recent requests per host the failure share is
+            computed over. Default: 20.
+        circuit_min_requests (int): Minimum number of recent requests before a circuit can
+            open. Default: 5.
+        reset_timeout (float): Seconds an open circuit waits before letting a single probe
+            request through. Default: 30.
+        cache (bool): Keep GET responses in a private HTTP cache that honors `Cache-Control`
+            and `Expires`, and revalidates stale responses with `ETag` and `Last-Modified`.
+            Default: False.
+        cache_max_bytes (int): Memory budget of the response cache, the least recently used
+            responses are evicted beyond it. Default: 64 MiB.
+        cache_dir (Optional[str]): Directory of an on-disk cache tier that survives restarts.
+            None keeps the cache in memory only. Default: None.
+        single_flight (bool): Share one network round-trip between concurrent identical GET
+            and OPTIONS requests, every caller gets the same response. Default: False.
+        json_codec (Union[str, JsonCodec]): The JSON codec used for `json=` request bodies,
+            `response.json()` and reports. "auto" picks the fastest installed codec, `orjson`
+            when available, "json" forces the standard library, and a `JsonCodec` instance is
+            used as is. Default: "auto".
     """
     timeout: int = 20
     retries: int = 1
@@ -32,3 +86,27 @@ class Settings:
         "info": "yellow bold"
     })
     color_system: Optional[Literal['auto', 'standard', '256', 'truecolor', 'windows']] = 'windows'
+    transport: Transport = Transport.REQUESTS
+    max_in_flight: int = 100
+    max_workers: int = 8
+    pool_connections: int = 10
+    pool_maxsize: int = 100
+    pool_block: bool = False
+    keep_alive: bool = True
+    backoff_factor: float = 2
+    max_delay: float = 30
+    jitter: bool = True
+    retry_statuses: Tuple[int, ...] = (429, 502, 503)
+    respect_retry_after: bool = True
+    retry_budget: Optional[float] = None
+    retry_budget_reserve: int = 10
+    circuit_breaker: bool = False
+    failure_threshold: float = 0.5
+    failure_window: int = 20
+    circuit_min_requests: int = 5
+    reset_timeout: float = 30
+    cache: bool = False
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_dir: Optional[str] = None
+    single_flight: bool = False
+    json_codec: Union[str, JsonCodec] = "auto"
@@ -0,0 +1,210 @@
+import asyncio
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+import requests
+
+from getman.models.histogram import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class ArrivalSchedule:
+    """
+    The intended send times of an open-loop stress test.
+
+    A warmup phase at a constant `rate` is followed by the measured phase, which ramps linearly
+    from `rate` to `ramp_to` over `duration` seconds, or stays constant if `ramp_to` is None.
+
+    Attributes:
+        rate (float): Requests per second at the start of the run.
+        duration (float): Seconds of the measured phase.
+        warmup (float): Seconds of the warmup phase, its requests are not reported.
+        ramp_to (Optional[float]): Requests per second at the end of the measured phase.
+    """
+    rate: float
+    duration: float
+    warmup: float = 0.0
+    ramp_to: Optional[float] = None
+
+    def __post_init__(self):
+        if self.rate < 0 or (self.ramp_to or 0) < 0:
+            raise ValueError("Arrival rates cannot be negative.")
+        if self.rate == 0 and not self.ramp_to:
+            raise ValueError("At least one of rate or ramp_to must be positive.")
+
+    @property
+    def warmup_requests(self) -> int:
+        """The number of requests sent during the warmup phase."""
+        return math.ceil(self.rate * self.warmup)
+
+    @property
+    def end(self) -> float:
+        """Seconds from the start of the run to the end of the measured phase."""
+        return self.warmup + self.duration
+
+    def offset(self, index: int) -> float:
+        """
+        Get the intended send time of a request.
+
+        Args:
+            index (int): The position of the request in the run, warmup included.
+
+        Returns:
+            float: Seconds from the start of the run, `math.inf` if it is never sent.
+        """
+        if index < self.warmup_requests:
+            return index / self.rate
+        count = index - self.warmup_requests
+        end_rate = self.rate if self.ramp_to is None else self.ramp_to
+        slope = (end_rate - self.rate) / self.duration if self.duration else 0.0
+        if slope == 0:
+            return self.warmup + count / self.rate
+        # Solve rate * t + slope * t^2 / 2 = count for the time of the count-th arrival.
+        discriminant = self.rate ** 2 + 2 * slope * count
+        if discriminant < 0:
+            return math.inf
+        return self.warmup + (math.sqrt(discriminant) - self.rate) / slope
+
+
+@dataclass
+class StressReport:
+    """
+    The per-request timings of the measured phase of a stress test.
+
+    Latency is measured from the intended send time, so time a request spent waiting behind
+    a slow server counts against the server instead of being hidden by coordinated omission.
+    Service time is measured from the actual send time.
+
+    Attributes:
+        duration (float): Seconds of the measured phase.
+        intended (array): Intended send time of each request, in seconds from the start.
+        sent (array): Actual send time of each request, in seconds from the start.
+        finished (array): Completion time of each request, in seconds from the start.
+        statuses (array): The status code of each request, 0 when no response was received.
+    """
+    duration: float
+    intended: array = field(default_factory=lambda: array("d"))
+    sent: array = field(default_factory=lambda: array("d"))
+    finished: array = field(default_factory=lambda: array("d"))
+    statuses: array = field(default_factory=lambda: array("H"))
+
+    def record(self, intended: float, sent: float, finished: float, status: int) -> None:
+        """
+        Record the timings of a single request.
+        """
+        self.intended.append(intended)
+        self.sent.append(sent)
+        self.finished.append(finished)
+        self.statuses.append(status)
+
+    @property
+    def total(self) -> int:
+        """The number of measured requests."""
+        return len(self.statuses)
+
+    @property
+    def error_rate(self) -> float:
+        """The share of requests without a response or with a 5xx status."""
+        if not self.total:
+            return 0.0
+        errors = sum(1 for status in self.statuses if status == 0 or status >= 500)
+        return errors / self.total
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second over the measured phase."""
+        return self.total / self.duration if self.duration else 0.0
+
+    def histogram(self, corrected: bool = True) -> LatencyHistogram:
+        """
+        Build a latency histogram of the measured requests.
+
+        Args:
+            corrected (bool): Measure from the intended send time, otherwise from the actual
+                send time. Defaults to True.
+
+        Returns:
+            LatencyHistogram: The latency of every measured request.
+        """
+        histogram = LatencyHistogram()
+        starts = self.intended if corrected else self.sent
+        histogram.record_many(end - start for start, end in zip(starts, self.finished))
+        return histogram
+
+    @property
+    def max_send_lag(self) -> float:
+        """The longest delay between a request's intended and actual send time."""
+        return max((sent - intended for intended, sent in zip(self.intended, self.sent)),
+                   default=0.0)
+
+    def percentile(self, percent: float, corrected: bool = True) -> float:
+        """
+        Get a latency percentile in seconds.
+
+        Args:
+            percent (float): The percentile between 0 and 100.
+            corrected (bool): Measure from the intended send time. Defaults to True.
+
+        Returns:
+            float: The latency below which `percent` of the requests completed.
+        """
+        return self.histogram(corrected).percentile(percent)
+
+    def summary(self) -> str:
+        """
+        Format the report as text.
+        """
+        return "\n".join([
+            f"Requests: {self.total}",
+            f"Throughput (req/s): {self.throughput:.1f}",
+            f"Error Rate: {self.error_rate:.2%}",
+            f"Latency (seconds): {self.histogram().summary()}",
+            f"Uncorrected Latency (seconds): {self.histogram(corrected=False).summary()}",
+            f"Max Send Lag (seconds): {self.max_send_lag:.6f}",
+        ])
+
+
+async def run_stress(
+        send: Callable[[], Awaitable[requests.Response]],
+        schedule: ArrivalSchedule,
+) -> StressReport:
+    """
+    Send requests at the scheduled arrival rate without waiting for earlier responses.
+
+    Args:
+        send (Callable[[], Awaitable[requests.Response]]): Sends one request.
+        schedule (ArrivalSchedule): When to send each request.
+
+    Returns:
+        StressReport: The timings of the requests sent after the warmup phase.
+    """
+    loop = asyncio.get_running_loop()
+    report = StressReport(duration=schedule.duration)
+    pending = set()
+    start = loop.time()
+
+    async def send_one(intended: float, measured: bool):
+        sent = loop.time() - start
+        try:
+            response = await send()
+            status = response.status_code if response is not None else 0
+        except Exception:  # pylint: disable=broad-except
+            status = 0
+        if measured:
+            report.record(intended, sent, loop.time() - start, status)
+
+    index = 0
+    while (intended := schedule.offset(index)) < schedule.end:
+        delay = start + intended - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.ensure_future(send_one(intended, index >= schedule.warmup_requests))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        index += 1
+
+    if pending:
+        await asyncio.wait(pending)
+    return report
@@ -0,0 +1,5 @@
+from .aio import AsyncTransport
+from .response import build_response
+from .stream import (ServerSentEvent, StreamingBody, aiter_bytes, aiter_ndjson,
+                     aiter_sse, iter_bytes, iter_ndjson, iter_sse)
+from .upload import FileBody, MultipartBody
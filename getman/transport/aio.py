@@ -0,0 +1,394 @@
+import asyncio
+import ssl
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.cookies import RequestsCookieJar, merge_cookies
+
+from getman.transport.protocol import (ContentDecoder, StaleConnectionError,
+                                       decode_content, is_buffered_body,
+                                       is_chunked_request, is_framed,
+                                       is_keep_alive, iter_body, read_body,
+                                       read_response_head, serialize_head,
+                                       serialize_request)
+from getman.transport.response import build_response
+from getman.transport.stream import DEFAULT_CHUNK_SIZE, StreamingBody
+from getman.transport.upload import (FileBody, MultipartBody,
+                                     is_async_iterable, is_replayable)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+MAX_REDIRECTS = 30
+
+HostKey = Tuple[str, str, int]
+
+
+def origin(url: str) -> HostKey:
+    """
+    The scheme, host and port of a URL, the port defaulting to the one of the scheme.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    return scheme, (parts.hostname or "").lower(), parts.port or DEFAULT_PORTS.get(scheme, 0)
+
+
+class Connection:
+    """
+    A pooled connection to a single host.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        """
+        Close the underlying stream.
+        """
+        self.writer.close()
+
+
+class Payload:
+    """
+    A request whose body is streamed after its head instead of being serialized with it.
+
+    Args:
+        head (bytes): The serialized request line and headers.
+        body (Any): A `FileBody`, a `MultipartBody`, a file object, or an iterable or async
+            iterable of bytes.
+        chunked (bool): Frame the body with chunked transfer-encoding.
+    """
+
+    def __init__(self, head: bytes, body: Any, chunked: bool):
+        self.head = head
+        self.body = body
+        self.chunked = chunked
+
+    async def write(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Write the request to a connection.
+        """
+        writer.write(self.head)
+        body = self.body
+        if isinstance(body, FileBody):
+            await self._sendfile(writer, body)
+        elif isinstance(body, MultipartBody):
+            for segment in body.segments:
+                if isinstance(segment, FileBody):
+                    await self._sendfile(writer, segment)
+                else:
+                    writer.write(segment)
+        elif is_async_iterable(body):
+            async for chunk in body:
+                await self._write_chunk(writer, chunk)
+        else:
+            if hasattr(body, "read"):
+                body = iter(partial(body.read, DEFAULT_CHUNK_SIZE), b"")
+            for chunk in body:
+                await self._write_chunk(writer, chunk)
+        if self.chunked:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _write_chunk(self, writer: asyncio.StreamWriter, chunk: Union[bytes, str]) -> None:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if not chunk:
+            # An empty chunk would end a chunked body early.
+            return
+        if self.chunked:
+            writer.write(b"%x\r\n" % len(chunk))
+            writer.write(chunk)
+            writer.write(b"\r\n")
+        else:
+            writer.write(chunk)
+        await writer.drain()
+
+    @staticmethod
+    async def _sendfile(writer: asyncio.StreamWriter, body: FileBody) -> None:
+        await writer.drain()
+        loop = asyncio.get_running_loop()
+        with open(body.path, "rb") as file:
+            await loop.sendfile(writer.transport, file, body.offset, body.count)
+
+
+class AsyncTransport:
+    """
+    An asyncio-native HTTP/1.1 transport with keep-alive connection pooling.
+
+    Requests are prepared by `requests`, so headers, cookies and body encoding behave as they
+    do on the blocking path, but they are written to pooled `asyncio` streams. Concurrent
+    requests therefore overlap on the wire instead of blocking the event loop.
+
+    Bodies that are not held in memory are streamed: a `FileBody`, and the file parts of a
+    `MultipartBody`, are sent with `loop.sendfile`, and iterables and async iterables are
+    written chunk by chunk, with chunked transfer-encoding when their length is unknown.
+
+    Args:
+        max_connections (int): Maximum number of connections kept open per host. Default: 100.
+        keep_alive (bool): Keep connections open for reuse after a response. Default: True.
+        block (bool): If True, wait for a free connection when `max_connections` are busy,
+            otherwise open an extra connection that is closed after use. Default: True.
+
+    Attributes:
+        stats (Dict[str, Counter]): The number of `new` and `reused` connections per
+            `scheme://host:port`.
+    """
+
+    def __init__(self, max_connections: int = 100, keep_alive: bool = True, block: bool = True):
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.block = block
+        self.stats: Dict[str, Counter] = {}
+        self._idle: Dict[HostKey, Deque[Connection]] = {}
+        self._limits: Dict[HostKey, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def send(
+            self,
+            request: requests.PreparedRequest,
+            timeout: Optional[float] = None,
+            verify: Union[bool, str] = True,
+            allow_redirects: bool = True,
+            stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a prepared request and read the full response.
+
+        Args:
+            request (requests.PreparedRequest): The request to send.
+            timeout (Optional[float]): Seconds to wait for each response. Defaults to None.
+            verify (Union[bool, str]): Verify TLS certificates, or a path to a CA bundle.
+            allow_redirects (bool): Follow redirect responses. Defaults to True.
+            stream (bool): Return once the headers are read, leaving the body in
+                `response.raw` as a `StreamingBody`. Its connection is kept out of the pool
+                until the body is read to the end or closed. Defaults to False.
+
+        Returns:
+            requests.Response: The final response, earlier redirects are kept in `history`.
+
+        Raises:
+            requests.Timeout: If the server does not answer within the timeout.
+            requests.ConnectionError: If the connection fails.
+        """
+        history = []
+        response = await self._send_once(request, timeout, verify, stream)
+        while allow_redirects and response.is_redirect:
+            if stream:
+                response._content = await response.raw.read()  # pylint: disable=protected-access
+            if len(history) >= MAX_REDIRECTS:
+                raise requests.TooManyRedirects(
+                    f"Exceeded {MAX_REDIRECTS} redirects.", response=response
+                )
+            history.append(response)
+            request = self._redirect_request(response)
+            response = await self._send_once(request, timeout, verify, stream)
+        response.history = history
+        return response
+
+    async def close(self) -> None:
+        """
+        Close every idle connection in the pool.
+        """
+        for connections in self._idle.values():
+            while connections:
+                connections.popleft().close()
+        self._idle.clear()
+
+    async def _send_once(self, request: requests.PreparedRequest, timeout: Optional[float],
+                         verify: Union[bool, str], stream: bool = False) -> requests.Response:
+        self._bind_loop()
+        parts = urlsplit(request.url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS:
+            raise requests.exceptions.InvalidSchema(f"No connection adapters for '{request.url}'")
+        key = (scheme, parts.hostname, parts.port or DEFAULT_PORTS[scheme])
+        host = parts.netloc.rpartition("@")[2]
+        if is_buffered_body(request.body):
+            payload = serialize_request(request, host, self.keep_alive)
+        else:
+            payload = Payload(serialize_head(request, host, self.keep_alive), request.body,
+                              is_chunked_request(request))
+
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                if stream:
+                    status, reason, headers, body = await self._open_stream(
+                        key, payload, request.method, verify, timeout
+                    )
+                else:
+                    async with self._limit(key):
+                        status, reason, headers, body = await self._exchange(
+                            key, payload, request.method, verify
+                        )
+        except TimeoutError as exc:
+            raise requests.Timeout(exc, request=request) from exc
+        except (OSError, asyncio.IncompleteReadError) as exc:
+            raise requests.ConnectionError(exc, request=request) from exc
+
+        if not stream:
+            return build_response(request, status, reason, headers, body,
+                                  time.perf_counter() - start)
+        response = build_response(request, status, reason, headers, None,
+                                  time.perf_counter() - start)
+        response.raw = body
+        return response
+
+    async def _exchange(self, key: HostKey, payload: Union[bytes, "Payload"], method: str,
+                        verify: Union[bool, str], stream: bool = False):
+        counts = self.stats.setdefault("{}://{}:{}".format(*key), Counter())
+        # A body that cannot be sent twice never goes to a connection that may be stale.
+        replayable = not isinstance(payload, Payload) or is_replayable(payload.body)
+        connection = self._pop_idle(key) if replayable else None
+        if connection is not None:
+            try:
+                result = await self._roundtrip(key, connection, payload, method, stream)
+                counts["reused"] += 1
+                return result
+            except StaleConnectionError:
+                pass
+        connection = await self._connect(key, verify)
+        counts["new"] += 1
+        return await self._roundtrip(key, connection, payload, method, stream)
+
+    async def _roundtrip(self, key: HostKey, connection: Connection,
+                         payload: Union[bytes, "Payload"], method: str, stream: bool = False):
+        try:
+            if isinstance(payload, Payload):
+                await payload.write(connection.writer)
+            else:
+                connection.writer.write(payload)
+                await connection.writer.drain()
+            version, status, reason, headers = await read_response_head(connection.reader)
+            if stream:
+                return version, status, reason, headers, connection
+            body, framed = await read_body(connection.reader, method, status, headers)
+        except BaseException:
+            connection.close()
+            raise
+
+        self._checkin(key, connection, framed and is_keep_alive(version, headers))
+        return status, reason, headers, decode_content(body, headers)
+
+    async def _open_stream(self, key: HostKey, payload: Union[bytes, "Payload"], method: str,
+                           verify: Union[bool, str], timeout: Optional[float]):
+        semaphore = self._semaphore(key)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            version, status, reason, headers, connection = await self._exchange(
+                key, payload, method, verify, stream=True
+            )
+        except BaseException:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        reusable_connection = is_framed(method, status, headers) and is_keep_alive(version, headers)
+
+        def release(reusable: bool) -> None:
+            if reusable and reusable_connection:
+                self._checkin(key, connection, True)
+            else:
+                connection.close()
+            if semaphore is not None:
+                semaphore.release()
+
+        body = StreamingBody(
+            iter_body(connection.reader, method, status, headers, DEFAULT_CHUNK_SIZE),
+            ContentDecoder(headers),
+            release,
+            timeout,
+        )
+        return status, reason, headers, body
+
+    def _checkin(self, key: HostKey, connection: Connection, reusable: bool) -> None:
+        idle = self._idle.setdefault(key, deque())
+        if reusable and self.keep_alive and len(idle) < self.max_connections:
+            idle.append(connection)
+        else:
+            connection.close()
+
+    async def _connect(self, key: HostKey, verify: Union[bool, str]) -> Connection:
+        scheme, host, port = key
+        context = self._ssl_context(verify) if scheme == "https" else None
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=context, server_hostname=host if context else None
+        )
+        return Connection(reader, writer)
+
+    def _pop_idle(self, key: HostKey) -> Optional[Connection]:
+        connections = self._idle.get(key)
+        while connections:
+            connection = connections.pop()
+            if not connection.reader.at_eof() and not connection.writer.is_closing():
+                return connection
+            connection.close()
+        return None
+
+    @asynccontextmanager
+    async def _limit(self, key: HostKey):
+        semaphore = self._semaphore(key)
+        if semaphore is None:
+            yield
+            return
+        async with semaphore:
+            yield
+
+    def _semaphore(self, key: HostKey) -> Optional[asyncio.Semaphore]:
+        if not self.block:
+            return None
+        semaphore = self._limits.get(key)
+        if semaphore is None:
+            semaphore = self._limits[key] = asyncio.Semaphore(self.max_connections)
+        return semaphore
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connections and semaphores belong to the loop that created them.
+            self._idle.clear()
+            self._limits.clear()
+            self._loop = loop
+
+    @staticmethod
+    def _ssl_context(verify: Union[bool, str]) -> ssl.SSLContext:
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            return context
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        return ssl.create_default_context()
+
+    @staticmethod
+    def _redirect_request(response: requests.Response) -> requests.PreparedRequest:
+        """
+        Build the request following a redirect, as `requests.Session` does.
+
+        Credentials are not forwarded to another origin: `Authorization` is dropped when the
+        scheme, host or port changes, and the `Cookie` header is rebuilt from the cookie jar
+        for the new URL, with the cookies set by the redirect response.
+        """
+        request = response.request.copy()
+        request.prepare_url(urljoin(response.url, response.headers["location"]), None)
+        if origin(request.url) != origin(response.url):
+            request.headers.pop("Authorization", None)
+        jar = request._cookies  # pylint: disable=protected-access
+        if jar is None:
+            jar = RequestsCookieJar()
+        merge_cookies(jar, response.cookies)
+        request.headers.pop("Cookie", None)
+        request.prepare_cookies(jar)
+        if response.status_code == 303 or (
+                response.status_code in (301, 302) and request.method == "POST"):
+            request.method = "GET"
+            request.body = None
+            for header in ("Content-Length", "Content-Type", "Transfer-Encoding"):
+                request.headers.pop(header, None)
+        return request
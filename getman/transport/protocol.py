@@ -0,0 +1,309 @@
+import asyncio
+import zlib
+from typing import Any, List, Optional, Tuple
+
+import requests
+
+Headers = List[Tuple[str, str]]
+
+NO_BODY_STATUSES = (204, 304)
+
+
+class StaleConnectionError(ConnectionError):
+    """
+    Raised when a pooled connection was closed by the server before a response arrived.
+    """
+
+
+def header_value(headers: Headers, name: str) -> Optional[str]:
+    """
+    Get the value of a header from a list of header pairs.
+
+    Args:
+        headers (Headers): The header pairs to search.
+        name (str): The case-insensitive header name.
+
+    Returns:
+        Optional[str]: The value of the first matching header, or None if not present.
+    """
+    name = name.lower()
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def serialize_request(request: requests.PreparedRequest, host: str,
+                      keep_alive: bool = True) -> bytes:
+    """
+    Serialize a prepared request into an HTTP/1.1 message.
+
+    Args:
+        request (requests.PreparedRequest): The request to serialize.
+        host (str): The value of the `Host` header.
+        keep_alive (bool): If False, ask the server to close the connection after responding.
+
+    Returns:
+        bytes: The request line, headers and body ready to be written to a socket.
+    """
+    head = serialize_head(request, host, keep_alive)
+    body = request.body
+    if body is None:
+        return head
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, (bytes, bytearray, memoryview)):
+        raise ValueError("Only bytes or str request bodies can be serialized with the head.")
+    return head + bytes(body)
+
+
+def is_buffered_body(body: Any) -> bool:
+    """
+    Check whether a request body is held in memory, as opposed to a file or an iterable.
+    """
+    return body is None or isinstance(body, (str, bytes, bytearray, memoryview))
+
+
+def is_chunked_request(request: requests.PreparedRequest) -> bool:
+    """
+    Check whether a request body is sent with chunked transfer-encoding.
+    """
+    return "chunked" in request.headers.get("Transfer-Encoding", "").lower()
+
+
+def serialize_head(request: requests.PreparedRequest, host: str,
+                   keep_alive: bool = True) -> bytes:
+    """
+    Serialize the request line and headers of a prepared request.
+
+    Args:
+        request (requests.PreparedRequest): The request to serialize.
+        host (str): The value of the `Host` header.
+        keep_alive (bool): If False, ask the server to close the connection after responding.
+
+    Returns:
+        bytes: The request line and headers, terminated by an empty line.
+    """
+    lines = [f"{request.method} {request.path_url} HTTP/1.1"]
+    if "Host" not in request.headers:
+        lines.append(f"Host: {host}")
+    for key, value in request.headers.items():
+        if isinstance(value, bytes):
+            value = value.decode("latin-1")
+        lines.append(f"{key}: {value}")
+    if not keep_alive:
+        lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def read_response_head(reader: asyncio.StreamReader) -> Tuple[str, int, str, Headers]:
+    """
+    Read the status line and headers of a response, skipping interim 1xx responses.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+
+    Returns:
+        Tuple[str, int, str, Headers]: The HTTP version, status code, reason and headers.
+
+    Raises:
+        StaleConnectionError: If the connection was closed before any byte was received.
+    """
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise StaleConnectionError("Connection closed before the response started.")
+        version, status, reason = parse_status_line(line)
+        headers = await read_headers(reader)
+        if 100 <= status < 200 and status != 101:
+            continue
+        return version, status, reason, headers
+
+
+def parse_status_line(line: bytes) -> Tuple[str, int, str]:
+    """
+    Parse an HTTP status line such as `HTTP/1.1 200 OK`.
+    """
+    parts = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ConnectionError(f"Invalid status line: {line!r}")
+    reason = parts[2] if len(parts) == 3 else ""
+    return parts[0], int(parts[1]), reason
+
+
+async def read_headers(reader: asyncio.StreamReader) -> Headers:
+    """
+    Read header lines until the empty line that terminates the header block.
+    """
+    headers = []
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            return headers
+        if not line:
+            raise asyncio.IncompleteReadError(b"", None)
+        key, _, value = line.decode("latin-1").partition(":")
+        headers.append((key.strip(), value.strip()))
+
+
+def has_body(method: str, status: int) -> bool:
+    """
+    Check whether a response to the given method and status carries a body.
+    """
+    return method != "HEAD" and status not in NO_BODY_STATUSES and not 100 <= status < 200
+
+
+def is_chunked(headers: Headers) -> bool:
+    """
+    Check whether a message uses chunked transfer-encoding.
+    """
+    transfer_encoding = header_value(headers, "Transfer-Encoding")
+    return transfer_encoding is not None and "chunked" in transfer_encoding.lower()
+
+
+async def read_body(reader: asyncio.StreamReader, method: str, status: int,
+                    headers: Headers) -> Tuple[bytes, bool]:
+    """
+    Read a complete response body.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+        method (str): The request method, HEAD responses have no body.
+        status (int): The response status code.
+        headers (Headers): The response headers.
+
+    Returns:
+        Tuple[bytes, bool]: The body and whether the message was framed, meaning the
+            connection is left positioned at the next response.
+    """
+    if not has_body(method, status):
+        return b"", True
+    if is_chunked(headers):
+        return b"".join([chunk async for chunk in iter_chunked(reader)]), True
+    content_length = header_value(headers, "Content-Length")
+    if content_length is not None:
+        return await reader.readexactly(int(content_length)), True
+    return await reader.read(), False
+
+
+async def iter_chunked(reader: asyncio.StreamReader, max_size: Optional[int] = None):
+    """
+    Iterate over the chunks of a chunked transfer-encoded body, consuming any trailers.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+        max_size (Optional[int]): Split chunks larger than this many bytes, so memory stays
+            bounded whatever chunk sizes the server sends. Defaults to None.
+    """
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return
+        while size:
+            piece = await reader.readexactly(min(size, max_size or size))
+            size -= len(piece)
+            yield piece
+        await reader.readexactly(2)
+
+
+def is_framed(method: str, status: int, headers: Headers) -> bool:
+    """
+    Check whether the end of a response body is known without closing the connection.
+    """
+    return (not has_body(method, status) or is_chunked(headers)
+            or header_value(headers, "Content-Length") is not None)
+
+
+async def iter_body(reader: asyncio.StreamReader, method: str, status: int,
+                    headers: Headers, chunk_size: int):
+    """
+    Iterate over a response body in pieces of at most `chunk_size` bytes, still encoded.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+        method (str): The request method, HEAD responses have no body.
+        status (int): The response status code.
+        headers (Headers): The response headers.
+        chunk_size (int): The maximum size of each piece.
+    """
+    if not has_body(method, status):
+        return
+    if is_chunked(headers):
+        async for chunk in iter_chunked(reader, chunk_size):
+            yield chunk
+        return
+    content_length = header_value(headers, "Content-Length")
+    if content_length is not None:
+        remaining = int(content_length)
+        while remaining:
+            chunk = await reader.readexactly(min(remaining, chunk_size))
+            remaining -= len(chunk)
+            yield chunk
+        return
+    while chunk := await reader.read(chunk_size):
+        yield chunk
+
+
+def is_keep_alive(version: str, headers: Headers) -> bool:
+    """
+    Check whether the server allows the connection to be reused.
+    """
+    connection = (header_value(headers, "Connection") or "").lower()
+    if version == "HTTP/1.0":
+        return "keep-alive" in connection
+    return "close" not in connection
+
+
+class ContentDecoder:
+    """
+    Incrementally decodes a gzip or deflate encoded body, other encodings pass through.
+
+    Args:
+        headers (Headers): The response headers naming the `Content-Encoding`.
+    """
+
+    def __init__(self, headers: Headers):
+        encoding = (header_value(headers, "Content-Encoding") or "").lower()
+        self.encoding = encoding if encoding in ("gzip", "deflate") else None
+        self._decompressor = None
+        if self.encoding == "gzip":
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decode the next piece of the body.
+        """
+        if self.encoding is None or not data:
+            return data
+        if self._decompressor is None:
+            # Deflate bodies are zlib-wrapped by the spec but often sent raw.
+            wrapped = len(data) > 1 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+            wbits = zlib.MAX_WBITS if wrapped else -zlib.MAX_WBITS
+            self._decompressor = zlib.decompressobj(wbits)
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        """
+        Decode whatever remains buffered at the end of the body.
+        """
+        return self._decompressor.flush() if self._decompressor is not None else b""
+
+
+def decode_content(body: bytes, headers: Headers) -> bytes:
+    """
+    Decode a gzip or deflate encoded body, other encodings are returned unchanged.
+    """
+    encoding = (header_value(headers, "Content-Encoding") or "").lower()
+    if not body or encoding not in ("gzip", "deflate"):
+        return body
+    if encoding == "gzip":
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
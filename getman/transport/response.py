@@ -0,0 +1,88 @@
+from datetime import timedelta
+from http.cookies import CookieError, SimpleCookie
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.cookies import RequestsCookieJar, create_cookie
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from getman.transport.protocol import Headers
+
+
+def build_response(
+        request: requests.PreparedRequest,
+        status: int,
+        reason: str,
+        headers: Headers,
+        content: Optional[bytes],
+        elapsed: float = 0.0,
+) -> requests.Response:
+    """
+    Build a `requests.Response` from the parts of a response received outside of `requests`.
+
+    The result behaves like a response returned by a `requests.Session`, so reports,
+    cookies and JSON decoding work the same whichever transport produced it.
+
+    Args:
+        request (requests.PreparedRequest): The request that produced the response.
+        status (int): The response status code.
+        reason (str): The response reason phrase.
+        headers (Headers): The response header pairs.
+        content (Optional[bytes]): The decoded body, or None if it has not been read yet.
+        elapsed (float): Seconds between sending the request and receiving the headers.
+
+    Returns:
+        requests.Response: The populated response object.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    response.headers = CaseInsensitiveDict()
+    for key, value in headers:
+        if key in response.headers:
+            response.headers[key] = f"{response.headers[key]}, {value}"
+        else:
+            response.headers[key] = value
+    response.url = request.url
+    response.request = request
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.elapsed = timedelta(seconds=elapsed)
+    response.cookies = extract_cookies(request.url, headers)
+    if content is not None:
+        response._content = content  # pylint: disable=protected-access
+        response._content_consumed = True  # pylint: disable=protected-access
+    return response
+
+
+def extract_cookies(url: str, headers: Headers) -> RequestsCookieJar:
+    """
+    Collect the cookies set by `Set-Cookie` response headers.
+
+    Args:
+        url (str): The URL of the response, used as the default cookie domain.
+        headers (Headers): The response header pairs.
+
+    Returns:
+        RequestsCookieJar: A jar containing the cookies, malformed headers are ignored.
+    """
+    jar = RequestsCookieJar()
+    domain = urlsplit(url).hostname or ""
+    for key, value in headers:
+        if key.lower() != "set-cookie":
+            continue
+        cookie = SimpleCookie()
+        try:
+            cookie.load(value)
+        except CookieError:
+            continue
+        for name, morsel in cookie.items():
+            jar.set_cookie(create_cookie(
+                name,
+                morsel.value,
+                domain=morsel["domain"] or domain,
+                path=morsel["path"] or "/",
+                secure=bool(morsel["secure"]),
+            ))
+    return jar
@@ -0,0 +1,329 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, Iterable,
+                    Iterator, List, Optional, Union)
+
+import requests
+
+from getman.transport.protocol import ContentDecoder
+from getman.utils.codec import JsonCodec, get_codec
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_LINE_SIZE = 1024 * 1024
+LINE_END = re.compile(rb"\r\n|\r|\n")
+
+
+class StreamingBody:
+    """
+    The unread body of a response streamed by the asyncio transport.
+
+    Iterating the body reads it from the connection piece by piece and decodes gzip or
+    deflate content incrementally. Once the body is read to the end, or closed, the connection
+    is handed back to the transport's pool.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The still encoded pieces of the body.
+        decoder (ContentDecoder): Decodes the `Content-Encoding` of the body.
+        release (Callable[[bool], None]): Called once with True when the body was read to the
+            end, so the connection can be reused, or False when it must be closed.
+        timeout (Optional[float]): Seconds to wait for each piece. Defaults to None.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], decoder: ContentDecoder,
+                 release: Callable[[bool], None], timeout: Optional[float] = None):
+        self.timeout = timeout
+        self._chunks = chunks
+        self._decoder = decoder
+        self._release: Optional[Callable[[bool], None]] = release
+
+    @property
+    def closed(self) -> bool:
+        """Whether the body was read to the end or closed."""
+        return self._release is None
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterate()
+
+    async def read(self) -> bytes:
+        """
+        Read the rest of the body.
+        """
+        return b"".join([chunk async for chunk in self])
+
+    async def aclose(self) -> None:
+        """
+        Stop reading the body and close its connection.
+        """
+        await self._chunks.aclose()
+        self._finish(False)
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        if self.closed:
+            return
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(self.timeout):
+                        chunk = await anext(self._chunks)
+                except StopAsyncIteration:
+                    break
+                if chunk := self._decoder.decompress(chunk):
+                    yield chunk
+            if tail := self._decoder.flush():
+                yield tail
+        except TimeoutError as exc:
+            self._finish(False)
+            raise requests.Timeout(exc) from exc
+        except (OSError, asyncio.IncompleteReadError) as exc:
+            self._finish(False)
+            raise requests.exceptions.ChunkedEncodingError(exc) from exc
+        except BaseException:
+            self._finish(False)
+            raise
+        self._finish(True)
+
+    def _finish(self, reusable: bool) -> None:
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable)
+
+
+class LineDecoder:
+    """
+    Splits a stream of byte chunks into lines ending with `\\r\\n`, `\\n` or `\\r`.
+
+    Args:
+        max_line_size (int): The longest line accepted, so a body without line breaks cannot
+            exhaust memory. Default: 1 MiB.
+    """
+
+    def __init__(self, max_line_size: int = MAX_LINE_SIZE):
+        self.max_line_size = max_line_size
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Add a chunk and get the lines it completes, without their line endings.
+
+        Raises:
+            ValueError: If a line grows beyond `max_line_size`.
+        """
+        self._buffer += chunk
+        lines = []
+        start = 0
+        while match := LINE_END.search(self._buffer, start):
+            if match.group() == b"\r" and match.end() == len(self._buffer):
+                # The "\n" of a "\r\n" pair may arrive with the next chunk.
+                break
+            lines.append(bytes(self._buffer[start:match.start()]))
+            start = match.end()
+        del self._buffer[:start]
+        if len(self._buffer) > self.max_line_size:
+            raise ValueError(f"Line exceeds {self.max_line_size} bytes.")
+        return lines
+
+    def flush(self) -> List[bytes]:
+        """
+        Get the last line if the stream did not end with a line break.
+        """
+        if not self._buffer:
+            return []
+        line = bytes(self._buffer)
+        self._buffer.clear()
+        return [line[:-1] if line.endswith(b"\r") else line]
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    """
+    An event received from a `text/event-stream` response.
+
+    Attributes:
+        data (str): The event data, multiple `data` lines joined with newlines.
+        event (str): The event type. Default: "message".
+        id (Optional[str]): The last event ID seen on the stream. Default: None.
+        retry (Optional[int]): The reconnection time in milliseconds requested by the server.
+            Default: None.
+    """
+    data: str
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+    def json(self, codec: Union[str, JsonCodec, None] = None) -> Any:
+        """
+        Decode the event data as JSON, with the fastest installed codec by default.
+        """
+        return get_codec(codec).loads(self.data)
+
+
+class SSEDecoder:
+    """
+    Decodes Server-Sent Events line by line, following the WHATWG event stream format.
+    """
+
+    def __init__(self):
+        self.last_event_id: Optional[str] = None
+        self._data: List[str] = []
+        self._event = ""
+        self._retry: Optional[int] = None
+
+    def decode(self, line: bytes) -> Optional[ServerSentEvent]:
+        """
+        Process a line of the stream.
+
+        Returns:
+            Optional[ServerSentEvent]: The event completed by an empty line, otherwise None.
+        """
+        text = line.decode("utf-8", errors="replace")
+        if not text:
+            return self._dispatch()
+        if text.startswith(":"):
+            return None
+        name, _, value = text.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        elif name == "id" and "\0" not in value:
+            self.last_event_id = value
+        elif name == "retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        data, event, retry = self._data, self._event, self._retry
+        self._data, self._event, self._retry = [], "", None
+        if not data:
+            return None
+        return ServerSentEvent("\n".join(data), event or "message", self.last_event_id, retry)
+
+
+def is_streamed(response: requests.Response) -> bool:
+    """
+    Check whether the body of a response was left unread by `stream=True`.
+    """
+    return response.raw is not None and response._content is False  # pylint: disable=protected-access
+
+
+def iter_bytes(response: requests.Response,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Iterate over the decoded body of a response sent with `stream=True` by a blocking method.
+
+    Raises:
+        TypeError: If the response was streamed by the asyncio transport, use `aiter_bytes`.
+    """
+    if isinstance(response.raw, StreamingBody):
+        raise TypeError("Responses streamed by the asyncio transport are read with aiter_bytes.")
+    return response.iter_content(chunk_size)
+
+
+async def aiter_bytes(response: requests.Response,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Iterate over the decoded body of a response without blocking the event loop.
+
+    Bodies streamed by the asyncio transport are read from the connection, bodies of
+    blocking responses sent with `stream=True` are read from a worker thread.
+    """
+    if isinstance(response.raw, StreamingBody):
+        async for chunk in response.raw:
+            yield chunk
+        return
+    chunks = response.iter_content(chunk_size)
+    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+        yield chunk
+
+
+def iter_lines(chunks: Iterable[bytes], max_line_size: int = MAX_LINE_SIZE) -> Iterator[bytes]:
+    """
+    Iterate over the lines of a stream of byte chunks.
+    """
+    decoder = LineDecoder(max_line_size)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes],
+                      max_line_size: int = MAX_LINE_SIZE) -> AsyncIterator[bytes]:
+    """
+    Iterate over the lines of an asynchronous stream of byte chunks.
+    """
+    decoder = LineDecoder(max_line_size)
+    async for chunk in chunks:
+        for line in decoder.feed(chunk):
+            yield line
+    for line in decoder.flush():
+        yield line
+
+
+def iter_ndjson(source: Union[requests.Response, Iterable[bytes]],
+                max_line_size: int = MAX_LINE_SIZE,
+                codec: Union[str, JsonCodec, None] = None) -> Iterator[Any]:
+    """
+    Decode newline-delimited JSON records as they arrive.
+
+    Args:
+        source (Union[requests.Response, Iterable[bytes]]): A response sent with `stream=True`,
+            or an iterable of byte chunks.
+        max_line_size (int): The longest record accepted. Default: 1 MiB.
+        codec (Union[str, JsonCodec, None]): The JSON codec, records are decoded from bytes.
+            Defaults to the fastest installed codec.
+
+    Returns:
+        Iterator[Any]: The decoded records, blank lines are skipped.
+    """
+    loads = get_codec(codec).loads
+    chunks = iter_bytes(source) if isinstance(source, requests.Response) else source
+    for line in iter_lines(chunks, max_line_size):
+        if line.strip():
+            yield loads(line)
+
+
+async def aiter_ndjson(source: Union[requests.Response, AsyncIterable[bytes]],
+                       max_line_size: int = MAX_LINE_SIZE,
+                       codec: Union[str, JsonCodec, None] = None) -> AsyncIterator[Any]:
+    """
+    Decode newline-delimited JSON records as they arrive, without blocking the event loop.
+    """
+    loads = get_codec(codec).loads
+    chunks = aiter_bytes(source) if isinstance(source, requests.Response) else source
+    async for line in aiter_lines(chunks, max_line_size):
+        if line.strip():
+            yield loads(line)
+
+
+def iter_sse(source: Union[requests.Response, Iterable[bytes]],
+             max_line_size: int = MAX_LINE_SIZE) -> Iterator[ServerSentEvent]:
+    """
+    Decode Server-Sent Events as they arrive.
+
+    Args:
+        source (Union[requests.Response, Iterable[bytes]]): A response sent with `stream=True`,
+            or an iterable of byte chunks.
+        max_line_size (int): The longest line accepted. Default: 1 MiB.
+
+    Returns:
+        Iterator[ServerSentEvent]: The events, an event left incomplete at the end is dropped.
+    """
+    chunks = iter_bytes(source) if isinstance(source, requests.Response) else source
+    decoder = SSEDecoder()
+    for line in iter_lines(chunks, max_line_size):
+        if (event := decoder.decode(line)) is not None:
+            yield event
+
+
+async def aiter_sse(source: Union[requests.Response, AsyncIterable[bytes]],
+                    max_line_size: int = MAX_LINE_SIZE) -> AsyncIterator[ServerSentEvent]:
+    """
+    Decode Server-Sent Events as they arrive, without blocking the event loop.
+    """
+    chunks = aiter_bytes(source) if isinstance(source, requests.Response) else source
+    decoder = SSEDecoder()
+    async for line in aiter_lines(chunks, max_line_size):
+        if (event := decoder.decode(line)) is not None:
+            yield event
@@ -0,0 +1,178 @@
+import mimetypes
+import mmap
+import os
+import secrets
+from pathlib import Path
+from typing import (Any, AsyncIterable, Dict, Iterable, Iterator, List,
+                    Mapping, Optional, Tuple, Union)
+from urllib.parse import quote
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+Body = Union[Dict[str, Any], str, bytes, Path, "FileBody", "MultipartBody", Iterable[bytes],
+             AsyncIterable[bytes]]
+FieldValue = Union[str, bytes, "FileBody", Path, Tuple[str, Union[bytes, "FileBody", Path], str]]
+
+
+class FileBody:
+    """
+    A file sent as a request body, or a multipart part, without loading it into memory.
+
+    The blocking transport sends the file as `memoryview` slices of a memory map, so every
+    chunk goes from the page cache to the socket without being copied into a Python bytes
+    object. The asyncio transport sends it with `loop.sendfile`, which uses the zero-copy
+    `os.sendfile` system call on plain connections. Each slice is released when the next one
+    is requested, copy it with `bytes()` to keep it.
+
+    Args:
+        path (Union[str, Path]): The file to send.
+        offset (int): The position of the first byte to send. Default: 0.
+        count (Optional[int]): The number of bytes to send. Defaults to the rest of the file.
+        chunk_size (int): The size of the slices sent by the blocking transport. Default: 1 MiB.
+        content_type (Optional[str]): The media type, guessed from the file name by default.
+    """
+
+    def __init__(self, path: Union[str, Path], offset: int = 0, count: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, content_type: Optional[str] = None):
+        self.path = Path(path)
+        self.offset = offset
+        size = os.path.getsize(self.path)
+        self.count = size - offset if count is None else min(count, size - offset)
+        self.chunk_size = chunk_size
+        self.content_type = (content_type or mimetypes.guess_type(self.path.name)[0]
+                             or "application/octet-stream")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[memoryview]:
+        if not self.count:
+            return
+        with open(self.path, "rb") as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                end = self.offset + self.count
+                for start in range(self.offset, end, self.chunk_size):
+                    chunk = view[start:min(start + self.chunk_size, end)]
+                    try:
+                        yield chunk
+                    finally:
+                        # Views must be released before the memory map can be closed.
+                        chunk.release()
+
+
+class MultipartBody:
+    """
+    A `multipart/form-data` body whose file parts are streamed instead of buffered.
+
+    Only the part headers are kept in memory, file parts are read while the body is sent, and
+    the total length is known upfront so the body is sent with a `Content-Length`.
+
+    Args:
+        fields (Mapping[str, FieldValue]): The form fields. Values are strings or bytes,
+            `FileBody` or `Path` objects for files, or `(filename, content, content_type)`
+            tuples.
+        boundary (Optional[str]): The part boundary, random by default.
+
+    Example:
+        body = MultipartBody({"name": "build", "artifact": Path("build.tar.gz")})
+        client.post(url, data=body)
+    """
+
+    def __init__(self, fields: Mapping[str, FieldValue], boundary: Optional[str] = None):
+        self.boundary = boundary or secrets.token_hex(16)
+        self.segments: List[Union[bytes, FileBody]] = []
+        for name, value in fields.items():
+            self.segments.extend(self._part(name, value))
+        self.segments.append(f"--{self.boundary}--\r\n".encode())
+
+    @property
+    def content_type(self) -> str:
+        """The `Content-Type` header of the body, naming its boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self.segments)
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        for segment in self.segments:
+            if isinstance(segment, FileBody):
+                yield from segment
+            else:
+                yield segment
+
+    def _part(self, name: str, value: FieldValue) -> List[Union[bytes, FileBody]]:
+        filename, content_type = None, None
+        if isinstance(value, tuple):
+            filename, value, content_type = value
+        if isinstance(value, Path):
+            value = FileBody(value)
+        if isinstance(value, FileBody):
+            filename = filename or value.path.name
+            content_type = content_type or value.content_type
+        elif isinstance(value, str):
+            value = value.encode("utf-8")
+
+        disposition = f'form-data; name="{quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{quote(filename)}"'
+        head = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type is not None:
+            head += f"Content-Type: {content_type}\r\n"
+        return [(head + "\r\n").encode(), value, b"\r\n"]
+
+
+def is_async_iterable(data: Any) -> bool:
+    """
+    Check whether a body is an async iterable, which only the asyncio transport can send.
+    """
+    return isinstance(data, AsyncIterable)
+
+
+def is_replayable(data: Any) -> bool:
+    """
+    Check whether a body can be sent again, for a retry or on a new connection.
+
+    Generators, iterators, async iterables and open files are consumed by sending them.
+    """
+    if data is None or isinstance(data, (str, bytes, bytearray, memoryview, Mapping, list,
+                                         tuple, Path, FileBody, MultipartBody)):
+        return True
+    return not (hasattr(data, "__next__") or hasattr(data, "read") or is_async_iterable(data))
+
+
+def prepare_body(data: Any, headers: Optional[Mapping[str, str]]
+                 ) -> Tuple[Any, Optional[Dict[str, str]]]:
+    """
+    Convert an upload body into one `requests` can prepare, adding the headers it needs.
+
+    `Path` objects become a `FileBody`, and a `MultipartBody` gets its `Content-Type`
+    unless the caller set one.
+
+    Args:
+        data (Any): The request body.
+        headers (Optional[Mapping[str, str]]): The request headers.
+
+    Returns:
+        Tuple[Any, Optional[Dict[str, str]]]: The body and headers to send.
+    """
+    if isinstance(data, Path):
+        data = FileBody(data)
+    if isinstance(data, MultipartBody):
+        headers = dict(headers or {})
+        if not any(key.lower() == "content-type" for key in headers):
+            headers["Content-Type"] = data.content_type
+    return data, headers
+
+
+def blocking_body(data: Any, headers: Optional[Mapping[str, str]]
+                  ) -> Tuple[Any, Optional[Dict[str, str]]]:
+    """
+    Prepare an upload body for the blocking `requests` transport.
+
+    Raises:
+        TypeError: If the body is an async iterable, which only `async_send` can send.
+    """
+    if is_async_iterable(data):
+        raise TypeError("Async iterable bodies require the asyncio transport.")
+    return prepare_body(data, headers)
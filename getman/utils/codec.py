@@ -0,0 +1,157 @@
+import functools
+import json
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+UTF8_ENCODINGS = frozenset({"utf-8", "utf8", "ascii", "us-ascii"})
+
+JSONDecodeError = json.JSONDecodeError
+
+
+class JsonCodec:
+    """
+    Encodes and decodes JSON with the standard library.
+
+    Codecs encode to and decode from bytes, so bodies go to and from the socket without an
+    intermediate `str`. Subclasses replace `dumps` and `loads` with a faster implementation.
+
+    Attributes:
+        name (str): The name the codec is selected with in `Settings.json_codec`.
+    """
+    name = "json"
+
+    def dumps(self, obj: Any, indent: Optional[int] = None,
+              default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """
+        Encode an object as UTF-8 JSON.
+
+        Args:
+            obj (Any): The object to encode.
+            indent (Optional[int]): Indent nested values by this many spaces, None for compact
+                output. Defaults to None.
+            default (Optional[Callable[[Any], Any]]): Converts objects the codec cannot encode.
+
+        Returns:
+            bytes: The encoded JSON.
+        """
+        separators = None if indent is not None else (",", ":")
+        return json.dumps(obj, indent=indent, default=default, ensure_ascii=False,
+                          separators=separators).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decode JSON from bytes or a string.
+
+        Raises:
+            JSONDecodeError: If the data is not valid JSON.
+        """
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps_str(self, obj: Any, indent: Optional[int] = None,
+                  default: Optional[Callable[[Any], Any]] = None) -> str:
+        """
+        Encode an object as a JSON string, for reports and other text output.
+        """
+        return self.dumps(obj, indent=indent, default=default).decode("utf-8")
+
+    def response_json(self, response: requests.Response, **kwargs) -> Any:
+        """
+        Decode the body of a response, straight from its bytes when it is UTF-8.
+
+        Keyword arguments are only honored by the standard library codec, as they are by
+        `requests.Response.json`.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON.
+        """
+        encoding = (response.encoding or "utf-8").lower()
+        try:
+            if kwargs:
+                return json.loads(response.text, **kwargs)
+            if encoding in UTF8_ENCODINGS:
+                return self.loads(response.content)
+            return self.loads(response.text)
+        except ValueError as exc:
+            raise requests.exceptions.JSONDecodeError(
+                getattr(exc, "msg", str(exc)), getattr(exc, "doc", ""), getattr(exc, "pos", 0)
+            ) from exc
+
+    def bind(self, response: Optional[requests.Response]) -> Optional[requests.Response]:
+        """
+        Make `response.json()` decode with this codec.
+        """
+        if response is not None:
+            response.json = functools.partial(self.response_json, response)
+        return response
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Encodes and decodes JSON with `orjson`, several times faster than the standard library.
+
+    `orjson` only indents by two spaces, other indents are encoded with the standard library.
+    """
+    # pylint: disable=no-member
+    name = "orjson"
+
+    def dumps(self, obj: Any, indent: Optional[int] = None,
+              default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        if indent not in (None, 2):
+            return super().dumps(obj, indent=indent, default=default)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+AVAILABLE_CODECS = tuple(name for name, module in (("orjson", orjson),) if module is not None)
+
+
+@functools.lru_cache(maxsize=None)
+def _codec(name: str) -> JsonCodec:
+    if name == "auto":
+        name = AVAILABLE_CODECS[0] if AVAILABLE_CODECS else JsonCodec.name
+    if name not in CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{name}', expected one of: auto, {', '.join(CODECS)}."
+        )
+    if name != JsonCodec.name and name not in AVAILABLE_CODECS:
+        raise ValueError(f"The '{name}' JSON codec is not installed.")
+    return CODECS[name]()
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = "auto") -> JsonCodec:
+    """
+    Get a JSON codec by name.
+
+    Args:
+        codec (Union[str, JsonCodec, None]): "auto" for the fastest installed codec, "orjson",
+            "json" for the standard library, or a `JsonCodec` returned as is. None is "auto".
+
+    Returns:
+        JsonCodec: The codec, shared by every caller asking for the same name.
+
+    Raises:
+        ValueError: If the codec is unknown or not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    return _codec(codec or "auto")
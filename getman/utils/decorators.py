@@ -1,12 +1,23 @@
 import asyncio
 import functools
+import inspect
+import logging
 import time
 import warnings
 from functools import wraps
+from typing import Optional
 
 import requests
 
 from getman.constant import PlatformOS
+from getman.manager.cache import parse_cache_control
+from getman.manager.circuit import RetryBudget
+from getman.transport.stream import StreamingBody
+from getman.transport.upload import is_replayable
+from getman.utils.retry import (RETRY_EXCEPTIONS, attempt_settings,
+                                is_retryable_response, retry_delay)
+
+logger = logging.getLogger("getman")
 
 
 def platform_checker(cls):
@@ -76,51 +87,375 @@ def deprecated(func=None, *, message=None, version=None):
     return new_func
 
 
+def client_budget(args: tuple) -> Optional[RetryBudget]:
+    """
+    Get the retry budget of the client a request method is called on, recording the request.
+    """
+    budget = getattr(args[0], "retry_budget", None) if args else None
+    if not isinstance(budget, RetryBudget):
+        return None
+    budget.record_request()
+    return budget
+
+
+def discard(response: Optional[requests.Response]) -> None:
+    """
+    Close a response thrown away for a retry, so a streamed body hands its connection back.
+    """
+    if response is not None:
+        response.close()
+
+
+def retry_reason(error: Optional[Exception], response: Optional[requests.Response]) -> str:
+    """
+    Describe why an attempt is retried, its error or the status of its response.
+    """
+    return str(error) if error is not None else f"status {response.status_code}"
+
+
+async def adiscard(response: Optional[requests.Response]) -> None:
+    """
+    Close a response of the asyncio transport thrown away for a retry, so a streamed body
+    hands its connection and pool slot back.
+    """
+    if response is None:
+        return
+    if isinstance(response.raw, StreamingBody):
+        await response.raw.aclose()
+    else:
+        response.close()
+
+
 def retry_request():
     """
         A decorator to retry a function call on failure.
 
-        This decorator retries the decorated function if it raises a timeout or connection error.
-        It uses settings provided in the `settings` keyword argument to determine the number
-        of retries, delay between retries, and timeout increment.
+        This decorator retries the decorated function if it raises a timeout or connection error,
+        or returns a response whose status code is in `settings.retry_statuses`. It uses the
+        settings provided in the `settings` keyword argument to determine the number of
+        attempts, the backoff between them and the timeout of each attempt.
 
         The `settings` argument should have the following attributes:
-        - `retries`: The maximum number of retries.
-        - `delay`: The delay in seconds between retries.
-        - `timeout_increment`: The amount to increment the timeout for each retry.
-        - `timeout`: The initial timeout value.
+        - `retries`: The maximum number of attempts.
+        - `delay`, `backoff_factor`, `max_delay`, `jitter`: The exponential backoff between
+          attempts.
+        - `timeout`, `timeout_increment`: The timeout of the first attempt and its increment
+          for each later attempt. The caller's settings are never modified.
+        - `retry_statuses`, `respect_retry_after`: Which responses are retried and whether
+          their `Retry-After` header is honored.
+
+        Coroutine functions are wrapped with an asynchronous variant that waits with
+        `asyncio.sleep`, so retries never block the event loop.
+
+        When the decorated function is a method of a client with a `retry_budget`, every call
+        deposits into the budget and every retry withdraws from it, so retries stop once the
+        budget is spent.
+
+        Responses thrown away for a retry are closed first, so streamed responses give their
+        connection back to the pool.
+
+        Requests whose `data` is consumed by sending it, such as a generator, are attempted
+        only once.
 
         Returns:
             A decorator that wraps the function with retry logic.
     """
 
     def decorator_request(func):
+        data = MethodArgument(func, "data")
+
+        def attempts(settings, args, kwargs) -> int:
+            if not is_replayable(data.get(args[1:], kwargs)):
+                return 1
+            return max(settings.retries, 1)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper_request(*args, **kwargs):
+                settings = kwargs.get("settings")
+                if settings is None:
+                    return await func(*args, **kwargs)
+                budget = client_budget(args)
+                max_retries = attempts(settings, args, kwargs)
+                for attempt in range(max_retries):
+                    kwargs["settings"] = attempt_settings(settings, attempt)
+                    error = None
+                    try:
+                        response = await func(*args, **kwargs)
+                    except RETRY_EXCEPTIONS as e:
+                        response, error = None, e
+                    else:
+                        if not is_retryable_response(settings, response):
+                            return response
+                    if attempt == max_retries - 1:
+                        break
+                    if budget is not None and not budget.try_retry():
+                        logger.warning("Retry budget exhausted.")
+                        return response
+                    logger.warning("Retry %s: %s", attempt + 1, retry_reason(error, response))
+                    await adiscard(response)
+                    await asyncio.sleep(retry_delay(settings, attempt, response))
+                if error is not None or max_retries > 1:
+                    logger.warning("Request failed after maximum retries.")
+                return response
+
+            return async_wrapper_request
+
         @functools.wraps(func)
         def wrapper_request(*args, **kwargs):
             settings = kwargs.get("settings")
-            max_retries = settings.retries
-            retry_delay_seconds = settings.delay
-            timeout_increment = settings.timeout_increment
-            for retry in range(max_retries):
+            if settings is None:
+                return func(*args, **kwargs)
+            budget = client_budget(args)
+            max_retries = attempts(settings, args, kwargs)
+            for attempt in range(max_retries):
+                kwargs["settings"] = attempt_settings(settings, attempt)
+                error = None
                 try:
                     response = func(*args, **kwargs)
-                    return response
-                except (requests.Timeout, requests.ConnectionError) as e:
+                except RETRY_EXCEPTIONS as e:
                     # Handle timeout or connection errors
-                    print(f"Retry {retry + 1}: {e}")
-                    settings.timeout += timeout_increment
-                    kwargs['settings'] = settings
-                    if retry < max_retries - 1:
-                        # Wait for the specified delay before the next retry
-                        time.sleep(retry_delay_seconds)
-            print("Request failed after maximum retries.")
-            return None
+                    response, error = None, e
+                else:
+                    if not is_retryable_response(settings, response):
+                        return response
+                if attempt == max_retries - 1:
+                    break
+                if budget is not None and not budget.try_retry():
+                    logger.warning("Retry budget exhausted.")
+                    return response
+                logger.warning("Retry %s: %s", attempt + 1, retry_reason(error, response))
+                discard(response)
+                # Wait for the backoff delay before the next retry
+                time.sleep(retry_delay(settings, attempt, response))
+            if error is not None or max_retries > 1:
+                logger.warning("Request failed after maximum retries.")
+            return response
 
         return wrapper_request
 
     return decorator_request
 
 
+class MethodArgument:
+    """
+    Reads or replaces an argument of a client method call, positional or keyword.
+
+    Args:
+        func: The method, whose first parameter is the client.
+        name (str): The name of the argument.
+    """
+
+    def __init__(self, func, name: str):
+        parameters = list(inspect.signature(func).parameters)
+        self.name = name
+        self.position = parameters.index(name) - 1 if name in parameters else None
+
+    def get(self, args: tuple, kwargs: dict, default=None):
+        """
+        Get the argument from the call arguments, without the client.
+        """
+        if self.name in kwargs:
+            return kwargs[self.name]
+        if self.position is not None and self.position < len(args):
+            return args[self.position]
+        return default
+
+    def replace(self, args: tuple, kwargs: dict, value) -> tuple:
+        """
+        Set the argument in the call arguments, returning the new positional arguments.
+        """
+        if self.position is not None and self.position < len(args) and self.name not in kwargs:
+            return args[:self.position] + (value,) + args[self.position + 1:]
+        kwargs[self.name] = value
+        return args
+
+
+def cache_response(func):
+    """
+        A decorator serving GET requests from the client's response cache.
+
+        The decorated function must be a method of an `HTTPClient` with `url`, `params` and
+        `headers` parameters, and optionally a `method` parameter. When the client has a
+        `cache`, a fresh stored response is returned without calling the method, a stale one
+        is revalidated by adding `If-None-Match` and `If-Modified-Since` headers, and
+        cacheable responses are stored. Streamed requests bypass the cache. Both synchronous
+        and asynchronous methods are supported; asynchronous methods read and write the disk
+        tier from a worker thread.
+
+        Args:
+            func: The request method to be decorated.
+
+        Returns:
+            The wrapped method.
+    """
+    method = MethodArgument(func, "method")
+    url = MethodArgument(func, "url")
+    params = MethodArgument(func, "params")
+    headers = MethodArgument(func, "headers")
+
+    def prepare(client, args, kwargs):
+        cache = client.cache
+        if cache is None or kwargs.get("stream") \
+                or str(method.get(args, kwargs, "GET")).upper() != "GET":
+            return None
+        request = client.session.prepare_request(requests.Request(
+            "GET", url.get(args, kwargs), params=params.get(args, kwargs),
+            headers=headers.get(args, kwargs),
+        ))
+        if "no-store" in parse_cache_control(request.headers.get("Cache-Control")):
+            return None
+        return cache, request
+
+    def conditional(args, kwargs, entry):
+        if entry is None:
+            return args
+        return headers.replace(args, kwargs, {**(headers.get(args, kwargs) or {}),
+                                              **entry.conditional_headers()})
+
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(client, *args, **kwargs):
+            prepared = prepare(client, args, kwargs)
+            if prepared is None:
+                return await func(client, *args, **kwargs)
+            cache, request = prepared
+            entry = await cache.alookup(request)
+            if (response := cache.fresh_response(request, entry)) is not None:
+                return client.json_codec.bind(response)
+            args = conditional(args, kwargs, entry)
+            response = await cache.aupdate(request, entry, await func(client, *args, **kwargs))
+            return client.json_codec.bind(response)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(client, *args, **kwargs):
+        prepared = prepare(client, args, kwargs)
+        if prepared is None:
+            return func(client, *args, **kwargs)
+        cache, request = prepared
+        entry = cache.lookup(request)
+        if (response := cache.fresh_response(request, entry)) is not None:
+            return client.json_codec.bind(response)
+        args = conditional(args, kwargs, entry)
+        return client.json_codec.bind(cache.update(request, entry, func(client, *args, **kwargs)))
+
+    return wrapper
+
+
+def guard_circuit(func):
+    """
+        A decorator failing fast while the circuit of the requested host is open.
+
+        The decorated function must be a method of an `HTTPClient` with a `url` parameter, or
+        a `request` parameter holding a `CompiledRequest`. When the client has `circuits`, the
+        breaker of the URL's host is checked before every call and the outcome is recorded
+        after it. Both synchronous and asynchronous methods are supported.
+
+        Args:
+            func: The request method to be decorated.
+
+        Returns:
+            The wrapped method, which raises `CircuitOpenError` without calling the method
+            when the circuit is open.
+    """
+    url = MethodArgument(func, "url")
+    request = MethodArgument(func, "request")
+
+    def acquire(client, args, kwargs):
+        circuits = client.circuits
+        if circuits is None:
+            return None
+        target = url.get(args, kwargs) or request.get(args, kwargs).url
+        host, breaker = circuits.breaker(target)
+        breaker.acquire(host)
+        return breaker
+
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(client, *args, **kwargs):
+            breaker = acquire(client, args, kwargs)
+            if breaker is None:
+                return await func(client, *args, **kwargs)
+            try:
+                response = await func(client, *args, **kwargs)
+            except RETRY_EXCEPTIONS:
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_response(response)
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(client, *args, **kwargs):
+        breaker = acquire(client, args, kwargs)
+        if breaker is None:
+            return func(client, *args, **kwargs)
+        try:
+            response = func(client, *args, **kwargs)
+        except RETRY_EXCEPTIONS:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_response(response)
+        return response
+
+    return wrapper
+
+
+def record_latency(func):
+    """
+        A decorator recording the latency of every response in the client's histogram.
+
+        The decorated function must be a method of an `HTTPClient` returning a
+        `requests.Response`, or None when the request failed. Both synchronous and
+        asynchronous methods are supported.
+
+        Args:
+            func: The request method to be decorated.
+
+        Returns:
+            The wrapped method, which records `response.elapsed` in `client.histogram`, and
+            the exchange in `client.recorder` while recording. Asynchronous methods append to
+            the recording from a worker thread, so compressing and writing the exchange does
+            not block the event loop.
+    """
+
+    def observe(client, response):
+        if response is not None:
+            client.histogram.record(response.elapsed.total_seconds())
+            recorder = client.recorder
+            if recorder is not None:
+                recorder.append(response)
+        return response
+
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(client, *args, **kwargs):
+            response = await func(client, *args, **kwargs)
+            if response is not None:
+                client.histogram.record(response.elapsed.total_seconds())
+                recorder = client.recorder
+                if recorder is not None:
+                    await asyncio.to_thread(recorder.append, response, time.monotonic())
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(client, *args, **kwargs):
+        return observe(client, func(client, *args, **kwargs))
+
+    return wrapper
+
+
 def coroutine(func):
     """
        A decorator to run a synchronous function as if it were asynchronous.
@@ -0,0 +1,103 @@
+import dataclasses
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+from getman.settings import Settings
+
+RETRY_EXCEPTIONS = (requests.Timeout, requests.ConnectionError)
+
+
+def attempt_settings(settings: Settings, attempt: int) -> Settings:
+    """
+    Derive the settings of a retry attempt without mutating the caller's settings.
+
+    Args:
+        settings (Settings): The settings of the original request.
+        attempt (int): The zero-based attempt number.
+
+    Returns:
+        Settings: A copy whose timeout grows by `timeout_increment` for each earlier attempt.
+    """
+    if attempt == 0 or not settings.timeout_increment:
+        return settings
+    return dataclasses.replace(
+        settings, timeout=settings.timeout + settings.timeout_increment * attempt
+    )
+
+
+def backoff_delay(settings: Settings, attempt: int) -> float:
+    """
+    Get the delay before the next attempt using exponential backoff.
+
+    The delay grows as `delay * backoff_factor ** attempt`, capped at `max_delay`. With
+    `jitter` enabled the delay is drawn uniformly between zero and that value (full jitter),
+    so clients retrying at the same time spread out instead of retrying in lockstep.
+
+    Args:
+        settings (Settings): The retry settings.
+        attempt (int): The zero-based number of the attempt that just failed.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    delay = min(settings.max_delay, settings.delay * settings.backoff_factor ** attempt)
+    return random.uniform(0, delay) if settings.jitter else delay
+
+
+def retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Parse the `Retry-After` header of a response.
+
+    Args:
+        response (requests.Response): The response to inspect.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def is_retryable_response(settings: Settings, response: Optional[requests.Response]) -> bool:
+    """
+    Check whether a response has a status code that should be retried.
+    """
+    return response is not None and response.status_code in settings.retry_statuses
+
+
+def retry_delay(settings: Settings, attempt: int,
+                response: Optional[requests.Response] = None) -> float:
+    """
+    Get the delay before the next attempt, honoring `Retry-After` when the server sent one.
+
+    The delay asked for by `Retry-After` is capped at `max_delay` like the backoff delay, so a
+    server cannot hold a retry for an arbitrary time.
+
+    Args:
+        settings (Settings): The retry settings.
+        attempt (int): The zero-based number of the attempt that just failed.
+        response (Optional[requests.Response]): The retryable response, if any.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    if response is not None and settings.respect_retry_after:
+        delay = retry_after(response)
+        if delay is not None:
+            return min(delay, settings.max_delay)
+    return backoff_delay(settings, attempt)
@@ -0,0 +1,194 @@
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.manager.cache import CacheEntry, ResponseCache, expiration_time
+from getman.settings import Settings
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = Counter()
+
+    def do_GET(self):
+        self.hits[self.path] += 1
+        headers = {"Content-Type": "application/json"}
+        if self.path.startswith("/fresh"):
+            headers["Cache-Control"] = "max-age=60"
+        elif self.path.startswith("/etag"):
+            headers["Cache-Control"] = "no-cache"
+            headers["ETag"] = '"v1"'
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                return
+        elif self.path.startswith("/nostore"):
+            headers["Cache-Control"] = "no-store"
+        body = f'{{"path": "{self.path}", "hit": {self.hits[self.path]}}}'.encode()
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        Handler.hits.clear()
+        self.client = self.make_client(Settings(cache=True))
+
+    def make_client(self, settings):
+        with patch('getman.client.Console'):
+            return GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}", settings=settings)
+
+    def test_fresh_response_is_served_from_memory(self):
+        route = self.client.routes("fresh")
+        first = self.client.request(HttpMethod.GET, route)
+        second = self.client.request(HttpMethod.GET, route)
+
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(Handler.hits["/fresh"], 1)
+        self.assertEqual(self.client.cache_stats()["hits"], 1)
+        self.assertEqual(self.client.cache_stats()["misses"], 1)
+
+    def test_query_parameters_are_part_of_the_key(self):
+        route = self.client.routes("fresh")
+        self.client.request(HttpMethod.GET, route, params={"page": 1})
+        self.client.request(HttpMethod.GET, route, params={"page": 2})
+        self.assertEqual(Handler.hits["/fresh?page=1"] + Handler.hits["/fresh?page=2"], 2)
+
+    def test_stale_response_is_revalidated_with_etag(self):
+        route = self.client.routes("etag")
+        first = self.client.request(HttpMethod.GET, route)
+        second = self.client.request(HttpMethod.GET, route)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(Handler.hits["/etag"], 2)
+        self.assertEqual(self.client.cache_stats()["revalidations"], 1)
+
+    def test_no_store_is_not_cached(self):
+        route = self.client.routes("nostore")
+        self.client.request(HttpMethod.GET, route)
+        self.client.request(HttpMethod.GET, route)
+        self.assertEqual(Handler.hits["/nostore"], 2)
+        self.assertEqual(len(self.client.cache), 0)
+
+    def test_disk_tier_survives_new_client(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings = Settings(cache=True, cache_dir=directory)
+            route = self.client.routes("fresh")
+            self.make_client(settings).request(HttpMethod.GET, route)
+            restarted = self.make_client(settings)
+            response = restarted.request(HttpMethod.GET, route)
+
+        self.assertEqual(response.json()["hit"], 1)
+        self.assertEqual(Handler.hits["/fresh"], 1)
+        self.assertEqual(restarted.cache_stats()["hits"], 1)
+
+    def test_asyncio_transport_uses_cache(self):
+        client = self.make_client(Settings(cache=True, transport=Transport.ASYNCIO))
+        route = client.routes("fresh")
+
+        async def fetch_twice():
+            try:
+                await client.perform_request(HttpMethod.GET, route)
+                return await client.perform_request(HttpMethod.GET, route)
+            finally:
+                await client.aclose()
+
+        self.assertEqual(asyncio.run(fetch_twice()).status_code, 200)
+        self.assertEqual(Handler.hits["/fresh"], 1)
+
+    def test_asyncio_transport_uses_disk_tier_off_the_loop(self):
+        threads = []
+        read, write = ResponseCache._read, ResponseCache._write
+
+        def spy(method):
+            def wrapped(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+            return wrapped
+
+        async def fetch(client):
+            try:
+                return await client.perform_request(HttpMethod.GET, client.routes("fresh"))
+            finally:
+                await client.aclose()
+
+        with tempfile.TemporaryDirectory() as directory, \
+                patch.object(ResponseCache, "_read", spy(read)), \
+                patch.object(ResponseCache, "_write", spy(write)):
+            settings = Settings(cache=True, cache_dir=directory, transport=Transport.ASYNCIO)
+            asyncio.run(fetch(self.make_client(settings)))
+            response = asyncio.run(fetch(self.make_client(settings)))
+
+        self.assertEqual(response.json()["hit"], 1)
+        self.assertEqual(Handler.hits["/fresh"], 1)
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_report_shows_cache_counters(self):
+        route = self.client.routes("fresh")
+        responses = [self.client.request(HttpMethod.GET, route) for _ in range(3)]
+        report = self.client.get_report(responses, show_cache=True)
+        self.assertIn("Cache: hits=2 misses=1 revalidations=0 stores=1 evictions=0", report)
+
+
+class TestCacheEntries(unittest.TestCase):
+
+    @staticmethod
+    def entry(url, size):
+        return CacheEntry(url=url, status=200, reason="OK", headers=[], content=b"x" * size,
+                          expires_at=time.time() + 60)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = ResponseCache(max_bytes=250)
+        for url in ("a", "b"):
+            cache.put(self.entry(url, 100))
+        cache.get("a")
+        cache.put(self.entry("c", 100))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.size, 200)
+        self.assertEqual(cache.stats["evictions"], 1)
+
+    def test_expiration_time(self):
+        now = time.time()
+        self.assertAlmostEqual(expiration_time([("Cache-Control", "max-age=60"), ("Age", "20")],
+                                               now), now + 40)
+        expires = [("Date", formatdate(now, usegmt=True)),
+                   ("Expires", formatdate(now + 30, usegmt=True))]
+        self.assertAlmostEqual(expiration_time(expires, now), now + 30, delta=1)
+        self.assertEqual(expiration_time([("Cache-Control", "no-cache, max-age=60")], now), now)
+
+
+if __name__ == '__main__':
+    unittest.main()
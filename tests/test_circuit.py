@@ -0,0 +1,111 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from getman.client import GetMan
+from getman.constant import CircuitState, HttpMethod
+from getman.manager.circuit import (CircuitBreaker, CircuitOpenError,
+                                    RetryBudget, host_key)
+from getman.settings import Settings
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_when_failure_share_is_reached(self):
+        breaker = CircuitBreaker(failure_threshold=0.5, window=4, min_requests=4)
+        for _ in range(2):
+            breaker.record_success()
+        breaker.record_failure()
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+        breaker.record_failure()
+        self.assertIs(breaker.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire("http://example.com:80")
+        self.assertEqual(breaker.rejected, 1)
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = CircuitBreaker(min_requests=1, reset_timeout=10)
+        with patch("getman.manager.circuit.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("getman.manager.circuit.time.monotonic", return_value=111.0):
+            self.assertIs(breaker.state, CircuitState.HALF_OPEN)
+            self.assertTrue(breaker.allow())
+            self.assertFalse(breaker.allow())
+            breaker.record_response(MagicMock(status_code=200))
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(min_requests=1, reset_timeout=10)
+        with patch("getman.manager.circuit.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("getman.manager.circuit.time.monotonic", return_value=111.0):
+            self.assertTrue(breaker.allow())
+            breaker.record_response(MagicMock(status_code=503))
+            self.assertIs(breaker.state, CircuitState.OPEN)
+
+    def test_host_key(self):
+        self.assertEqual(host_key("https://example.com/users?id=1"), "https://example.com:443")
+        self.assertEqual(host_key("http://localhost:8000/"), "http://localhost:8000")
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_retries_are_capped_to_share_of_requests(self):
+        budget = RetryBudget(ratio=0.1, min_retries=1)
+        retries = 0
+        for _ in range(100):
+            budget.record_request()
+            retries += budget.try_retry()
+        self.assertLessEqual(retries, 11)
+        self.assertEqual(budget.retries, retries)
+        self.assertEqual(budget.rejected, 100 - retries)
+
+
+class TestClientResilience(unittest.TestCase):
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.settings = Settings(circuit_breaker=True, circuit_min_requests=3, retries=1)
+        self.client = GetMan(base_url="http://example.com", settings=self.settings)
+
+    def test_open_circuit_fails_fast_without_sending(self):
+        with patch.object(self.client.session, "get",
+                          side_effect=requests.ConnectionError("refused")) as mock_get:
+            for _ in range(3):
+                self.assertIsNone(self.client.request(HttpMethod.GET, "http://example.com/a"))
+
+            start = time.perf_counter()
+            with self.assertRaises(CircuitOpenError):
+                self.client.request(HttpMethod.GET, "http://example.com/b")
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertLess(elapsed, 0.01)
+        self.assertIs(self.client.circuits.states()["http://example.com:80"], CircuitState.OPEN)
+
+    def test_circuits_are_per_host(self):
+        with patch.object(self.client.session, "get",
+                          side_effect=requests.ConnectionError("refused")):
+            for _ in range(3):
+                self.client.request(HttpMethod.GET, "http://example.com/a")
+        with patch.object(self.client.session, "get",
+                          return_value=MagicMock(status_code=200)) as mock_get:
+            self.client.request(HttpMethod.GET, "http://other.example.com/a")
+        mock_get.assert_called_once()
+
+    @patch("time.sleep", return_value=None)
+    def test_retry_budget_stops_retries(self, _):
+        self.client.settings = Settings(retries=3, retry_budget=0.1, retry_budget_reserve=1)
+        with patch.object(self.client.session, "get",
+                          side_effect=requests.Timeout("timeout")) as mock_get:
+            self.client.request(HttpMethod.GET, "http://example.com/a")
+            self.client.request(HttpMethod.GET, "http://example.com/a")
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.client.retry_budget.retries, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
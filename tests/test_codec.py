@@ -0,0 +1,135 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+from getman import Struct
+from getman.client import GetMan
+from getman.constant import HttpMethod
+from getman.settings import Settings
+from getman.transport import iter_ndjson
+from getman.utils.codec import (AVAILABLE_CODECS, JsonCodec, OrjsonCodec,
+                                get_codec)
+
+DOCUMENT = {"name": "Zoë", "items": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+
+class RecordingCodec(JsonCodec):
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj, indent=None, default=None):
+        self.calls.append("dumps")
+        return super().dumps(obj, indent=indent, default=default)
+
+    def loads(self, data):
+        self.calls.append(("loads", type(data)))
+        return super().loads(data)
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", self.headers["Content-Type"])
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCodecs(unittest.TestCase):
+
+    def test_codecs_round_trip_bytes(self):
+        for codec in (get_codec("json"), get_codec("auto")):
+            encoded = codec.dumps(DOCUMENT)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(codec.loads(encoded), DOCUMENT)
+            self.assertEqual(codec.loads(memoryview(encoded)), DOCUMENT)
+            self.assertEqual(codec.loads(codec.dumps_str(DOCUMENT, indent=2)), DOCUMENT)
+
+    def test_auto_prefers_installed_codec(self):
+        expected = OrjsonCodec if "orjson" in AVAILABLE_CODECS else JsonCodec
+        self.assertIsInstance(get_codec(), expected)
+        self.assertIs(get_codec("auto"), get_codec())
+        codec = RecordingCodec()
+        self.assertIs(get_codec(codec), codec)
+        with self.assertRaises(ValueError):
+            get_codec("unknown")
+
+    def test_bound_response_decodes_from_bytes(self):
+        codec = RecordingCodec()
+        response = requests.Response()
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response._content = codec.dumps(DOCUMENT)  # pylint: disable=protected-access
+        codec.bind(response)
+        self.assertEqual(response.json(), DOCUMENT)
+        self.assertEqual(codec.calls[-1], ("loads", bytes))
+
+        response._content = b"{invalid"  # pylint: disable=protected-access
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            response.json()
+
+    def test_ndjson_with_codec(self):
+        codec = RecordingCodec()
+        records = list(iter_ndjson([b'{"id": 1}\n{"id"', b': 2}\n'], codec=codec))
+        self.assertEqual(records, [{"id": 1}, {"id": 2}])
+        self.assertEqual(codec.calls, [("loads", bytes)] * 2)
+
+    def test_struct_to_json(self):
+        struct = Struct(name="John", address={"street": "123 Main St"})
+        for codec in ("json", "auto"):
+            self.assertEqual(get_codec(codec).loads(struct.to_json(codec=codec)),
+                             {"name": "John", "address": {"street": "123 Main St"}})
+        self.assertIn("\n  ", struct.to_json(indent=2))
+
+
+class TestClientCodec(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), JsonHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.codec = RecordingCodec()
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}",
+                             settings=Settings(json_codec=self.codec))
+
+    def test_request_and_response_use_codec(self):
+        response = self.client.request(HttpMethod.POST, self.client.routes("echo"), json=DOCUMENT)
+        self.assertEqual(response.request.headers["Content-Type"], "application/json")
+        self.assertEqual(response.json(), DOCUMENT)
+        self.assertEqual(self.codec.calls, ["dumps", ("loads", bytes)])
+
+    def test_report_uses_codec(self):
+        response = self.client.request(HttpMethod.POST, self.client.routes("echo"), json=DOCUMENT)
+        report = self.client.get_report(response)
+        self.assertIn('"name": "Zoë"', report)
+        self.assertEqual(self.codec.calls.count("dumps"), 2)
+
+    def test_explicit_content_type_is_kept(self):
+        compiled = self.client.prepare(HttpMethod.POST, self.client.routes("echo"), json=[1],
+                                       headers={"content-type": "application/vnd.api+json"})
+        self.assertEqual(compiled.header("Content-Type"), "application/vnd.api+json")
+        self.assertEqual(compiled.body, b"[1]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import json
+import operator
+import threading
+import unittest
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod
+from getman.models import Column, ColumnBatch
+from getman.models.columns import numpy
+
+RECORDS = [
+    {"id": 1, "name": "a", "price": {"amount": 1.5}, "quantity": 2, "active": True},
+    {"id": 2, "name": "b", "price": {"amount": 10}, "quantity": None, "active": False},
+    {"id": 3, "price": {"amount": 0.5, "currency": "EUR"}, "quantity": 5, "active": True},
+    "not an object",
+]
+
+
+class ItemsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        payload = json.dumps({"data": {"items": RECORDS}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class ColumnBatchTests:
+    backend = "array"
+
+    def setUp(self):
+        self.batch = ColumnBatch.from_records(RECORDS, backend=self.backend)
+
+    def test_fields_are_flattened_and_typed(self):
+        self.assertEqual(list(self.batch), ["id", "name", "price.amount", "price.currency",
+                                            "quantity", "active"])
+        self.assertEqual(len(self.batch), 4)
+        kinds = {name: self.batch[name].kind for name in self.batch}
+        self.assertEqual(kinds, {"id": "int", "name": "object", "price.amount": "float",
+                                 "price.currency": "object", "quantity": "int",
+                                 "active": "bool"})
+        self.assertEqual(self.batch["quantity"].to_list(), [2, None, 5, None])
+        self.assertEqual(self.batch["active"].to_list(), [True, False, True, None])
+        self.assertEqual(self.batch["price.amount"][1], 10.0)
+        self.assertIsNone(self.batch["name"][2])
+
+    def test_nulls_never_match(self):
+        quantity = self.batch["quantity"]
+        self.assertEqual(quantity.null_count(), 2)
+        self.assertEqual(quantity.gt(0).indices(), [0, 2])
+        self.assertEqual(quantity.ne(2).indices(), [2])
+        self.assertEqual(quantity.is_null().indices(), [1, 3])
+        self.assertFalse(quantity.gt(0).all())
+        self.assertTrue((quantity.gt(0) | quantity.is_null()).all())
+
+    def test_compare_and_combine(self):
+        amount = self.batch["price.amount"]
+        self.assertEqual(amount.between(1, 10).indices(), [0, 1])
+        self.assertEqual((~amount.lt(1) & amount.le(2)).indices(), [0])
+        self.assertEqual(amount.compare(operator.ge, 1.5).count(), 2)
+        self.assertEqual(self.batch["name"].isin(["a", "c"]).indices(), [0])
+        self.assertEqual(self.batch["name"].eq("b").indices(), [1])
+        self.assertEqual(self.batch["id"].isin({2, 3}).indices(), [1, 2])
+        self.assertTrue(self.batch["active"].eq(True).any())
+
+    def test_aggregates(self):
+        self.assertEqual(self.batch["quantity"].sum(), 7)
+        self.assertEqual(self.batch["quantity"].mean(), 3.5)
+        self.assertEqual(self.batch["quantity"].min(), 2)
+        self.assertEqual(self.batch["price.amount"].max(), 10.0)
+        self.assertEqual(self.batch["name"].min(), "a")
+        self.assertEqual(self.batch["price.currency"].count(), 1)
+        with self.assertRaises(TypeError):
+            self.batch["name"].sum()
+
+    def test_filter(self):
+        active = self.batch.filter(self.batch["active"].eq(True))
+        self.assertEqual(len(active), 2)
+        self.assertEqual(active.to_dict()["id"], [1, 3])
+        self.assertEqual(active["name"].to_list(), ["a", None])
+        self.assertEqual(active["quantity"].sum(), 7)
+        with self.assertRaises(ValueError):
+            active["id"].filter(self.batch["id"].gt(0))
+
+    def test_selected_fields(self):
+        batch = ColumnBatch.from_records(RECORDS, fields=["price.amount", "missing"],
+                                         backend=self.backend)
+        self.assertEqual(list(batch), ["price.amount", "missing"])
+        self.assertEqual(batch["missing"].null_count(), 4)
+        self.assertIsNone(batch["missing"].max())
+
+
+class TestArrayColumns(ColumnBatchTests, unittest.TestCase):
+
+    def test_values_are_typed_arrays(self):
+        self.assertIsInstance(self.batch["id"].values, array)
+        self.assertEqual(self.batch["price.amount"].values.typecode, "d")
+        self.assertIsInstance(self.batch["name"].values, list)
+
+    def test_large_integers_fall_back_to_objects(self):
+        column = Column.from_values("id", [2 ** 70, 1], backend="array")
+        self.assertEqual(column.kind, "object")
+        self.assertEqual(column.max(), 2 ** 70)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            ColumnBatch.from_records(RECORDS, backend="pandas")
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestNumpyColumns(ColumnBatchTests, unittest.TestCase):
+    backend = "numpy"
+
+    def test_values_are_numpy_arrays(self):
+        self.assertEqual(self.batch["id"].values.dtype, numpy.int64)
+        self.assertEqual(self.batch["quantity"].nulls.dtype, numpy.bool_)
+        self.assertIsInstance(self.batch["quantity"].sum(), int)
+
+
+class TestClientColumns(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ItemsHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}")
+
+    def test_to_columns(self):
+        response = self.client.request(HttpMethod.GET, self.client.routes("items"))
+        batch = self.client.to_columns(response, path="data.items", fields=["price.amount"],
+                                       backend="array")
+        self.assertEqual(list(batch), ["price.amount"])
+        self.assertEqual(batch["price.amount"].gt(0).count(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
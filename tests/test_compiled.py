@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.models import CompiledRequest
+from getman.settings import Settings
+
+
+def echo(method: str, path: str, headers, body: bytes) -> bytes:
+    return json.dumps({
+        "method": method,
+        "path": path,
+        "token": headers.get("x-token"),
+        "body": body.decode(),
+    }).encode()
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = echo(self.command, self.path, {"x-token": self.headers.get("X-Token")}, body)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCompiledRequest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}")
+        self.client.session.headers["X-Token"] = "session"
+
+    def test_prepare_serializes_body_and_headers(self):
+        compiled = self.client.prepare(HttpMethod.POST, self.client.routes("items"),
+                                       data={"a": "b"}, params={"page": 1})
+        self.assertEqual(compiled.method, "POST")
+        self.assertTrue(compiled.url.endswith("/items?page=1"))
+        self.assertEqual(compiled.body, b"a=b")
+        self.assertEqual(compiled.header("content-type"), "application/x-www-form-urlencoded")
+        self.assertEqual(compiled.header("x-token"), "session")
+
+    def test_compiled_requests_are_hashable(self):
+        route = self.client.routes("items")
+        first = self.client.prepare(HttpMethod.POST, route, data={"a": "b"})
+        second = self.client.prepare(HttpMethod.POST, route, data={"a": "b"})
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        with self.assertRaises(AttributeError):
+            first.body = b"changed"
+
+    def test_send_many_times(self):
+        compiled = self.client.prepare(HttpMethod.POST, self.client.routes("items"),
+                                       data={"a": "b"})
+        responses = [self.client.send(compiled) for _ in range(5)]
+        self.assertTrue(all(response.json() == responses[0].json() for response in responses))
+        self.assertEqual(responses[0].json()["body"], "a=b")
+        self.assertEqual(len(self.client.histogram), 5)
+
+    def test_send_with_overrides(self):
+        compiled = self.client.prepare(HttpMethod.POST, self.client.routes("items"),
+                                       data={"a": "b"})
+        response = self.client.send(compiled, headers={"x-token": "override"},
+                                    params={"page": 2}, body="c=d")
+        self.assertEqual(response.json(), {
+            "method": "POST", "path": "/items?page=2", "token": "override", "body": "c=d",
+        })
+        self.assertEqual(compiled.body, b"a=b")
+
+    def test_streamed_bodies_cannot_be_compiled(self):
+        with self.assertRaises(TypeError):
+            self.client.prepare(HttpMethod.POST, self.client.routes("items"),
+                                data=(chunk for chunk in [b"a"]))
+
+    def test_queued_compiled_requests_run_threaded(self):
+        compiled = self.client.prepare(HttpMethod.GET, self.client.routes("items"))
+        for _ in range(3):
+            self.client.send(compiled, queue=True)
+        responses = self.client.execute_queue_threaded(max_workers=3)
+        self.assertEqual([response.status_code for response in responses], [200] * 3)
+
+
+class TestAsyncCompiledRequest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{port}",
+                                 settings=Settings(transport=Transport.ASYNCIO))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                method, path, _ = line.decode().split(" ")
+                headers = {}
+                while (header := await reader.readline()) != b"\r\n":
+                    key, _, value = header.decode().partition(":")
+                    headers[key.lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                payload = echo(method, path, headers, body)
+                writer.write(b"HTTP/1.1 200 OK\r\n"
+                             + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_perform_send_queued(self):
+        compiled = self.client.prepare(HttpMethod.PUT, self.client.routes("items"), json={"a": 1})
+        for _ in range(10):
+            await self.client.perform_send(compiled, queue=True)
+        responses = await self.client.execute_queue()
+        self.assertEqual({response.json()["body"] for response in responses}, {'{"a":1}'})
+        self.assertEqual(self.client.connection_stats()[self.client.base_url]["new"], 10)
+
+    async def test_constructed_directly(self):
+        compiled = CompiledRequest("POST", f"{self.client.base_url}/raw",
+                                   (("Content-Length", "2"),), b"hi")
+        response = await self.client.perform_send(compiled)
+        self.assertEqual(response.json()["body"], "hi")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
+import asyncio
 import unittest
 import warnings
 from unittest.mock import MagicMock, patch
 
 import requests
 
+from getman.settings import Settings
 from getman.utils.decorators import deprecated, platform_checker, retry_request
+from getman.utils.retry import backoff_delay, retry_after, retry_delay
 
 
 class TestDecorators(unittest.TestCase):
@@ -38,16 +41,92 @@ class TestDecorators(unittest.TestCase):
             self.assertIn("2.0", str(w[-1].message))
 
     @patch("time.sleep", return_value=None)
-    def test_retry_request(self, _):
-        settings = MagicMock(retries=3, delay=1, timeout_increment=1, timeout=1)
+    def test_retry_request(self, mock_sleep):
+        settings = Settings(retries=3, delay=1, timeout_increment=1, timeout=1, jitter=False)
+        timeouts = []
 
         @retry_request()
         def mock_request(settings):
+            timeouts.append(settings.timeout)
             raise requests.Timeout("Timeout error")
 
         result = mock_request(settings=settings)
         self.assertIsNone(result)
-        self.assertEqual(settings.timeout, 4)
+        self.assertEqual(timeouts, [1, 2, 3])
+        self.assertEqual(settings.timeout, 1)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2])
+
+    @patch("time.sleep", return_value=None)
+    def test_retry_request_retries_status_and_honors_retry_after(self, mock_sleep):
+        settings = Settings(retries=3)
+        responses = [
+            MagicMock(status_code=503, headers={"Retry-After": "7"}),
+            MagicMock(status_code=200, headers={}),
+        ]
+
+        @retry_request()
+        def mock_request(settings):
+            return responses.pop(0)
+
+        self.assertEqual(mock_request(settings=settings).status_code, 200)
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("time.sleep", return_value=None)
+    def test_retry_request_logs_only_retries_made(self, mock_sleep):
+        @retry_request()
+        def mock_request(settings):
+            return MagicMock(status_code=503, headers={})
+
+        @retry_request()
+        async def mock_async_request(settings):
+            return MagicMock(status_code=503, headers={})
+
+        with self.assertNoLogs("getman"):
+            self.assertEqual(mock_request(settings=Settings()).status_code, 503)
+            self.assertEqual(asyncio.run(mock_async_request(settings=Settings())).status_code, 503)
+
+        with self.assertLogs("getman") as logs:
+            mock_request(settings=Settings(retries=3, delay=0))
+        self.assertEqual([record.getMessage() for record in logs.records], [
+            "Retry 1: status 503", "Retry 2: status 503", "Request failed after maximum retries.",
+        ])
+
+    def test_async_retry_request_uses_asyncio_sleep(self):
+        settings = Settings(retries=2, jitter=False, delay=0.5)
+        calls = []
+
+        @retry_request()
+        async def mock_request(settings):
+            calls.append(settings.timeout)
+            if len(calls) == 1:
+                raise requests.ConnectionError("Connection error")
+            return MagicMock(status_code=200)
+
+        real_sleep = asyncio.sleep
+        with patch("asyncio.sleep", new=MagicMock(side_effect=lambda delay: real_sleep(0))) \
+                as mock_sleep, patch("time.sleep") as mock_time_sleep:
+            result = asyncio.run(mock_request(settings=settings))
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(calls, [20, 30])
+        mock_sleep.assert_called_once_with(0.5)
+        mock_time_sleep.assert_not_called()
+
+    def test_backoff_delay(self):
+        settings = Settings(delay=1, backoff_factor=2, max_delay=5, jitter=False)
+        self.assertEqual([backoff_delay(settings, attempt) for attempt in range(4)], [1, 2, 4, 5])
+        jittered = backoff_delay(Settings(delay=1, jitter=True), 3)
+        self.assertTrue(0 <= jittered <= 8)
+
+    def test_retry_after_parses_http_date(self):
+        response = MagicMock(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        self.assertEqual(retry_after(response), 0.0)
+        self.assertIsNone(retry_after(MagicMock(headers={"Retry-After": "soon"})))
+
+    def test_retry_delay_caps_retry_after(self):
+        settings = Settings(max_delay=5)
+        self.assertEqual(retry_delay(settings, 0, MagicMock(headers={"Retry-After": "3600"})), 5)
+        self.assertEqual(retry_delay(settings, 0, MagicMock(headers={"Retry-After": "2"})), 2)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+import asyncio
+import math
+import random
+import socket
+import statistics
+import time
+import unittest
+
+import requests
+
+from getman.mock import (Fault, FaultProfile, Fixed, LogNormal, MockMan,
+                         MockResponse, Uniform)
+
+
+class TestFaultProfile(unittest.TestCase):
+
+    def test_distributions(self):
+        rng = random.Random(1)
+        self.assertEqual(Fixed(0.2).sample(rng), 0.2)
+        self.assertTrue(all(1 <= Uniform(1, 2).sample(rng) <= 2 for _ in range(100)))
+        samples = [LogNormal(0.1, 0.5).sample(rng) for _ in range(2000)]
+        self.assertAlmostEqual(statistics.median(samples), 0.1, delta=0.01)
+        self.assertLessEqual(max(LogNormal(0.1, 3, maximum=1).sample(rng) for _ in range(100)), 1)
+
+    def test_apply(self):
+        response = MockResponse(body="ok")
+        self.assertIs(FaultProfile().apply(response), response)
+        fault = FaultProfile(latency=0.5).apply(response)
+        self.assertEqual(fault, Fault(response, 0.5))
+
+        error = FaultProfile(error_rate=1, error_status=[500, 502], retry_after=2).apply(response)
+        self.assertIn(error.status, (500, 502))
+        self.assertEqual(error.headers, [("Retry-After", "2")])
+        self.assertTrue(FaultProfile(reset_rate=1).apply(response).reset)
+        self.assertEqual(FaultProfile(stall_rate=1).apply(response).stall, math.inf)
+        self.assertEqual(FaultProfile(drip_rate=1, drip_bytes=4).apply(response).drip, (4, 0.1))
+        with self.assertRaises(ValueError):
+            FaultProfile(error_rate=2)
+
+    def test_seed_replays_the_same_faults(self):
+        def draws(seed):
+            profile = FaultProfile(latency=Uniform(0, 1), error_rate=0.5, seed=seed)
+            return [profile.apply(MockResponse()) for _ in range(20)]
+        self.assertEqual([repr(fault) for fault in draws(7)], [repr(fault) for fault in draws(7)])
+
+
+class TestFaultInjection(unittest.TestCase):
+
+    def setUp(self):
+        self.mockman = MockMan(host="127.0.0.1", port=0, mock={"/fast": "fast", "/slow": "slow"})
+        self.server = self.mockman.start()
+        self.addCleanup(self.server.stop_background)
+        self.url = f"http://127.0.0.1:{self.server.port}"
+
+    def test_latency_does_not_block_other_connections(self):
+        self.mockman.add_fault("/slow", FaultProfile(latency=0.5))
+
+        async def fetch(path):
+            reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+            writer.write(f"GET {path} HTTP/1.1\r\n\r\n".encode())
+            await reader.readuntil(b"\r\n\r\n")
+            writer.close()
+            return time.perf_counter()
+
+        async def scenario():
+            start = time.perf_counter()
+            slow = [fetch("/slow") for _ in range(100)]
+            done = await asyncio.gather(fetch("/fast"), *slow)
+            return done[0] - start, max(done) - start
+
+        fast, slowest = asyncio.run(scenario())
+        self.assertLess(fast, 0.4)
+        self.assertGreaterEqual(slowest, 0.5)
+        self.assertLess(slowest, 2.0)
+
+    def test_pipelined_order_is_kept_behind_a_delay(self):
+        self.mockman.add_fault("GET /slow", FaultProfile(latency=0.2))
+        with socket.create_connection(("127.0.0.1", self.server.port)) as sock:
+            sock.sendall(b"GET /slow HTTP/1.1\r\n\r\nGET /fast HTTP/1.1\r\nConnection: close\r\n\r\n")
+            data = b""
+            while chunk := sock.recv(65536):
+                data += chunk
+        self.assertLess(data.index(b"slow"), data.index(b"fast"))
+
+    def test_error_status_and_retry_after(self):
+        self.mockman.add_fault("*", FaultProfile(error_rate=1, error_status=429, retry_after=3))
+        response = requests.get(f"{self.url}/fast", timeout=5)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "3")
+        self.mockman.remove_fault("*")
+        self.assertEqual(requests.get(f"{self.url}/fast", timeout=5).text, "fast")
+
+    def test_reset(self):
+        self.mockman.add_fault("/fast", FaultProfile(reset_rate=1))
+        with self.assertRaises(requests.ConnectionError):
+            requests.get(f"{self.url}/fast", timeout=5)
+
+    def test_stall(self):
+        self.mockman.add_fault("/fast", FaultProfile(stall_rate=1))
+        start = time.perf_counter()
+        with self.assertRaises(requests.ReadTimeout):
+            requests.get(f"{self.url}/fast", timeout=0.3)
+        self.assertLess(time.perf_counter() - start, 2)
+        self.mockman.add_fault("/slow", FaultProfile(stall_rate=1, stall=0.2))
+        self.assertEqual(requests.get(f"{self.url}/slow", timeout=5).text, "slow")
+
+    def test_drip(self):
+        self.mockman.add_mock("/body", "x" * 10)
+        self.mockman.add_fault("/body", FaultProfile(drip_rate=1, drip_bytes=2, drip_interval=0.05))
+        start = time.perf_counter()
+        response = requests.get(f"{self.url}/body", timeout=5)
+        self.assertEqual(response.text, "x" * 10)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
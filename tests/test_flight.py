@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.manager.dict import DictManager, ParamManager
+from getman.manager.flight import SingleFlight, flight_key
+from getman.settings import Settings
+
+
+class TestSingleFlightClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = 0
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{port}", settings=Settings(
+                transport=Transport.ASYNCIO, single_flight=True,
+            ))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                method = line.decode().split(" ")[0]
+                length = 0
+                while (header := await reader.readline()) != b"\r\n":
+                    key, _, value = header.decode().partition(":")
+                    if key.lower() == "content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                self.requests += 1
+                await asyncio.sleep(0.1)
+                payload = f'{{"method": "{method}", "count": {self.requests}}}'.encode()
+                writer.write(b"HTTP/1.1 200 OK\r\n"
+                             + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_identical_queued_gets_share_one_request(self):
+        route = self.client.routes("items")
+        for _ in range(10):
+            params = ParamManager()
+            params.add("page", 1)
+            await self.client.perform_request(HttpMethod.GET, route, params=params, queue=True)
+
+        results = await self.client.execute_queue()
+
+        self.assertEqual(self.requests, 1)
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(response is results[0] for response in results))
+        self.assertEqual(dict(self.client.flights.stats), {"calls": 1, "shared": 9})
+
+    async def test_different_params_are_not_shared(self):
+        route = self.client.routes("items")
+        for page in range(3):
+            await self.client.perform_request(HttpMethod.GET, route, params={"page": page},
+                                              queue=True)
+        await self.client.execute_queue()
+        self.assertEqual(self.requests, 3)
+
+    async def test_posts_are_never_shared(self):
+        route = self.client.routes("items")
+        for _ in range(3):
+            await self.client.perform_request(HttpMethod.POST, route, data={"a": "b"}, queue=True)
+        await self.client.execute_queue()
+        self.assertEqual(self.requests, 3)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_threads_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        barrier = threading.Barrier(5)
+
+        def slow_call():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(flight.call("key", slow_call))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+
+    def test_errors_are_shared_and_key_is_released(self):
+        flight = SingleFlight()
+
+        def failing_call():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            flight.call("key", failing_call)
+        self.assertEqual(flight.call("key", lambda: "retried"), "retried")
+
+    def test_flight_key(self):
+        first, second = DictManager({"a": 1}), DictManager({"a": 1})
+        self.assertEqual(flight_key(HttpMethod.GET, "url", first), flight_key("GET", "url", second))
+        self.assertIsNone(flight_key(HttpMethod.POST, "url"))
+        self.assertEqual(flight_key("get", "url", {"ids": [1, 2]}),
+                         flight_key("get", "url", {"ids": [1, 2]}))
+
+    def test_headers_changed_during_the_flight(self):
+        flight = SingleFlight()
+        headers = DictManager({"a": "1"})
+
+        def call():
+            headers.add("b", "2")
+            return "result"
+
+        self.assertEqual(flight.call(flight_key("GET", "url", headers=headers), call), "result")
+        self.assertEqual(flight._calls, {})  # pylint: disable=protected-access
+
+        async def acall():
+            headers.add("c", "3")
+            return "result"
+
+        async def scenario():
+            return await flight.acall(flight_key("GET", "url", headers=headers), acall)
+
+        self.assertEqual(asyncio.run(scenario()), "result")
+        self.assertEqual(flight._tasks, {})  # pylint: disable=protected-access
+
+    def test_dict_manager_hash_is_reset_on_change(self):
+        params = ParamManager()
+        params.add("a", 1)
+        before = hash(params)
+        params.add("b", 2)
+        self.assertNotEqual(before, hash(params))
+        self.assertEqual(hash(params), hash(DictManager({"b": 2, "a": 1})))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -74,6 +76,95 @@ class TestGetMan(unittest.TestCase):
         asyncio.run(self.client.perform_request(HttpMethod.GET, queue=False))
         self.client.async_request.assert_called_once()
 
+    def test_stream_queue_bounds_in_flight_requests(self):
+        in_flight = []
+        peak = []
+
+        async def fake_request(method, routes, *args, **kwargs):
+            in_flight.append(routes)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01 if routes % 2 else 0.02)
+            in_flight.remove(routes)
+            return routes
+
+        async def run():
+            self.client.clear_queue()
+            self.client.async_request = fake_request
+            for route in range(1, 11):
+                self.client.request(HttpMethod.GET, route, queue=True)
+            return [item async for item in self.client.stream_queue(max_in_flight=3)]
+
+        results = asyncio.run(run())
+        self.assertEqual(max(peak), 3)
+        self.assertEqual(sorted(results), [(index, index + 1) for index in range(10)])
+        self.assertTrue(self.client.is_queue_empty())
+
+    def test_execute_queue_with_limit_keeps_queue_order(self):
+        async def fake_request(method, routes, *args, **kwargs):
+            await asyncio.sleep(0.01 * (6 - routes))
+            return routes
+
+        async def run():
+            self.client.clear_queue()
+            self.client.async_request = fake_request
+            for route in range(1, 6):
+                self.client.request(HttpMethod.GET, route, queue=True)
+            return await self.client.execute_queue(max_in_flight=2)
+
+        self.assertEqual(asyncio.run(run()), [1, 2, 3, 4, 5])
+
+    def test_stream_queue_rejects_limit_below_one(self):
+        async def run():
+            return [item async for item in self.client.stream_queue(max_in_flight=0)]
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+    def test_execute_queue_threaded_uses_session_per_thread(self):
+        sessions = set()
+        threads = set()
+
+        def fake_get(url, **kwargs):
+            sessions.add(id(self.client.session))
+            threads.add(threading.get_ident())
+            time.sleep(0.05)
+            return url
+
+        self.client.clear_queue()
+        for route in range(8):
+            self.client.request(HttpMethod.GET, f"users/{route}", queue=True)
+        self.client.request(HttpMethod.GET, "urgent", queue=True, priority=0)
+
+        with patch.object(self.client, 'get', side_effect=fake_get):
+            start = time.perf_counter()
+            results = self.client.execute_queue_threaded(max_workers=4)
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, [f"users/{route}" for route in range(8)] + ["urgent"])
+        self.assertEqual(len(sessions), len(threads))
+        self.assertNotIn(id(self.client.session), sessions)
+        self.assertLess(elapsed, 0.3)
+
+    @patch('getman.client.GetMan.post')
+    def test_request_batch_returns_results_in_order(self, mock_post):
+        mock_post.side_effect = lambda url, **kwargs: url
+        batch = [{"method": HttpMethod.POST, "routes": f"items/{index}"} for index in range(5)]
+        results = self.client.request_batch(batch, max_workers=3)
+        self.assertEqual(results, [f"items/{index}" for index in range(5)])
+
+    @patch('getman.client.Console')
+    def test_session_is_per_instance(self, mock_console):
+        settings = Settings(pool_maxsize=32, pool_block=True, keep_alive=False)
+        other = GetMan(base_url="https://example.com", settings=settings)
+        self.client.add_cookie("sessionid", "first")
+
+        self.assertIsNot(self.client.session, other.session)
+        self.assertIsNone(other.get_cookie("sessionid"))
+        adapter = other.session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(other.session.headers["Connection"], "close")
+
     def test_get_report_raises_value_error_when_no_data_provided(self):
         with self.assertRaises(ValueError):
             self.client.get_report(None)
@@ -93,5 +184,20 @@ class TestGetMan(unittest.TestCase):
         self.assertIn("JSON Response: {\n  \"key\": \"value\"\n}", result)
         self.assertIn("Elapsed Time (seconds): 1.23", result)
 
+    def test_get_report_aggregates_batches(self):
+        batch = []
+        for elapsed, status in ((0.1, 200), (0.2, 200), (0.4, 500)):
+            response = MagicMock(status_code=status)
+            response.elapsed.total_seconds.return_value = elapsed
+            batch.append(response)
+        batch.append(None)
+
+        result = self.client.get_report(batch)
+        self.assertIn("Requests: 4", result)
+        self.assertIn("Failed Requests: 1", result)
+        self.assertIn("Status Codes: {200: 2, 500: 1}", result)
+        self.assertIn("count=3", result)
+        self.assertIn("max=0.400000", result)
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,52 @@
+import pickle
+import unittest
+
+from getman.models.histogram import LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def setUp(self):
+        self.histogram = LatencyHistogram()
+
+    def test_empty_histogram(self):
+        self.assertEqual(self.histogram.percentile(99), 0.0)
+        self.assertEqual(self.histogram.mean, 0.0)
+
+    def test_percentiles_within_precision(self):
+        self.histogram.record_many(index / 1000 for index in range(1, 1001))
+        self.assertEqual(self.histogram.total, 1000)
+        self.assertAlmostEqual(self.histogram.percentile(50), 0.5, delta=0.005)
+        self.assertAlmostEqual(self.histogram.percentile(99), 0.99, delta=0.01)
+        self.assertAlmostEqual(self.histogram.max, 1.0)
+        self.assertAlmostEqual(self.histogram.min, 0.001)
+        self.assertEqual(set(self.histogram.percentiles()), {"p50", "p90", "p99", "p99.9", "max"})
+
+    def test_memory_is_constant(self):
+        size = len(self.histogram.counts)
+        self.histogram.record_many(index / 10_000 for index in range(100_000))
+        self.assertEqual(len(self.histogram.counts), size)
+
+    def test_values_above_range_are_clamped(self):
+        histogram = LatencyHistogram(highest=1)
+        histogram.record(5)
+        self.assertAlmostEqual(histogram.max, 1.0)
+
+    def test_merge_after_pickling(self):
+        self.histogram.record(0.01)
+        other = LatencyHistogram()
+        other.record(0.5)
+        other = pickle.loads(pickle.dumps(other))
+
+        self.histogram.merge(other)
+        self.assertEqual(self.histogram.total, 2)
+        self.assertAlmostEqual(self.histogram.min, 0.01)
+        self.assertAlmostEqual(self.histogram.max, 0.5)
+
+    def test_merge_rejects_different_layouts(self):
+        with self.assertRaises(ValueError):
+            self.histogram.merge(LatencyHistogram(significant_figures=3))
+
+
+if __name__ == '__main__':
+    unittest.main()
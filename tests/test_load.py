@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod
+from getman.load import LoadReport, LoadStats, Workload, _run_shard, split_total
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200 if self.path != "/missing" else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLoad(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @patch('getman.client.Console')
+    def setUp(self, mock_console):
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}")
+
+    def test_split_total(self):
+        self.assertEqual(split_total(10, 3), [4, 3, 3])
+
+    def test_load_test_merges_worker_stats(self):
+        report = self.client.load_test(HttpMethod.GET, self.client.routes("items"),
+                                       total=40, processes=2)
+        self.assertEqual(report.processes, 2)
+        self.assertEqual(report.total, 40)
+        self.assertEqual(report.status_counts, {200: 40})
+        self.assertEqual(report.errors, 0)
+        self.assertGreater(report.throughput, 0)
+        self.assertIn("Requests: 40 (2 processes)", report.summary())
+
+    def test_session_reuses_connections(self):
+        for _ in range(3):
+            self.assertEqual(self.client.request(HttpMethod.GET, self.client.routes("items"))
+                             .status_code, 200)
+        stats = self.client.connection_stats()[self.client.base_url]
+        self.assertEqual(dict(stats), {"new": 1, "reused": 2})
+
+    def test_report_counts_failures_as_errors(self):
+        stats = LoadStats()
+        for status, latency in ((200, 0.1), (0, 0.2), (503, 0.3), (404, 0.4)):
+            stats.record(status, latency)
+        report = LoadReport(stats=stats, processes=1)
+        self.assertEqual(report.errors, 2)
+        self.assertAlmostEqual(report.percentile(50), 0.2, delta=0.002)
+        self.assertAlmostEqual(report.percentile(100), 0.4, delta=0.002)
+
+    @patch('getman.client.Console')
+    def test_unexpected_errors_are_counted(self, mock_console):
+        workload = Workload(base_url=self.client.base_url)
+        with patch.object(GetMan, "async_request", side_effect=RuntimeError("boom")):
+            stats = asyncio.run(_run_shard(workload, 3, GetMan))
+        self.assertEqual(stats.statuses, {0: 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
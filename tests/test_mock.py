@@ -0,0 +1,265 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod
+from getman.mock import MockCluster, MockMan, MockRequest, MockResponse
+from getman.mock.server import BadRequest, MockProtocol, parse_chunked, parse_head
+
+
+def read_response(sock: socket.socket, buffer: bytearray) -> bytes:
+    """
+    Read one response with a Content-Length body from a socket.
+    """
+    while b"\r\n\r\n" not in buffer:
+        buffer += sock.recv(65536)
+    head, _, rest = bytes(buffer).partition(b"\r\n\r\n")
+    length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+    while len(rest) < length:
+        rest += sock.recv(65536)
+    buffer[:] = rest[length:]
+    return head + b"\r\n\r\n" + rest[:length]
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_parse_head(self):
+        buffer = bytearray(b"post /a?b=1 HTTP/1.1\r\nContent-Length: 3\r\nConnection: Close\r\n\r\n")
+        request, framing = parse_head(buffer, 0, len(buffer) - 4)
+        self.assertEqual((request.method, request.path, request.query), ("POST", "/a", {"b": "1"}))
+        self.assertEqual(request.header("connection"), "Close")
+        self.assertEqual(framing, (3, False, False))
+
+        buffer = bytearray(b"GET / HTTP/1.0\r\nConnection: keep-alive\r\n\r\n")
+        self.assertTrue(parse_head(buffer, 0, len(buffer) - 4)[1].keep_alive)
+
+        buffer = bytearray(b"POST / HTTP/1.1\r\nContent-Length: -5\r\n\r\n")
+        with self.assertRaises(BadRequest):
+            parse_head(buffer, 0, len(buffer) - 4)
+
+    def test_parse_chunked(self):
+        buffer = bytearray(b"3;ext=1\r\nabc\r\n2\r\nde\r\n0\r\nX-Trailer: 1\r\n\r\nnext")
+        body, end = parse_chunked(buffer, 0)
+        self.assertEqual(body, b"abcde")
+        self.assertEqual(buffer[end:], b"next")
+        self.assertIsNone(parse_chunked(bytearray(b"3\r\nab"), 0))
+        with self.assertRaises(BadRequest):
+            parse_chunked(bytearray(b"-3\r\nabc\r\n0\r\n\r\n"), 0)
+
+    def test_reading_resumes_once_writes_and_deferred_requests_drain(self):
+        protocol = MockProtocol(MagicMock())
+        transport = MagicMock()
+        protocol.connection_made(transport)
+        protocol.pause_writing()
+        protocol._deferred_paused = True
+        protocol.resume_writing()
+        transport.resume_reading.assert_not_called()
+        protocol.pause_writing()
+        protocol._deferred_paused = False
+        protocol._resume_reading()
+        transport.resume_reading.assert_not_called()
+        protocol.resume_writing()
+        transport.resume_reading.assert_called_once()
+
+    def test_response_encoding(self):
+        message = MockResponse(201, {"a": 1}, {"X-Id": "1"}).encode(keep_alive=False)
+        self.assertTrue(message.startswith(b"HTTP/1.1 201 Created\r\n"))
+        self.assertIn(b"Content-Type: application/json\r\n", message)
+        self.assertIn(b"Connection: close\r\nX-Id: 1\r\n", message)
+        self.assertTrue(message.endswith(b'\r\n\r\n{"a":1}'))
+        self.assertTrue(MockResponse(body="x").encode(include_body=False).endswith(b"\r\n\r\n"))
+
+    def test_prepared_response(self):
+        response = MockResponse(body={"a": 1}, headers={"X-Id": "1"}).prepare()
+        message = response.encode()
+        self.assertIs(response.encode(), message)
+        self.assertEqual(message, MockResponse(body={"a": 1}, headers={"X-Id": "1"}).encode())
+        self.assertEqual(response.encode(keep_alive=False, include_body=False),
+                         MockResponse(body={"a": 1}, headers={"X-Id": "1"}).encode(False, False))
+
+    def test_file_response(self):
+        with tempfile.NamedTemporaryFile("wb", suffix=".json", delete=False) as file:
+            file.write(b'{"big":true}')
+        self.addCleanup(os.unlink, file.name)
+        response = MockResponse(body=Path(file.name)).prepare()
+        self.assertEqual(response.file, file.name)
+        head = response.encode(include_body=False)
+        self.assertIn(b"Content-Type: application/json\r\nContent-Length: 12\r\n", head)
+        self.assertEqual(response.encode(), head + b'{"big":true}')
+
+
+class TestMockServer(unittest.TestCase):
+
+    def setUp(self):
+        self.mockman = MockMan(host="127.0.0.1", port=0)
+        self.mockman.add_mock("GET /users", [{"id": 1}])
+        self.mockman.add_mock("users/1", {"id": 1})
+        self.mockman.add_mock("POST /users",
+                              lambda request: MockResponse(201, request.json(), {"X-Len": len(request.body)}))
+        self.server = self.mockman.start()
+        self.addCleanup(self.server.stop_background)
+
+    def connect(self) -> socket.socket:
+        sock = socket.create_connection(("127.0.0.1", self.server.port))
+        self.addCleanup(sock.close)
+        return sock
+
+    @patch('getman.client.Console')
+    def test_client_against_mock_routes(self, _):
+        client = GetMan(base_url=f"http://127.0.0.1:{self.server.port}")
+        self.assertEqual(client.request(HttpMethod.GET, client.routes("users")).json(), [{"id": 1}])
+        self.assertEqual(client.request(HttpMethod.DELETE, client.routes("users", "1")).json(), {"id": 1})
+        response = client.request(HttpMethod.POST, client.routes("users"), json={"name": "x"})
+        self.assertEqual((response.status_code, response.json()), (201, {"name": "x"}))
+        self.assertEqual(response.headers["X-Len"], str(len(response.request.body)))
+        response = client.request(HttpMethod.GET, client.routes("other"), params={"q": "1"})
+        self.assertEqual(response.json(), {"message": "Mock GET request received", "params": {"q": "1"}})
+        self.assertEqual(client.request(HttpMethod.PUT, client.routes("other")).status_code, 400)
+        stats = client.connection_stats()[f"http://127.0.0.1:{self.server.port}"]
+        self.assertEqual((stats["new"], stats["reused"]), (1, 4))
+
+    def test_pipelined_requests_are_answered_in_order(self):
+        sock = self.connect()
+        body = b'{"n":1}'
+        sock.sendall(b"GET /users HTTP/1.1\r\n\r\n"
+                     + b"POST /users HTTP/1.1\r\nContent-Length: 7\r\n\r\n" + body
+                     + b"GET /users/1 HTTP/1.1\r\n\r\n")
+        buffer = bytearray()
+        responses = [read_response(sock, buffer) for _ in range(3)]
+        self.assertTrue(responses[0].endswith(b'[{"id":1}]'))
+        self.assertTrue(responses[1].startswith(b"HTTP/1.1 201") and responses[1].endswith(body))
+        self.assertTrue(responses[2].endswith(b'{"id":1}'))
+        self.assertEqual(self.server.requests, 3)
+
+    def test_split_and_chunked_bodies(self):
+        sock = self.connect()
+        buffer = bytearray()
+        sock.sendall(b"POST /users HTTP/1.1\r\nContent-Le")
+        sock.sendall(b"ngth: 9\r\n\r\n{\"a\"")
+        sock.sendall(b":100}")
+        self.assertTrue(read_response(sock, buffer).endswith(b'{"a":100}'))
+        sock.sendall(b"POST /users HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n4\r\n{\"b\"\r\n")
+        sock.sendall(b"3\r\n:2}\r\n0\r\n\r\n")
+        self.assertTrue(read_response(sock, buffer).endswith(b'{"b":2}'))
+
+    def test_connection_close_and_bad_requests(self):
+        sock = self.connect()
+        sock.sendall(b"HEAD /users HTTP/1.1\r\nConnection: close\r\n\r\n")
+        response = sock.recv(65536)
+        self.assertIn(b"Content-Length: 10\r\n", response)
+        self.assertTrue(response.endswith(b"Connection: close\r\n\r\n"))
+        self.assertEqual(sock.recv(65536), b"")
+
+        sock = self.connect()
+        sock.sendall(b"NOT HTTP\r\n\r\n")
+        self.assertTrue(sock.recv(65536).startswith(b"HTTP/1.1 400 Bad Request"))
+        self.assertEqual(sock.recv(65536), b"")
+
+    def test_file_mocks_are_sent_with_sendfile(self):
+        with tempfile.NamedTemporaryFile("wb", suffix=".bin", delete=False) as file:
+            file.write(bytes(range(256)) * 1024)
+        self.addCleanup(os.unlink, file.name)
+        self.mockman.add_mock("/file", Path(file.name))
+        sock = self.connect()
+        sock.sendall(b"GET /file HTTP/1.1\r\n\r\nHEAD /file HTTP/1.1\r\n\r\n"
+                     b"GET /users HTTP/1.1\r\n\r\n")
+        buffer = bytearray()
+        response = read_response(sock, buffer)
+        self.assertIn(b"Content-Type: application/octet-stream", response)
+        self.assertTrue(response.endswith(bytes(range(256)) * 1024))
+        while b"\r\n\r\n" not in buffer:
+            buffer += sock.recv(65536)
+        head = bytes(buffer[:buffer.index(b"\r\n\r\n") + 4])
+        del buffer[:len(head)]
+        self.assertIn(b"Content-Length: 262144\r\n", head)
+        self.assertTrue(read_response(sock, buffer).endswith(b'[{"id":1}]'))
+
+    def test_handler_errors_return_500(self):
+        self.mockman.add_mock("/error", lambda request: 1 / 0)
+        sock = self.connect()
+        sock.sendall(b"GET /error HTTP/1.1\r\n\r\nGET /users HTTP/1.1\r\n\r\n")
+        buffer = bytearray()
+        self.assertIn(b"ZeroDivisionError", read_response(sock, buffer))
+        self.assertTrue(read_response(sock, buffer).startswith(b"HTTP/1.1 200 OK"))
+
+    def test_coroutine_mocks_do_not_block_other_connections(self):
+        async def slow(request):
+            await asyncio.sleep(0.3)
+            return MockResponse(202, "late")
+
+        async def failing(request):
+            raise KeyError("gone")
+
+        self.mockman.add_mock("/slow", slow)
+        self.mockman.add_mock("/failing", failing)
+        slow_sock, fast_sock = self.connect(), self.connect()
+        slow_sock.sendall(b"GET /slow HTTP/1.1\r\n\r\nGET /failing HTTP/1.1\r\n\r\n")
+        fast_sock.sendall(b"GET /users HTTP/1.1\r\n\r\n")
+        fast_sock.settimeout(0.2)
+        self.assertTrue(read_response(fast_sock, bytearray()).startswith(b"HTTP/1.1 200 OK"))
+        buffer = bytearray()
+        self.assertTrue(read_response(slow_sock, buffer).endswith(b"\r\n\r\nlate"))
+        self.assertIn(b"KeyError", read_response(slow_sock, buffer))
+
+    def test_remove_mock(self):
+        self.mockman.remove_data("users/1")
+        self.assertNotIn("users/1", self.mockman.get_data())
+        self.assertEqual(self.mockman.handle(MockRequest("GET", "/users/1")).body["message"],
+                         "Mock GET request received")
+
+
+class TestServe(unittest.TestCase):
+
+    def test_serve_on_running_loop(self):
+        mockman = MockMan(host="127.0.0.1", port=0, mock={"/ping": "pong"})
+
+        async def scenario():
+            server = mockman.server()
+            await server.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /ping HTTP/1.1\r\n\r\n")
+            head = await reader.readuntil(b"\r\n\r\n")
+            body = await reader.readexactly(4)
+            writer.close()
+            await server.close()
+            return head, body
+
+        head, body = asyncio.run(scenario())
+        self.assertIn(b"text/plain", head)
+        self.assertEqual(body, b"pong")
+
+
+@unittest.skipUnless(hasattr(socket, "SO_REUSEPORT"), "SO_REUSEPORT is not supported")
+class TestMockCluster(unittest.TestCase):
+
+    def test_workers_share_the_port_and_count_requests(self):
+        mockman = MockMan(host="127.0.0.1", port=0, workers=3, mock={"/ping": "pong"})
+        with mockman.start() as cluster:
+            self.assertIsInstance(cluster, MockCluster)
+            for _ in range(30):
+                with socket.create_connection(("127.0.0.1", cluster.port)) as sock:
+                    sock.sendall(b"GET /ping HTTP/1.1\r\nConnection: close\r\n\r\n")
+                    self.assertTrue(read_response(sock, bytearray()).endswith(b"pong"))
+            self.assertEqual(cluster.requests, 30)
+            self.assertEqual(len(cluster.worker_requests()), 3)
+            self.assertGreater(sum(count > 0 for count in cluster.worker_requests()), 1)
+        self.assertFalse(cluster.running)
+        self.assertEqual(cluster.requests, 30)
+
+    def test_busy_port(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen()
+            cluster = MockMan(host="127.0.0.1", port=sock.getsockname()[1], workers=2).cluster()
+            with self.assertRaises(OSError):
+                cluster.start_background()
+            self.assertFalse(cluster.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from getman.manager.queue import QueueManager
+
+
+class TestQueueManager(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = QueueManager()
+
+    def test_queue_is_per_instance(self):
+        self.queue.enqueue("first")
+        self.assertTrue(QueueManager().is_queue_empty())
+        self.assertEqual(self.queue.size_queue(), 1)
+
+    def test_dequeue_is_fifo(self):
+        for item in ("a", "b", "c"):
+            self.queue.enqueue(item)
+        self.assertEqual(self.queue.get_queues(), ["c", "b", "a"])
+        self.assertEqual([self.queue.dequeue() for _ in range(3)], ["a", "b", "c"])
+
+    def test_dequeue_empty_queue_raises_index_error(self):
+        with self.assertRaises(IndexError):
+            self.queue.dequeue()
+
+    def test_priority_items_jump_ahead(self):
+        self.queue.enqueue("plain")
+        self.queue.enqueue("low", priority=5)
+        self.queue.enqueue("urgent", priority=0)
+        self.queue.enqueue("urgent-2", priority=0)
+
+        self.assertEqual(self.queue.size_queue(), 4)
+        self.assertEqual(self.queue.get_queues(), ["plain", "low", "urgent-2", "urgent"])
+        self.assertEqual(self.queue.dequeue_with_index(), (2, "urgent"))
+        self.assertEqual([self.queue.dequeue() for _ in range(3)], ["urgent-2", "low", "plain"])
+
+    def test_clear_queue_restarts_index(self):
+        self.queue.enqueue("a")
+        self.queue.enqueue("b", priority=1)
+        self.queue.clear_queue()
+        self.assertTrue(self.queue.is_queue_empty())
+        self.queue.enqueue("c")
+        self.assertEqual(self.queue.get_queue_entries(), [(0, "c")])
+
+
+if __name__ == '__main__':
+    unittest.main()
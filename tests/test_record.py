@@ -0,0 +1,117 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from getman import Struct
+from getman.client import GetMan
+from getman.constant import HttpMethod
+from getman.models import Record, record_type
+
+ITEMS = [
+    {"id": 1, "name": "first", "price": {"amount": 1.5}, "tags": [{"name": "a"}], "class": "x"},
+    {"id": 2, "price": {"amount": 3.0, "currency": "EUR"}, "tags": [], "2fa": True},
+]
+
+
+class ItemsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        payload = json.dumps(ITEMS).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRecordType(unittest.TestCase):
+
+    def setUp(self):
+        self.item = record_type("shop/items", ITEMS)
+
+    def test_type_is_slot_based(self):
+        self.assertEqual(self.item.__name__, "ShopItems")
+        self.assertTrue(issubclass(self.item, Record))
+        self.assertEqual(self.item.__slots__,
+                         ("id", "name", "price", "tags", "class_", "_2fa"))
+        record = self.item.from_dict(ITEMS[0])
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_attribute_and_item_access(self):
+        first, second = self.item.from_list(ITEMS)
+        self.assertEqual(first.name, "first")
+        self.assertEqual(first.price.amount, 1.5)
+        self.assertEqual(first.tags[0].name, "a")
+        self.assertEqual(first["class"], "x")
+        self.assertEqual(first.class_, "x")
+        self.assertIsNone(second.name)
+        self.assertIsNone(second.missing)
+        self.assertEqual(second.price.currency, "EUR")
+
+    def test_unknown_keys_are_kept(self):
+        record = self.item.from_dict({"id": 3, "price": {"amount": 1, "tax": 0.2}, "new": 1})
+        self.assertEqual(record.new, 1)
+        self.assertEqual(record["new"], 1)
+        self.assertEqual(record.price.tax, 0.2)
+
+    def test_to_json_round_trip(self):
+        for data in ITEMS:
+            record = self.item.from_dict(data)
+            self.assertEqual(json.loads(record.to_json()), data)
+            self.assertEqual(self.item.from_dict(json.loads(record.to_json())), record)
+
+    def test_schema(self):
+        user = record_type("user", {"id": int, "roles": [{"name": str}], "owner": {"id": int}})
+        record = user.from_dict({"id": 1, "roles": [{"name": "admin"}], "owner": None})
+        self.assertEqual(record.roles[0].name, "admin")
+        self.assertIsNone(record.owner)
+        with self.assertRaises(TypeError):
+            record_type("scalar", [1, 2])
+
+    def test_records_inside_struct(self):
+        struct = Struct(item=self.item.from_dict(ITEMS[0]))
+        self.assertEqual(json.loads(struct.to_json()), {"item": ITEMS[0]})
+
+
+class TestClientRecords(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ItemsHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}")
+
+    def test_record_type_is_cached_per_route(self):
+        first = self.client.to_records(self.client.request(HttpMethod.GET,
+                                                           self.client.routes("items")))
+        second = self.client.to_records(self.client.request(HttpMethod.GET,
+                                                            self.client.routes("items")))
+        self.assertEqual(len(first), 2)
+        self.assertIs(type(first[0]), type(second[0]))
+        self.assertIs(self.client.record_types.get("/items"), type(first[0]))
+
+    def test_route_template(self):
+        for user_id in (1, 2):
+            response = self.client.request(HttpMethod.GET, self.client.routes("users", str(user_id)))
+            self.client.to_records(response, route="users/{id}")
+        self.assertIsNotNone(self.client.record_types.get("users/{id}"))
+        self.assertIsNone(self.client.record_types.get("/users/1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.mock import MockMan, MockRequest, MockResponse
+from getman.recording import Recorder, Recording
+from getman.replay import compile_exchange, rebase, run_replay
+from getman.settings import Settings
+from getman.transport.response import build_response
+
+
+def response(method: str, url: str, body: bytes, request_body=None, status=200):
+    """
+    Build a response as a transport would, with its prepared request.
+    """
+    request = requests.Request(method, url, data=request_body,
+                               headers={"X-Trace": "1"}).prepare()
+    return build_response(request, status, "OK", [("Content-Type", "text/plain")], body, 0.01)
+
+
+class TestRecording(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "traffic.gmr")
+
+    def test_round_trip_and_compression(self):
+        large = b"abc" * 10_000
+        with Recorder(self.path) as recorder:
+            recorder.append(response("GET", "http://api/users?page=2", b"[]"))
+            recorder.append(response("POST", "http://api/users", large, request_body=large,
+                                     status=201))
+        self.assertLess(os.path.getsize(self.path), 2000)
+        first, second = Recording(self.path)
+        self.assertEqual((first.method, first.url, first.status, first.body),
+                         ("GET", "http://api/users?page=2", 200, b"[]"))
+        self.assertIn(("X-Trace", "1"), first.request_headers)
+        self.assertEqual(first.headers, [("Content-Type", "text/plain")])
+        self.assertAlmostEqual(first.elapsed, 0.01)
+        self.assertLessEqual(first.time, second.time)
+        self.assertEqual((second.request_body, second.body, second.status), (large, large, 201))
+
+    def test_append_index_and_read(self):
+        with Recorder(self.path) as recorder:
+            recorder.append(response("GET", "http://api/a", b"a"))
+        with Recorder(self.path) as recorder:
+            recorder.append(response("GET", "http://api/b", b"b"))
+        recording = Recording(self.path)
+        self.addCleanup(recording.close)
+        index = list(recording.index())
+        self.assertEqual([(method, url) for _, method, url in index],
+                         [("GET", "http://api/a"), ("GET", "http://api/b")])
+        self.assertEqual(recording.read(index[1][0]).body, b"b")
+
+    def test_truncated_frame_is_ignored(self):
+        with Recorder(self.path) as recorder:
+            recorder.append(response("GET", "http://api/a", b"a"))
+            recorder.append(response("GET", "http://api/b", b"b" * 100))
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 10)
+        self.assertEqual([exchange.url for exchange in Recording(self.path)], ["http://api/a"])
+        self.assertEqual(len(list(Recording(self.path).index())), 1)
+
+    def test_not_a_recording(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a recording")
+        with self.assertRaises(ValueError):
+            Recorder(self.path)
+        with self.assertRaises(ValueError):
+            list(Recording(self.path))
+
+    def test_rebase(self):
+        self.assertEqual(rebase("http://api:80/v1/users?q=1", "https://staging/proxy/"),
+                         "https://staging/proxy/v1/users?q=1")
+        self.assertEqual(rebase("http://api/v1", None), "http://api/v1")
+        with Recorder(self.path) as recorder:
+            recorder.append(response("POST", "http://api/users", None, request_body=b"{}"))
+        compiled = compile_exchange(next(iter(Recording(self.path))), "http://other")
+        self.assertEqual((compiled.url, compiled.body), ("http://other/users", b"{}"))
+        self.assertIsNone(compiled.header("Content-Length"))
+
+    def test_replay_counts_unexpected_errors(self):
+        with Recorder(self.path) as recorder:
+            recorder.append(response("GET", "http://api/a", b"a"))
+            recorder.append(response("GET", "http://api/b", b"b"))
+
+        async def send(request):
+            if request.url.endswith("/a"):
+                raise RuntimeError("boom")
+            return response("GET", request.url, b"b")
+
+        threads = []
+
+        def exchanges():
+            for exchange in Recording(self.path):
+                threads.append(threading.current_thread())
+                yield exchange
+
+        report = asyncio.run(run_replay(send, exchanges(), speed=None))
+        self.assertNotIn(threading.main_thread(), threads)
+        self.assertEqual(report.statuses, {0: 1, 200: 1})
+        self.assertEqual((report.errors, report.mismatches), (1, 1))
+        with self.assertRaises(ValueError):
+            asyncio.run(run_replay(send, Recording(self.path), max_in_flight=0))
+
+
+class TestRecordAndReplay(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "traffic.gmr")
+        self.origin = MockMan(host="127.0.0.1", port=0, mock={
+            "GET /users": [{"id": 1}],
+            "POST /users": lambda request: MockResponse(201, request.json()),
+        })
+        self.origin_server = self.origin.start()
+        self.addCleanup(self.origin_server.stop_background)
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{self.origin_server.port}")
+        self.addCleanup(self.client.close_session)
+
+    def record(self):
+        with self.client.record(self.path) as recorder:
+            self.client.request(HttpMethod.GET, self.client.routes("users"))
+            time.sleep(0.2)
+            self.client.request(HttpMethod.POST, self.client.routes("users"), json={"n": 1})
+            self.client.request(HttpMethod.GET, self.client.routes("missing"))
+        self.assertEqual(recorder.count, 3)
+        self.assertIsNone(self.client.recorder)
+
+    def test_replay_against_another_server(self):
+        self.record()
+        target = MockMan(host="127.0.0.1", port=0, mock={"GET /users": "other"})
+
+        async def scenario(base_url):
+            try:
+                fastest = await self.client.replay(self.path, base_url, speed=None)
+                timed = await self.client.replay(self.path, base_url, speed=2)
+            finally:
+                await self.client.aclose()
+            return fastest, timed
+
+        with target.start() as server:
+            fastest, timed = asyncio.run(scenario(f"http://127.0.0.1:{server.port}"))
+            self.assertEqual(server.requests, 6)
+        self.assertEqual(fastest.total, 3)
+        self.assertEqual(fastest.statuses, {200: 3})
+        self.assertEqual(fastest.mismatches, 1)
+        self.assertLess(fastest.elapsed, 0.2)
+        self.assertGreaterEqual(timed.elapsed, 0.1)
+        self.assertLess(timed.elapsed, 0.2)
+
+    def test_async_requests_are_recorded_off_the_event_loop(self):
+        with patch('getman.client.Console'):
+            client = GetMan(base_url=self.client.base_url,
+                            settings=Settings(transport=Transport.ASYNCIO))
+        threads = []
+        append = Recorder.append
+
+        def spy(recorder, *args):
+            threads.append(threading.current_thread())
+            append(recorder, *args)
+
+        async def scenario():
+            try:
+                with client.record(self.path):
+                    await client.perform_request(HttpMethod.GET, client.routes("users"))
+            finally:
+                await client.aclose()
+
+        with patch.object(Recorder, "append", spy):
+            asyncio.run(scenario())
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertEqual([exchange.status for exchange in Recording(self.path)], [200])
+
+    def test_serve_recording_as_mocks(self):
+        self.record()
+        self.origin.add_mock("GET /users", [{"id": 2}])
+        with self.client.record(self.path):
+            self.client.request(HttpMethod.GET, self.client.routes("users"), params={"page": 2})
+
+        mockman = MockMan(port=0)
+        self.assertEqual(mockman.add_recording(self.path), 3)
+
+        def handle(method, path):
+            return asyncio.run(mockman.handle(MockRequest(method, path)))
+
+        bodies = [handle("GET", "/users").body for _ in range(3)]
+        self.assertEqual(bodies, [b'[{"id":1}]', b'[{"id":2}]', b'[{"id":1}]'])
+        created = handle("POST", "/users")
+        self.assertEqual((created.status, created.body), (201, b'{"n":1}'))
+        self.assertIn(("Content-Type", "application/json"), created.headers)
+        self.assertNotIn("Content-Length", dict(created.headers))
+        self.assertEqual(handle("GET", "/missing").status, 200)
+
+        with mockman.start() as server, patch('getman.client.Console'):
+            client = GetMan(base_url=f"http://127.0.0.1:{server.port}")
+            self.assertEqual(client.request(HttpMethod.GET, client.routes("users")).json(),
+                             [{"id": 2}])
+            client.close_session()
+
+
+if __name__ == '__main__':
+    unittest.main()
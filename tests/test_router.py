@@ -0,0 +1,86 @@
+import unittest
+
+from getman.mock import FaultProfile, MockMan, MockRequest, MockResponse, Router
+
+
+class TestRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.router = Router()
+        self.router.add("GET", "/v1/users/{id}/orders", "orders")
+        self.router.add("GET", "/v1/users/me/orders", "my orders")
+        self.router.add(None, "/v1/users/{user_id}", "user")
+        self.router.add("POST", "/v1/users/{name}/orders/{order}", "create")
+
+    def test_match_captures_params(self):
+        self.assertEqual(self.router.match("GET", "/v1/users/42/orders"), ("orders", {"id": "42"}))
+        self.assertEqual(self.router.match("DELETE", "/v1/users/a%20b/"),
+                         ("user", {"user_id": "a b"}))
+        self.assertEqual(self.router.match("POST", "/v1/users/x/orders/7"),
+                         ("create", {"name": "x", "order": "7"}))
+        self.assertIsNone(self.router.match("GET", "/v1/users/42/orders/7"))
+        self.assertIsNone(self.router.match("GET", "/v1/users//orders"))
+
+    def test_static_segments_and_methods_take_precedence(self):
+        self.assertEqual(self.router.match("GET", "/v1/users/me/orders"), ("my orders", {}))
+        self.assertEqual(self.router.match("POST", "/v1/users/me/orders/1"),
+                         ("create", {"name": "me", "order": "1"}))
+        self.router.remove("GET", "/v1/users/me/orders/")
+        self.assertEqual(self.router.match("GET", "/v1/users/me/orders"), ("orders", {"id": "me"}))
+        self.router.add("GET", "/v1/users/{id}", "get user")
+        self.assertEqual(self.router.match("GET", "/v1/users/1")[0], "get user")
+        self.assertEqual(self.router.match("PUT", "/v1/users/1")[0], "user")
+
+    def test_add_and_remove_in_place(self):
+        self.assertEqual(len(self.router), 4)
+        self.router.add("GET", "/v1/users/{other}/orders", "replaced")
+        self.assertEqual(len(self.router), 4)
+        self.assertEqual(self.router.match("GET", "/v1/users/1/orders"),
+                         ("replaced", {"other": "1"}))
+        self.assertTrue(self.router.remove("POST", "/v1/users/{name}/orders/{order}"))
+        self.assertFalse(self.router.remove("POST", "/v1/users/{name}/orders/{order}"))
+        self.assertEqual(len(self.router), 3)
+        self.assertEqual(sorted(route[1] for route in self.router),
+                         ["/v1/users/me/orders", "/v1/users/{}", "/v1/users/{}/orders"])
+        for method, pattern in (("GET", "/v1/users/{id}/orders"), ("GET", "/v1/users/me/orders"),
+                                (None, "/v1/users/{id}")):
+            self.assertTrue(self.router.remove(method, pattern))
+        self.assertFalse(self.router.root)
+
+    def test_root(self):
+        self.router.add("GET", "/", "root")
+        self.assertEqual(self.router.match("GET", "/"), ("root", {}))
+
+
+class TestMockManRoutes(unittest.TestCase):
+
+    def test_parameterized_mocks(self):
+        mockman = MockMan(port=0, mock={"GET /users/{id}": lambda request: request.params})
+        mockman.add_mock("/users/{id}/orders", [])
+        self.assertEqual(mockman.handle(MockRequest("GET", "/users/7?x=1")).body, {"id": "7"})
+        self.assertEqual(mockman.handle(MockRequest("HEAD", "/users/7/orders")).body, [])
+        mockman.remove_data("/users/{id}/orders")
+        response = mockman.handle(MockRequest("PUT", "/users/7/orders"))
+        self.assertEqual((response.status, response.body), (400, "Invalid request method"))
+
+    def test_head_mocks_take_precedence_over_get(self):
+        mockman = MockMan(port=0, mock={"GET /users": [], "HEAD /users": MockResponse(204)})
+        self.assertEqual(mockman.handle(MockRequest("HEAD", "/users")).status, 204)
+        self.assertEqual(mockman.handle(MockRequest("GET", "/users")).body, [])
+        self.assertEqual(mockman.handle(MockRequest("HEAD", "/orders")).body["message"],
+                         "Mock GET request received")
+
+    def test_faults_on_parameterized_routes(self):
+        mockman = MockMan(port=0, mock={"/users/{id}": "user", "/health": "ok"})
+        mockman.add_fault("GET /users/{id}", FaultProfile(error_rate=1))
+        mockman.add_fault("*", FaultProfile(error_rate=1, error_status=500))
+        self.assertEqual(mockman.handle(MockRequest("GET", "/users/1")).status, 503)
+        self.assertEqual(mockman.handle(MockRequest("GET", "/health")).status, 500)
+        mockman.remove_fault("*")
+        mockman.remove_fault("GET /users/{id}")
+        self.assertEqual(mockman.handle(MockRequest("GET", "/users/1")).body, "user")
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+import asyncio
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.mock import MockMan, MockResponse
+from getman.settings import Settings
+from getman.transport import (ServerSentEvent, aiter_bytes, aiter_ndjson,
+                              aiter_sse, iter_ndjson, iter_sse)
+from getman.transport.protocol import ContentDecoder
+from getman.transport.stream import LineDecoder
+
+RECORDS = b"".join(b'{"id": %d}\n' % index for index in range(100))
+EVENTS = (b": keep-alive\r\n\r\n"
+          b"event: update\r\nid: 7\r\ndata: first\r\ndata: second\r\n\r\n"
+          b"retry: 3000\ndata: {\"ok\": true}\n\n"
+          b"data: incomplete")
+
+
+class TestParsers(unittest.TestCase):
+
+    def test_lines_split_across_chunks(self):
+        decoder = LineDecoder()
+        self.assertEqual(decoder.feed(b"one\r"), [])
+        self.assertEqual(decoder.feed(b"\ntwo\rthr"), [b"one", b"two"])
+        self.assertEqual(decoder.feed(b"ee\n"), [b"three"])
+        self.assertEqual(decoder.flush(), [])
+
+    def test_long_lines_are_rejected(self):
+        decoder = LineDecoder(max_line_size=8)
+        with self.assertRaises(ValueError):
+            decoder.feed(b"x" * 9)
+
+    def test_ndjson_records_from_small_chunks(self):
+        chunks = (RECORDS[index:index + 7] for index in range(0, len(RECORDS), 7))
+        self.assertEqual([record["id"] for record in iter_ndjson(chunks)], list(range(100)))
+
+    def test_server_sent_events(self):
+        chunks = (EVENTS[index:index + 5] for index in range(0, len(EVENTS), 5))
+        events = list(iter_sse(chunks))
+        self.assertEqual(events, [
+            ServerSentEvent("first\nsecond", "update", "7"),
+            ServerSentEvent('{"ok": true}', "message", "7", 3000),
+        ])
+        self.assertEqual(events[1].json(), {"ok": True})
+
+    def test_incremental_gzip_decoding(self):
+        body = gzip.compress(RECORDS)
+        decoder = ContentDecoder([("Content-Encoding", "gzip")])
+        decoded = b"".join(decoder.decompress(body[index:index + 10])
+                           for index in range(0, len(body), 10)) + decoder.flush()
+        self.assertEqual(decoded, RECORDS)
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for index in range(0, len(RECORDS), 50):
+            chunk = RECORDS[index:index + 50]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBlockingStream(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StreamHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}")
+
+    def test_request_streams_ndjson(self):
+        response = self.client.request(HttpMethod.GET, self.client.routes("export"), stream=True)
+        self.assertEqual([record["id"] for record in iter_ndjson(response)], list(range(100)))
+
+    def test_report_does_not_read_streamed_body(self):
+        response = self.client.request(HttpMethod.GET, self.client.routes("export"), stream=True)
+        report = self.client.get_report(response)
+        self.assertIn("Response Body: streamed", report)
+        self.assertEqual(len(list(iter_ndjson(response))), 100)
+
+    def test_aiter_bytes_reads_blocking_stream_in_thread(self):
+        response = self.client.request(HttpMethod.GET, self.client.routes("export"), stream=True)
+
+        async def read():
+            return b"".join([chunk async for chunk in aiter_bytes(response)])
+
+        self.assertEqual(asyncio.run(read()), RECORDS)
+
+
+class TestAsyncStream(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{port}",
+                                 settings=Settings(transport=Transport.ASYNCIO))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                path = line.decode().split(" ")[1]
+                while await reader.readline() != b"\r\n":
+                    pass
+                body = EVENTS if path.startswith("/events") else gzip.compress(RECORDS)
+                encoding = b"" if path.startswith("/events") else b"Content-Encoding: gzip\r\n"
+                writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n" + encoding
+                             + b"\r\n")
+                for index in range(0, len(body), 16):
+                    chunk = body[index:index + 16]
+                    writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    await writer.drain()
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_streamed_ndjson_reuses_connection(self):
+        route = self.client.routes("export")
+        for _ in range(2):
+            response = await self.client.perform_request(HttpMethod.GET, route, stream=True)
+            records = [record async for record in aiter_ndjson(response)]
+            self.assertEqual(len(records), 100)
+            self.assertTrue(response.raw.closed)
+
+        stats = self.client.connection_stats()[self.client.base_url]
+        self.assertEqual(dict(stats), {"new": 1, "reused": 1})
+
+    async def test_streamed_server_sent_events(self):
+        response = await self.client.perform_request(HttpMethod.GET, self.client.routes("events"),
+                                                     stream=True)
+        events = [event async for event in aiter_sse(response)]
+        self.assertEqual([event.event for event in events], ["update", "message"])
+
+    async def test_closing_stream_early_discards_connection(self):
+        response = await self.client.perform_request(HttpMethod.GET, self.client.routes("export"),
+                                                     stream=True)
+        await response.raw.aclose()
+        self.assertTrue(response.raw.closed)
+        response = await self.client.perform_request(HttpMethod.GET, self.client.routes("export"))
+        self.assertEqual(response.content, RECORDS)
+        self.assertEqual(self.client.connection_stats()[self.client.base_url]["new"], 2)
+
+
+class TestStreamRetry(unittest.IsolatedAsyncioTestCase):
+
+    async def test_retried_streamed_response_releases_its_connection(self):
+        mockman = MockMan(host="127.0.0.1", port=0, mock={"/busy": MockResponse(503, "busy")})
+        with mockman.start() as server:
+            with patch('getman.client.Console'):
+                client = GetMan(base_url=f"http://127.0.0.1:{server.port}", settings=Settings(
+                    transport=Transport.ASYNCIO, retries=3, delay=0, pool_maxsize=1,
+                    pool_block=True))
+            try:
+                response = await asyncio.wait_for(
+                    client.async_request(HttpMethod.GET, client.routes("busy"), stream=True), 5)
+                self.assertEqual(response.status_code, 503)
+                self.assertEqual(server.requests, 3)
+                await response.raw.aclose()
+            finally:
+                await client.aclose()
+
+    def test_retried_blocking_stream_releases_its_connection(self):
+        mockman = MockMan(host="127.0.0.1", port=0, mock={"/busy": MockResponse(503, "busy")})
+        with mockman.start() as server:
+            with patch('getman.client.Console'):
+                client = GetMan(base_url=f"http://127.0.0.1:{server.port}", settings=Settings(
+                    retries=3, delay=0, timeout=5, pool_maxsize=1, pool_block=True))
+            response = client.request(HttpMethod.GET, client.routes("busy"), stream=True)
+            self.assertEqual((response.status_code, server.requests), (503, 3))
+            response.close()
+            client.close_session()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio
+import math
+import unittest
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod
+from getman.stress import ArrivalSchedule, run_stress
+
+
+class TestArrivalSchedule(unittest.TestCase):
+
+    def test_constant_rate_with_warmup(self):
+        schedule = ArrivalSchedule(rate=10, duration=1, warmup=0.5)
+        self.assertEqual(schedule.warmup_requests, 5)
+        self.assertAlmostEqual(schedule.offset(4), 0.4)
+        self.assertAlmostEqual(schedule.offset(5), 0.5)
+        self.assertAlmostEqual(schedule.offset(15), 1.5)
+
+    def test_ramping_rate(self):
+        schedule = ArrivalSchedule(rate=0, duration=10, ramp_to=20)
+        # 0 -> 20 req/s over 10 seconds sends 100 requests in total.
+        self.assertAlmostEqual(schedule.offset(100), 10.0)
+        self.assertAlmostEqual(schedule.offset(25), 5.0)
+
+    def test_ramp_down_stops(self):
+        schedule = ArrivalSchedule(rate=10, duration=1, ramp_to=0)
+        self.assertEqual(schedule.offset(6), math.inf)
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ArrivalSchedule(rate=0, duration=1)
+
+
+class TestStressTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{port}")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        while (line := await reader.readline()) and line != b"\r\n":
+            pass
+        await asyncio.sleep(0.05)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    async def test_open_loop_does_not_wait_for_responses(self):
+        report = await self.client.stress_test(HttpMethod.GET, rate=100, duration=0.2,
+                                               warmup=0.1)
+        self.assertEqual(report.total, 20)
+        self.assertEqual(report.error_rate, 0.0)
+        self.assertGreaterEqual(report.percentile(50), 0.05)
+        self.assertTrue(all(start >= 0.1 for start in report.intended))
+        self.assertIn("Requests: 20", report.summary())
+
+    async def test_unexpected_errors_are_counted(self):
+        async def send():
+            raise RuntimeError("boom")
+
+        report = await run_stress(send, ArrivalSchedule(rate=100, duration=0.05))
+        self.assertEqual(report.total, 5)
+        self.assertEqual(report.error_rate, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
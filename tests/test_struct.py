@@ -1,7 +1,7 @@
 from unittest import TestCase
 import json
 
-from getman import Struct
+from getman import LazyStruct, Struct
 
 
 class TestStruct(TestCase):
@@ -55,3 +55,43 @@ class TestStruct(TestCase):
         del self.simple_struct['new_attr']
         self.assertIsNone(self.simple_struct.new_attr)
 
+
+
+class TestLazyStruct(TestCase):
+    def setUp(self):
+        self.data = {
+            'name': 'John',
+            'address': {'street': '123 Main St', 'zip_code': '10001'},
+            'orders': [{'id': 1, 'lines': [{'sku': 'a'}]}, {'id': 2, 'lines': []}],
+        }
+        self.struct = Struct.lazy(self.data)
+
+    def test_nested_access_is_lazy(self):
+        self.assertIsInstance(self.struct, LazyStruct)
+        self.assertEqual(self.struct.name, 'John')
+        self.assertEqual(self.struct.address.street, '123 Main St')
+        self.assertEqual(self.struct['address']['zip_code'], '10001')
+        self.assertIsNone(self.struct.country)
+        self.assertIsNone(self.struct.address.city)
+
+    def test_lists_of_dicts(self):
+        self.assertEqual(len(self.struct.orders), 2)
+        self.assertEqual(self.struct.orders[0].lines[0].sku, 'a')
+        self.assertEqual([order.id for order in self.struct.orders], [1, 2])
+        self.assertEqual(self.struct.orders[-1:][0].id, 2)
+
+    def test_changes_are_written_to_the_data(self):
+        self.struct.address.city = 'New York'
+        self.struct['nickname'] = 'JD'
+        del self.struct.name
+        self.assertEqual(self.data['address']['city'], 'New York')
+        self.assertEqual(self.data['nickname'], 'JD')
+        self.assertNotIn('name', self.data)
+        self.assertIsNone(self.struct.name)
+        with self.assertRaises(AttributeError):
+            del self.struct.name
+
+    def test_to_json(self):
+        self.struct.copy = Struct.lazy({'a': 1})
+        self.assertEqual(json.loads(self.struct.to_json()), {**self.data, 'copy': {'a': 1}})
+        self.assertEqual(json.loads(self.struct.orders.to_json()), self.data['orders'])
@@ -0,0 +1,133 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.settings import Settings
+from getman.transport.aio import origin
+
+
+class TestAsyncTransport(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.connections = 0
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{port}",
+                                 settings=Settings(transport=Transport.ASYNCIO))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, path, _ = line.decode().split(" ")
+                length = 0
+                while (header := await reader.readline()) != b"\r\n":
+                    key, _, value = header.decode().partition(":")
+                    if key.lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length)
+                if path.startswith("/slow"):
+                    await asyncio.sleep(0.2)
+                if path.startswith("/redirect"):
+                    location = self.redirect_to + path.partition("?to=")[2]
+                    writer.write(b"HTTP/1.1 302 Found\r\nContent-Length: 0\r\n"
+                                 b"Set-Cookie: hop=1\r\n"
+                                 + f"Location: {location}\r\n\r\n".encode())
+                elif path.startswith("/chunked"):
+                    writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                 b"5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n")
+                else:
+                    payload = f'{{"method": "{method}", "body": "{body.decode()}"}}'.encode()
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                                 b"Set-Cookie: visited=yes\r\n"
+                                 + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_queued_requests_overlap(self):
+        route = self.client.routes("slow")
+        for _ in range(20):
+            await self.client.perform_request(HttpMethod.GET, route, queue=True)
+
+        start = time.perf_counter()
+        results = await self.client.execute_queue()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all(response.status_code == 200 for response in results))
+        self.assertLess(elapsed, 1.0)
+
+    async def test_keep_alive_reuses_connection(self):
+        route = self.client.routes("items")
+        for _ in range(5):
+            response = await self.client.perform_request(HttpMethod.GET, route)
+            self.assertEqual(response.json()["method"], "GET")
+        self.assertEqual(self.connections, 1)
+        self.assertEqual(self.client.histogram.total, 5)
+        stats = self.client.connection_stats()[self.client.base_url]
+        self.assertEqual(dict(stats), {"new": 1, "reused": 4})
+
+    async def test_post_body_and_cookies(self):
+        response = await self.client.perform_request(
+            HttpMethod.POST, self.client.routes("items"), data={"key": "value"}
+        )
+        self.assertEqual(response.json()["body"], "key=value")
+        self.assertEqual(self.client.get_cookie("visited"), "yes")
+
+    async def test_chunked_response(self):
+        response = await self.client.perform_request(HttpMethod.GET, self.client.routes("chunked"))
+        self.assertEqual(response.text, "hello world")
+
+    async def test_cross_origin_redirect_drops_credentials(self):
+        received = []
+
+        async def capture(reader, writer):
+            received.append((await reader.readuntil(b"\r\n\r\n")).decode().lower())
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        other = await asyncio.start_server(capture, "127.0.0.1", 0)
+        self.addAsyncCleanup(other.wait_closed)
+        self.addCleanup(other.close)
+        self.client.session.cookies.set("session", "secret", domain="127.0.0.1")
+        headers = {"Authorization": "Bearer secret", "Cookie": "manual=1"}
+
+        self.redirect_to = f"http://localhost:{other.sockets[0].getsockname()[1]}"
+        response = await self.client.perform_request(
+            HttpMethod.GET, self.client.routes("redirect") + "?to=/landing", headers=headers)
+        self.assertEqual((response.status_code, len(response.history)), (200, 1))
+        self.assertNotIn("authorization", received[0])
+        self.assertNotIn("cookie", received[0])
+
+        self.redirect_to = self.client.base_url
+        response = await self.client.perform_request(
+            HttpMethod.GET, self.client.routes("redirect") + "?to=/items", headers=headers)
+        request = response.request
+        self.assertEqual(request.headers["Authorization"], "Bearer secret")
+        self.assertIn("session=secret", request.headers["Cookie"])
+        self.assertIn("hop=1", request.headers["Cookie"])
+
+        self.assertEqual(origin("http://127.0.0.1/a"), origin("HTTP://127.0.0.1:80/b"))
+        self.assertNotEqual(origin("http://127.0.0.1/a"), origin("https://127.0.0.1/a"))
+
+    async def test_invalid_method_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            await self.client.perform_request("INVALID_METHOD", self.client.routes("items"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from getman.client import GetMan
+from getman.constant import HttpMethod, Transport
+from getman.settings import Settings
+from getman.transport import FileBody, MultipartBody
+from getman.transport.upload import is_replayable
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 17)
+
+
+def summary(body: bytes, chunked: bool) -> bytes:
+    return json.dumps({
+        "length": len(body),
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "chunked": chunked,
+    }).encode()
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        chunked = self.headers.get("Transfer-Encoding") == "chunked"
+        if chunked:
+            body = b""
+            while size := int(self.rfile.readline(), 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.bodies.append((self.headers.get("Content-Type"), body))
+        payload = summary(body, chunked)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_PUT = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBlockingUpload(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), UploadHandler)
+        cls.server.bodies = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as file:
+            file.write(CONTENT)
+        cls.path = Path(file.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.path.unlink()
+
+    @patch('getman.client.Console')
+    def setUp(self, _):
+        self.client = GetMan(base_url=f"http://127.0.0.1:{self.server.server_port}")
+
+    def test_path_is_sent_with_content_length(self):
+        response = self.client.request(HttpMethod.POST, self.client.routes("upload"),
+                                       data=self.path)
+        self.assertEqual(response.json(), json.loads(summary(CONTENT, False)))
+
+    def test_file_body_slices(self):
+        body = FileBody(self.path, offset=10, count=1000, chunk_size=64)
+        self.assertEqual(len(body), 1000)
+        self.assertEqual(b"".join(bytes(chunk) for chunk in body), CONTENT[10:1010])
+        response = self.client.request(HttpMethod.PUT, self.client.routes("upload"), data=body)
+        self.assertEqual(response.json()["sha256"], hashlib.sha256(CONTENT[10:1010]).hexdigest())
+
+    def test_generator_is_sent_chunked(self):
+        chunks = (CONTENT[index:index + 4096] for index in range(0, 65536, 4096))
+        response = self.client.request(HttpMethod.POST, self.client.routes("upload"), data=chunks)
+        self.assertEqual(response.json(), json.loads(summary(CONTENT[:65536], True)))
+
+    def test_streamed_multipart_form(self):
+        form = MultipartBody({"name": "build", "artifact": FileBody(self.path)})
+        response = self.client.request(HttpMethod.POST, self.client.routes("upload"), data=form)
+        self.assertEqual(response.json()["length"], len(form))
+
+        content_type, body = self.server.bodies[-1]
+        message = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+        parts = {part.get_param("name", header="content-disposition"): part
+                 for part in message.get_payload()}
+        self.assertEqual(parts["name"].get_payload(decode=True), b"build")
+        self.assertEqual(parts["artifact"].get_filename(), self.path.name)
+        self.assertEqual(parts["artifact"].get_payload(decode=True), CONTENT)
+
+    def test_async_iterable_requires_asyncio_transport(self):
+        async def chunks():
+            yield b"data"
+
+        with self.assertRaises(TypeError):
+            self.client.post(self.client.base_url, data=chunks())
+
+    def test_is_replayable(self):
+        self.assertTrue(is_replayable(b"data"))
+        self.assertTrue(is_replayable({"a": "b"}))
+        self.assertTrue(is_replayable(FileBody(self.path)))
+        self.assertFalse(is_replayable(iter([b"data"])))
+        with open(self.path, "rb") as file:
+            self.assertFalse(is_replayable(file))
+
+
+class TestAsyncUpload(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(CONTENT)
+        self.path = Path(file.name)
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        with patch('getman.client.Console'):
+            self.client = GetMan(base_url=f"http://127.0.0.1:{port}",
+                                 settings=Settings(transport=Transport.ASYNCIO))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+        self.path.unlink()
+
+    async def handle(self, reader, writer):
+        try:
+            while await reader.readline():
+                headers = {}
+                while (header := await reader.readline()) != b"\r\n":
+                    key, _, value = header.decode().partition(":")
+                    headers[key.lower()] = value.strip()
+                chunked = headers.get("transfer-encoding") == "chunked"
+                if chunked:
+                    body = b""
+                    while size := int(await reader.readline(), 16):
+                        body += await reader.readexactly(size)
+                        await reader.readline()
+                    await reader.readline()
+                else:
+                    body = await reader.readexactly(int(headers.get("content-length", 0)))
+                payload = summary(body, chunked)
+                writer.write(b"HTTP/1.1 200 OK\r\n"
+                             + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_file_is_sent_with_sendfile(self):
+        route = self.client.routes("upload")
+        for _ in range(2):
+            response = await self.client.perform_request(HttpMethod.POST, route, data=self.path)
+            self.assertEqual(response.json(), json.loads(summary(CONTENT, False)))
+        self.assertEqual(self.client.connection_stats()[self.client.base_url]["reused"], 1)
+
+    async def test_async_generator_is_sent_chunked(self):
+        async def chunks():
+            for index in range(0, 65536, 4096):
+                await asyncio.sleep(0)
+                yield CONTENT[index:index + 4096]
+
+        response = await self.client.perform_request(HttpMethod.PUT, self.client.routes("upload"),
+                                                     data=chunks())
+        self.assertEqual(response.json(), json.loads(summary(CONTENT[:65536], True)))
+
+    async def test_multipart_with_file_part(self):
+        form = MultipartBody({"artifact": ("build.bin", self.path, "application/octet-stream")})
+        response = await self.client.perform_request(HttpMethod.POST, self.client.routes("upload"),
+                                                     data=form)
+        self.assertEqual(response.json()["length"], len(form))
+        self.assertEqual(response.json()["sha256"], hashlib.sha256(b"".join(bytes(chunk) for chunk in form)).hexdigest())
+
+
+if __name__ == '__main__':
+    unittest.main()